@@ -0,0 +1,193 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List
+
+from dacite import from_dict
+
+from main import (
+    Board,
+    Bot,
+    Position,
+    decode,
+    decode_board,
+    direction_towards,
+    distance_fields,
+    find_best_diamond,
+    get_next_move,
+)
+from synthetic import make_board_json
+
+# Suite microbenchmark untuk jalur panas keputusan dan decode. Melaporkan latensi p50/p99
+# dan alokasi memori per panggilan, lalu membandingkannya dengan file baseline agar
+# kenaikan biaya per tick terlihat sebelum deploy.
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+
+# Parameter board sintetis
+@dataclass
+class Scenario:
+    name: str
+    width: int
+    height: int
+    diamonds: int
+    bots: int
+    teleports: int
+
+SCENARIOS = {
+    "small": Scenario("small", 15, 15, 20, 5, 2),
+    "medium": Scenario("medium", 50, 50, 200, 20, 4),
+    "large": Scenario("large", 100, 100, 1000, 50, 8),
+}
+
+# Hasil satu benchmark
+@dataclass
+class Result:
+    p50_us: float
+    p99_us: float
+    alloc_kib: float
+
+# Satu kasus benchmark: setup() dipanggil di luar pengukuran, run(state) yang diukur
+@dataclass
+class Case:
+    name: str
+    setup: Callable[[], object]
+    run: Callable[[object], object]
+
+# Fungsi untuk membuat daftar kasus benchmark untuk satu skenario
+def make_cases(scenario: Scenario) -> List[Case]:
+    raw = make_board_json(
+        scenario.width, scenario.height,
+        diamonds=scenario.diamonds, bots=scenario.bots, teleports=scenario.teleports, seed=0,
+    )
+    me = Bot(name="bot0", email="bot0@bench.local", id="bench")
+    rng = random.Random(0)
+
+    # Board baru untuk setiap panggilan, seperti board yang diterima tiap tick
+    fresh_board = lambda: decode_board(raw)
+
+    def best_diamond_state():
+        board = fresh_board()
+        my_bot = board.get_bot(me)
+        return board, my_bot, distance_fields(board)
+
+    def run_best_diamond(state):
+        board, my_bot, fields = state
+        return find_best_diamond(
+            board, my_bot.position, my_bot.properties.diamonds, my_bot.properties.inventory_size,
+            board.index.teleport_positions, prefer_closest=True, my_name=me.name, fields=fields,
+        )
+
+    def direction_state():
+        board = fresh_board()
+        start = Position(y=rng.randrange(scenario.height), x=rng.randrange(scenario.width))
+        goal = Position(y=rng.randrange(scenario.height), x=rng.randrange(scenario.width))
+        return start, goal, board.index.teleport_positions, distance_fields(board)
+
+    return [
+        Case("get_next_move", fresh_board, lambda board: get_next_move(board, me)),
+        Case("find_best_diamond", best_diamond_state, run_best_diamond),
+        Case("direction_towards", direction_state, lambda state: direction_towards(*state)),
+        Case("decode", lambda: raw, decode),
+        Case("from_dict(Board)", lambda: decode(raw), lambda data: from_dict(Board, data)),
+        Case("decode_board", lambda: raw, decode_board),
+    ]
+
+# Ukur satu kasus: latensi per panggilan lalu alokasi per panggilan (tracemalloc terpisah
+# agar overhead-nya tidak ikut di latensi). Beberapa panggilan pertama hanya pemanasan
+# (cache distance field, import lazy) dan tidak ikut diukur.
+def measure(case: Case, repeat: int) -> Result:
+    random.seed(0)
+    for _ in range(min(20, max(1, repeat // 10))):
+        case.run(case.setup())
+    samples = []
+    for _ in range(repeat):
+        state = case.setup()
+        start = time.perf_counter_ns()
+        case.run(state)
+        samples.append(time.perf_counter_ns() - start)
+    samples.sort()
+
+    alloc_runs = max(1, min(repeat, 20))
+    total = 0
+    tracemalloc.start()
+    for _ in range(alloc_runs):
+        state = case.setup()
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        case.run(state)
+        total += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    return Result(
+        p50_us=samples[len(samples) // 2] / 1000,
+        p99_us=samples[min(len(samples) - 1, int(len(samples) * 0.99))] / 1000,
+        alloc_kib=total / alloc_runs / 1024,
+    )
+
+# Bandingkan dengan baseline, kembalikan daftar kasus yang melambat melebihi toleransi.
+# Kenaikan juga harus lebih dari 'floor_us' mikrodetik: kasus kecil (puluhan us) mudah
+# naik >25% hanya karena noise scheduler atau GC.
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float,
+            floor_us: float = 0.0) -> List[str]:
+    regressions = []
+    for key, result in results.items():
+        old = baseline.get(key)
+        if not old:
+            continue
+        limit = max(old["p50_us"] * (1 + tolerance), old["p50_us"] + floor_us)
+        if result["p50_us"] > limit:
+            regressions.append(key)
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Microbenchmark Complexity bot")
+    parser.add_argument("--scenarios", default="small,medium,large")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--baseline", default=BASELINE_PATH)            # File baseline pembanding
+    parser.add_argument("--save-baseline", action="store_true")         # Simpan hasil sebagai baseline baru
+    parser.add_argument("--tolerance", type=float, default=0.25)        # Batas kenaikan p50 (25%)
+    parser.add_argument("--floor-us", type=float, default=25.0)         # Kenaikan p50 minimum (us) yang dihitung regresi
+    parser.add_argument("--retries", type=int, default=3)               # Ukur ulang kasus yang terlihat melambat
+    args = parser.parse_args()
+
+    baseline = {}
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {}
+    cases = {}
+    print("{:<28} {:>12} {:>12} {:>12} {:>10}".format("kasus", "p50 (us)", "p99 (us)", "alloc (KiB)", "vs base"))
+    for name in args.scenarios.split(","):
+        for case in make_cases(SCENARIOS[name]):
+            key = "{}/{}".format(name, case.name)
+            cases[key] = case
+            result = asdict(measure(case, args.repeat))
+            results[key] = result
+            old = baseline.get(key)
+            delta = "{:+.0%}".format(result["p50_us"] / old["p50_us"] - 1) if old else "-"
+            print("{:<28} {p50_us:>12.1f} {p99_us:>12.1f} {alloc_kib:>12.1f} {:>10}".format(key, delta, **result))
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"[INFO] Baseline disimpan ke {args.baseline}")
+    elif baseline:
+        # Ukur ulang kasus yang terlihat melambat untuk menyaring noise, ambil p50 terbaik
+        for _ in range(args.retries):
+            for key in compare(results, baseline, args.tolerance, args.floor_us):
+                retry = asdict(measure(cases[key], args.repeat))
+                if retry["p50_us"] < results[key]["p50_us"]:
+                    results[key] = retry
+        regressions = compare(results, baseline, args.tolerance, args.floor_us)
+        if regressions:
+            print(f"[REGRESI] p50 naik lebih dari {args.tolerance:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print("[INFO] Tidak ada regresi dibanding baseline.")
@@ -0,0 +1,29 @@
+import argparse
+
+from main import Api
+from mock_server import start_in_thread
+
+# Benchmark round-trip time Api: session dengan keep-alive vs koneksi baru per request.
+# Dijalankan terhadap mock_server lokal sehingga tidak butuh server Etimo.
+
+# Fungsi untuk menjalankan sejumlah move dan mengembalikan statistik RTT
+def run(url: str, keep_alive: bool, moves: int, tag: str) -> dict:
+    api = Api(url, keep_alive=keep_alive)
+    bot = api.bots_register(tag, tag + "@bench.local", "123456", "bench")
+    api.bots_join(bot.id, 1)
+    for i in range(moves):
+        api.bots_move(bot.id, "EAST" if i % 2 == 0 else "WEST")
+    api.close()
+    return api.rtt_stats()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark RTT Api")
+    parser.add_argument("--moves", type=int, default=500)
+    args = parser.parse_args()
+
+    server, url = start_in_thread()
+    for keep_alive in (False, True):
+        label = "keep-alive" if keep_alive else "tanpa pool"
+        stats = run(url, keep_alive, args.moves, "bench_{}".format(int(keep_alive)))
+        print("{:<12} n={count} mean={mean_ms:.3f}ms p50={p50_ms:.3f}ms p99={p99_ms:.3f}ms".format(label, **stats))
+    server.shutdown()
@@ -0,0 +1,36 @@
+import argparse
+import random
+import time
+
+from main import Bot, decode_board, get_next_move
+from synthetic import make_board_json
+
+# Benchmark skala keputusan get_next_move pada board sintetis yang besar.
+# Setiap iterasi memakai objek Board baru (seperti tiap tick), jadi waktu membangun
+# indeks board ikut terhitung.
+
+SIZES = [
+    # (lebar, tinggi, diamond, bot)
+    (15, 15, 20, 5),
+    (50, 50, 200, 20),
+    (100, 100, 1000, 50),
+    (200, 200, 4000, 200),
+]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark skala BoardIndex")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print("{:>10} {:>8} {:>6} {:>14}".format("board", "diamond", "bot", "keputusan (ms)"))
+    for width, height, diamonds, bots in SIZES:
+        raw = make_board_json(width, height, diamonds=diamonds, bots=bots, teleports=4)
+        boards = [decode_board(raw) for _ in range(args.repeat)]
+        me = Bot(name="bot0", email="bot0@bench.local", id="bench")
+
+        random.seed(0)
+        start = time.perf_counter()
+        for board in boards:
+            get_next_move(board, me)
+        elapsed = (time.perf_counter() - start) / args.repeat * 1000
+        print("{:>10} {:>8} {:>6} {:>14.3f}".format("{}x{}".format(width, height), diamonds, bots, elapsed))
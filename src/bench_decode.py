@@ -0,0 +1,34 @@
+import argparse
+import time
+
+from dacite import from_dict
+
+from main import Board, decode, decode_board
+from synthetic import make_board_json
+
+# Benchmark parsing board: decode() + dacite.from_dict() vs decoder hasil compile_decoder().
+# Setiap ukuran juga dicek bahwa kedua jalur menghasilkan objek Board yang sama persis.
+
+# Fungsi untuk mengukur rata-rata waktu (ms) satu kali parsing
+def time_per_call(func, data, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(data)
+    return (time.perf_counter() - start) / repeat * 1000
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark decoder board")
+    parser.add_argument("--sizes", default="100,300,1000")  # Jumlah diamond di board
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print("{:>8} {:>12} {:>12} {:>8}".format("objek", "lama (ms)", "baru (ms)", "speedup"))
+    for size in [int(s) for s in args.sizes.split(",")]:
+        raw = make_board_json(width=40, height=40, diamonds=size, bots=size // 20 + 2, teleports=4)
+
+        old = lambda data: from_dict(Board, decode(data))
+        assert old(raw) == decode_board(raw), "Hasil decoder berbeda"
+
+        old_ms = time_per_call(old, raw, args.repeat)
+        new_ms = time_per_call(decode_board, raw, args.repeat)
+        print("{:>8} {:>12.3f} {:>12.3f} {:>7.1f}x".format(len(raw["gameObjects"]), old_ms, new_ms, old_ms / new_ms))
@@ -0,0 +1,96 @@
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from main import Base, Bot, Position, decode_board, direction_towards, distance_fields, get_next_move, random_move
+from synthetic import make_board_json
+
+# Alokasi per keputusan: cek penghalang dengan set Position (perilaku lama, membuat Position
+# baru untuk setiap cek) vs GridMask (sel y * width + x di bytearray, tanpa objek baru).
+# Juga membandingkan ukuran Position dengan __slots__ vs dataclass biasa.
+
+# Dataclass Position versi lama (dengan __dict__) untuk perbandingan ukuran
+@dataclass(frozen=True)
+class DictPosition:
+    y: int
+    x: int
+
+# Hitung jumlah Position/Base yang dibuat selama blok berjalan
+@contextmanager
+def count_positions():
+    counter = [0]
+    originals = {cls: cls.__init__ for cls in (Position, Base)}
+
+    def wrap(init):
+        def counted(self, *args, **kwargs):
+            counter[0] += 1
+            init(self, *args, **kwargs)
+        return counted
+
+    for cls, init in originals.items():
+        cls.__init__ = wrap(init)
+    try:
+        yield counter
+    finally:
+        for cls, init in originals.items():
+            cls.__init__ = init
+
+# Ukur satu fungsi keputusan pada banyak posisi awal: (us/panggilan, Position/panggilan, KiB puncak/panggilan)
+def measure(func, starts):
+    with count_positions() as counter:
+        for start in starts:
+            func(start)
+    created = counter[0] / len(starts)
+
+    begin = time.perf_counter()
+    for start in starts:
+        func(start)
+    per_call = (time.perf_counter() - begin) / len(starts) * 1e6
+
+    tracemalloc.start()
+    peak = 0
+    for start in starts[:200]:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        func(start)
+        peak += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    return per_call, created, peak / min(len(starts), 200) / 1024
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark GridMask vs set Position")
+    parser.add_argument("--samples", type=int, default=2000)
+    args = parser.parse_args()
+
+    print("[INFO] ukuran Position: slots={} byte, dataclass biasa={} byte (+ __dict__ {} byte)".format(
+        sys.getsizeof(Position(y=1, x=2)), sys.getsizeof(DictPosition(y=1, x=2)),
+        sys.getsizeof(DictPosition(y=1, x=2).__dict__),
+    ))
+    print("{:>10} {:<22} {:>12} {:>14} {:>12}".format("board", "kasus", "us/panggil", "Position/pgl", "KiB/pgl"))
+    for width, diamonds, bots, teleports in [(15, 20, 5, 8), (50, 200, 20, 40)]:
+        raw = make_board_json(width, width, diamonds=diamonds, bots=bots, teleports=teleports, seed=0)
+        board = decode_board(raw)
+        fields = distance_fields(board)
+        me = Bot(name="bot0", email="", id="")
+        rng = random.Random(0)
+        starts = [Position(y=rng.randrange(width), x=rng.randrange(width)) for _ in range(args.samples)]
+        goals = [Position(y=rng.randrange(width), x=rng.randrange(width)) for _ in range(args.samples)]
+        pairs = list(zip(starts, goals))
+        as_set, as_mask = board.index.teleport_positions, fields.blocked
+
+        cases = [
+            ("random_move/set", lambda pos: random_move(pos, as_set), starts),
+            ("random_move/mask", lambda pos: random_move(pos, as_mask), starts),
+            ("greedy_towards/set", lambda pair: direction_towards(pair[0], pair[1], as_set), pairs),
+            ("greedy_towards/mask", lambda pair: direction_towards(pair[0], pair[1], as_mask), pairs),
+            ("get_next_move", lambda _: get_next_move(board, me), starts),
+        ]
+        for name, func, inputs in cases:
+            random.seed(0)
+            per_call, created, kib = measure(func, inputs)
+            print("{:>10} {:<22} {:>12.2f} {:>14.2f} {:>12.2f}".format(
+                "{0}x{0}".format(width), name, per_call, created, kib))
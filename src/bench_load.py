@@ -0,0 +1,223 @@
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from dataclasses import dataclass
+from typing import Iterable, List
+
+from bench_multi_bot import start_server
+from botlog import ERROR, logger
+from metrics import BUCKETS_MS, Histogram, MetricsRegistry
+from multi_bot import BotConfig, RunnerConfig, run_bots
+
+# Load test klien terhadap server tiruan (mock_server.py) tanpa backend Etimo asli.
+# N bot dijalankan bersamaan, lalu dilaporkan langkah per detik (dihitung oleh server),
+# latensi ekor request (histogram fase http di sisi bot) dan CPU per bot. Dua runner:
+#   async   : semua bot dalam satu event loop (multi_bot.run_bots) di proses ini
+#   process : satu proses main.py per bot (seperti run-bots.sh)
+# Pengukuran dimulai setelah --warmup detik agar login dan join tidak ikut terhitung.
+
+# Hasil satu percobaan (selama jendela pengukuran)
+@dataclass
+class LoadResult:
+    bots: int
+    moves: int
+    seconds: float
+    http: Histogram  # Latensi semua request dari sisi bot
+    cpu_seconds: float  # Total CPU yang dipakai semua bot
+
+    @property
+    def moves_per_sec(self) -> float:
+        return self.moves / self.seconds if self.seconds else 0.0
+
+    # Persentase satu core yang dipakai per bot
+    @property
+    def cpu_per_bot(self) -> float:
+        return self.cpu_seconds / self.seconds / self.bots if self.seconds and self.bots else 0.0
+
+    @property
+    def cpu_ms_per_move(self) -> float:
+        return self.cpu_seconds * 1000 / self.moves if self.moves else 0.0
+
+# Statistik server tiruan: jumlah request dan langkah per bot
+def server_stats(url: str) -> dict:
+    with urllib.request.urlopen(url + "/mock/stats") as response:
+        return json.load(response)["data"]
+
+def total_moves(stats: dict) -> int:
+    return sum(stats["moves"].values())
+
+# Gabungkan beberapa histogram menjadi satu salinan baru
+def merge(hists: Iterable[Histogram]) -> Histogram:
+    merged = Histogram()
+    for hist in hists:
+        merged.counts = [a + b for a, b in zip(merged.counts, hist.counts)]
+        merged.count += hist.count
+        merged.total += hist.total
+        merged.max = max(merged.max, hist.max)
+    return merged
+
+# Histogram selama jendela pengukuran (akhir dikurangi awal). Nilai max tidak bisa
+# dikurangi, jadi max dari akhir dipakai sebagai batas atas.
+def subtract(end: Histogram, start: Histogram) -> Histogram:
+    diff = Histogram()
+    diff.counts = [a - b for a, b in zip(end.counts, start.counts)]
+    diff.count = end.count - start.count
+    diff.total = end.total - start.total
+    diff.max = end.max
+    return diff
+
+# Persentil (ms) dengan interpolasi linear di dalam bucket (seperti histogram_quantile
+# Prometheus). Histogram.quantile hanya mengembalikan batas atas bucket, terlalu kasar
+# untuk membandingkan latensi ekor.
+def quantile(hist: Histogram, q: float) -> float:
+    if not hist.count:
+        return 0.0
+    rank = q * hist.count
+    seen = 0
+    lower = 0.0
+    for bound, count in zip(BUCKETS_MS, hist.counts):
+        if count and seen + count >= rank:
+            return lower + (bound - lower) * (rank - seen) / count
+        seen += count
+        lower = bound
+    return BUCKETS_MS[-1]
+
+# Runner async: semua bot dalam satu event loop, CPU diukur dari proses ini
+async def run_async(url: str, count: int, warmup: float, duration: float) -> LoadResult:
+    registry = MetricsRegistry()
+    bots = [BotConfig(email="load{}@bench.local".format(i), name="Load{}".format(i)) for i in range(count)]
+    config = RunnerConfig(url=url, pool_size=max(10, count), bots=bots)
+
+    def snapshot():
+        http = merge(m.phases["http"] for m in list(registry.bots.values()) if "http" in m.phases)
+        return http, time.process_time(), time.perf_counter()
+
+    runner = asyncio.create_task(run_bots(config, warmup + duration, registry))
+    await asyncio.sleep(warmup)
+    stats_start = await asyncio.to_thread(server_stats, url)
+    http_start, cpu_start, start = snapshot()
+    await asyncio.sleep(duration)
+    stats_end = await asyncio.to_thread(server_stats, url)
+    http_end, cpu_end, end = snapshot()
+    await runner
+    return LoadResult(count, total_moves(stats_end) - total_moves(stats_start), end - start,
+                      subtract(http_end, http_start), cpu_end - cpu_start)
+
+# CPU (user + system) sebuah proses dalam detik, dari /proc (Linux)
+def process_cpu(pid: int) -> float:
+    with open("/proc/{}/stat".format(pid)) as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+# Baca histogram satu fase dari metrics.prom yang diekspor main.py (kosong jika belum ada)
+def read_prom_histogram(path: str, phase: str = "http") -> Histogram:
+    hist = Histogram()
+    cumulative: List[int] = []
+    label = 'phase="{}"'.format(phase)
+    try:
+        with open(path) as f:
+            lines = [line for line in f if label in line]
+    except OSError:
+        return hist
+    for line in lines:
+        name, value = line.rsplit(" ", 1)
+        if "_bucket{" in name:
+            cumulative.append(int(value))
+        elif "_sum{" in name:
+            hist.total = float(value)
+    if len(cumulative) != len(hist.counts):
+        return hist
+    hist.counts = [c - p for c, p in zip(cumulative, [0] + cumulative[:-1])]
+    hist.count = cumulative[-1]
+    # Max tidak diekspor: pakai batas atas bucket tertinggi yang terisi
+    filled = [i for i, c in enumerate(hist.counts) if c]
+    if filled:
+        hist.max = BUCKETS_MS[min(filled[-1], len(BUCKETS_MS) - 1)] / 1000
+    return hist
+
+# Runner process: satu proses main.py per bot. Metrik diekspor tiap 0.2 detik ke folder per bot.
+def run_processes(url: str, count: int, warmup: float, duration: float) -> LoadResult:
+    with tempfile.TemporaryDirectory() as tmp:
+        procs = []
+        for i in range(count):
+            metrics_dir = os.path.join(tmp, str(i))
+            cmd = [sys.executable, "main.py", "--url", url, "--email", "load{}@bench.local".format(i),
+                   "--name", "Load{}".format(i), "--quiet", "--metrics-dir", metrics_dir,
+                   "--metrics-interval", "0.2"]
+            proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            procs.append((proc, os.path.join(metrics_dir, "metrics.prom")))
+
+        def snapshot():
+            http = merge(read_prom_histogram(path) for _, path in procs)
+            return http, sum(process_cpu(proc.pid) for proc, _ in procs), time.perf_counter()
+
+        try:
+            time.sleep(warmup)
+            stats_start = server_stats(url)
+            http_start, cpu_start, start = snapshot()
+            time.sleep(duration)
+            stats_end = server_stats(url)
+            http_end, cpu_end, end = snapshot()
+        finally:
+            for proc, _ in procs:
+                proc.send_signal(signal.SIGINT)
+            for proc, _ in procs:
+                try:
+                    proc.wait(10)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+    return LoadResult(count, total_moves(stats_end) - total_moves(stats_start), end - start,
+                      subtract(http_end, http_start), cpu_end - cpu_start)
+
+def run(runner: str, url: str, count: int, warmup: float, duration: float) -> LoadResult:
+    if runner == "async":
+        return asyncio.run(run_async(url, count, warmup, duration))
+    return run_processes(url, count, warmup, duration)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test klien terhadap server tiruan")
+    parser.add_argument("--runner", choices=["async", "process"], default="async")
+    parser.add_argument("--counts", default="1,10,25")          # Jumlah bot yang diuji
+    parser.add_argument("--duration", type=float, default=10.0) # Lama jendela pengukuran (detik)
+    parser.add_argument("--warmup", type=float, default=2.0)    # Login dan join, tidak diukur
+    parser.add_argument("--delay", type=int, default=100)       # minimumDelayBetweenMoves (ms)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--width", type=int, default=15)
+    parser.add_argument("--height", type=int, default=15)
+    parser.add_argument("--diamonds", type=int, default=10)
+    parser.add_argument("--board-bots", type=int, default=2)    # Bot latar di board (bukan klien)
+    parser.add_argument("--teleports", type=int, default=2)
+    parser.add_argument("--ticks", type=int, default=0)         # >0: state sintetis yang berubah tiap tick
+    parser.add_argument("--recording", default=None)            # Putar ulang state dari rekaman .cbr
+    args = parser.parse_args()
+    logger.configure(ERROR)  # Recover 404 saat login pertama dan sejenisnya tidak perlu dicetak
+
+    extra = ["--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+             "--width", str(args.width), "--height", str(args.height), "--diamonds", str(args.diamonds),
+             "--bots", str(args.board_bots), "--teleports", str(args.teleports), "--ticks", str(args.ticks)]
+    if args.recording:
+        extra += ["--recording", args.recording]
+
+    print("runner={}, delay={} ms, latensi server={} ms (+{} ms jitter)".format(
+        args.runner, args.delay, args.latency_ms, args.jitter_ms))
+    print("{:>5} {:>10} {:>8} {:>8} {:>8} {:>8} {:>9} {:>11}".format(
+        "bots", "moves/sec", "ideal", "p50 ms", "p90 ms", "p99 ms", "CPU/bot", "CPU ms/move"))
+    for count in [int(c) for c in args.counts.split(",")]:
+        proc, url = start_server(args.delay, extra)
+        try:
+            result = run(args.runner, url, count, args.warmup, args.duration)
+        finally:
+            proc.kill()
+            proc.wait()
+        print("{:>5} {:>10.1f} {:>8.1f} {:>8.2f} {:>8.2f} {:>8.2f} {:>9.1%} {:>11.3f}".format(
+            count, result.moves_per_sec, count * 1000 / args.delay, quantile(result.http, 0.5),
+            quantile(result.http, 0.9), quantile(result.http, 0.99), result.cpu_per_bot, result.cpu_ms_per_move))
@@ -0,0 +1,57 @@
+import argparse
+import asyncio
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Sequence
+
+from multi_bot import BotConfig, RunnerConfig, run_bots
+
+# Benchmark runner multi bot: jumlah langkah per detik seiring bertambahnya jumlah bot.
+# Mock server dijalankan di proses terpisah agar tidak berebut GIL dengan event loop bot.
+
+# Cari port TCP yang sedang kosong
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+# Jalankan mock server baru dan tunggu sampai siap menerima request.
+# 'extra' diteruskan ke mock_server.py (latensi, ukuran board, sumber state).
+def start_server(delay: int, extra: Sequence[str] = ()):
+    port = free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "mock_server.py", "--port", str(port), "--delay", str(delay), *extra],
+        stdout=subprocess.DEVNULL,
+    )
+    url = "http://127.0.0.1:{}/api".format(port)
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(url + "/boards").close()
+            return proc, url
+        except OSError:
+            time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError("Mock server tidak bisa dijalankan")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark runner multi bot")
+    parser.add_argument("--counts", default="1,5,10,25,50")      # Jumlah bot yang diuji
+    parser.add_argument("--duration", type=float, default=5.0)  # Lama tiap percobaan (detik)
+    parser.add_argument("--delay", type=int, default=100)       # minimumDelayBetweenMoves (ms)
+    args = parser.parse_args()
+
+    print("{:>5} {:>12} {:>12} {:>8}".format("bots", "moves/sec", "ideal", "efisiensi"))
+    for count in [int(c) for c in args.counts.split(",")]:
+        proc, url = start_server(args.delay)
+        try:
+            bots = [BotConfig(email="b{}@bench.local".format(i), name="B{}".format(i)) for i in range(count)]
+            config = RunnerConfig(url=url, pool_size=max(10, count), bots=bots)
+            stats = asyncio.run(run_bots(config, duration=args.duration))
+        finally:
+            proc.kill()
+            proc.wait()
+        ideal = count * 1000 / args.delay
+        print("{:>5} {:>12.1f} {:>12.1f} {:>8.0%}".format(count, stats.moves_per_sec, ideal, stats.moves_per_sec / ideal))
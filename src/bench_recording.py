@@ -0,0 +1,45 @@
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from recording import GameRecorder, GameRecording
+from synthetic import make_tick_sequence
+
+# Ukuran rekaman dan biaya tulis/baca per tick dibandingkan menyimpan JSON mentah.
+# Setiap tick juga dicek bahwa board hasil rekonstruksi sama persis dengan aslinya.
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark rekaman permainan")
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--keyframe-interval", type=int, default=256)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.cbr")
+    print("{:>10} {:>7} {:>12} {:>12} {:>10} {:>12} {:>12}".format(
+        "board", "objek", "JSON (KiB)", "rekam (KiB)", "rasio", "tulis (us)", "acak (ms)"))
+    for width, diamonds, bots in [(15, 20, 5), (50, 200, 20), (100, 1000, 50)]:
+        states = make_tick_sequence(args.ticks, width=width, height=width, diamonds=diamonds, bots=bots, teleports=4)
+        json_size = sum(len(json.dumps(raw)) for raw in states)
+
+        start = time.perf_counter()
+        with GameRecorder(path, args.keyframe_interval) as recorder:
+            for raw in states:
+                recorder.write(raw)
+        write_us = (time.perf_counter() - start) / len(states) * 1e6
+        size = os.path.getsize(path)
+
+        with GameRecording(path) as recording:
+            assert all(recording.raw(tick) == raw for tick, raw in enumerate(states)), "Rekonstruksi berbeda"
+            ticks = random.Random(0).sample(range(len(states)), min(50, len(states)))
+            start = time.perf_counter()
+            for tick in ticks:
+                recording.raw(tick)
+            random_ms = (time.perf_counter() - start) / len(ticks) * 1000
+
+        print("{:>10} {:>7} {:>12.0f} {:>12.1f} {:>9.0f}x {:>12.1f} {:>12.2f}".format(
+            "{0}x{0}".format(width), len(states[0]["gameObjects"]), json_size / 1024, size / 1024,
+            json_size / size, write_us, random_ms))
+    os.remove(path)
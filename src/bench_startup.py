@@ -0,0 +1,119 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+from mock_server import MockGame, MockHandler
+
+# Benchmark time-to-first-move main.py: dari proses dijalankan sampai langkah pertama diterima
+# server tiruan, untuk startup biasa (recover + list board) dan --fast-start dengan sesi
+# tersimpan. Server dijalankan di proses ini agar waktu langkah pertama bisa dicatat langsung;
+# latensi jaringan disimulasikan dengan jeda per request (--rtt-ms).
+
+# Koneksi yang diputus saat proses bot dihentikan bukan error
+class QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        pass
+
+# Server tiruan yang menghitung request dan mencatat waktu langkah pertama
+class StartupProbe:
+    def __init__(self, rtt_ms: float):
+        self.game = MockGame()
+        self.rtt = rtt_ms / 1000
+        self.requests = 0
+        self.first_move = threading.Event()
+        self.first_move_at = 0.0
+        probe = self
+
+        class Handler(MockHandler):
+            game = self.game
+
+            def do_GET(self):
+                probe._count()
+                return super().do_GET()
+
+            def do_POST(self):
+                probe._count()
+                if self.path.endswith("/move") and not probe.first_move.is_set():
+                    probe.first_move_at = time.perf_counter()
+                    probe.first_move.set()
+                return super().do_POST()
+
+        self.server = QuietServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        host, port = self.server.server_address[:2]
+        self.url = "http://{}:{}/api".format(host, port)
+
+    def _count(self):
+        if not self.first_move.is_set():
+            self.requests += 1
+        if self.rtt:
+            time.sleep(self.rtt)
+
+    def reset(self):
+        self.requests = 0
+        self.first_move.clear()
+
+# Jalankan main.py sampai langkah pertama, kembalikan (ms sampai langkah pertama, jumlah
+# request termasuk langkah pertama)
+def time_to_first_move(probe: StartupProbe, extra: list, timeout: float = 30.0):
+    probe.reset()
+    cmd = [sys.executable, "main.py", "--url", probe.url, "--email", "startup@bench.local",
+           "--name", "Startup", "--quiet"] + extra
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        if not probe.first_move.wait(timeout):
+            raise RuntimeError("main.py tidak mengirim langkah dalam {} detik".format(timeout))
+        return (probe.first_move_at - start) * 1000, probe.requests
+    finally:
+        proc.kill()
+        proc.wait()
+
+# Waktu impor modul (ms) di proses baru, dikurangi waktu start interpreter kosong
+def import_ms(module: str, runs: int) -> float:
+    def run(code):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        return (time.perf_counter() - start) * 1000
+    return statistics.median(run("import " + module) for _ in range(runs)) - \
+        statistics.median(run("pass") for _ in range(runs))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark time-to-first-move main.py")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--rtt-ms", type=float, default=20.0)  # Latensi simulasi per request
+    args = parser.parse_args()
+
+    print("[INFO] impor: main={:.0f} ms, requests={:.0f} ms, numpy={:.0f} ms".format(
+        import_ms("main", args.runs), import_ms("requests", args.runs), import_ms("numpy", args.runs)))
+
+    probe = StartupProbe(args.rtt_ms)
+    with tempfile.TemporaryDirectory() as tmp:
+        session_file = os.path.join(tmp, "session.json")
+        # Sekali jalan agar bot sudah terdaftar dan ada di board (kondisi restart di tengah permainan)
+        time_to_first_move(probe, [])
+
+        print("{:<28} {:>10} {:>10} {:>10}".format("mode", "p50 ms", "max ms", "request"))
+        for name, extra, warm in [
+            ("biasa", [], False),
+            ("fast-start (tanpa sesi)", ["--fast-start", "--session-file", session_file], False),
+            ("fast-start (sesi tersimpan)", ["--fast-start", "--session-file", session_file], True),
+        ]:
+            samples, counts = [], []
+            for _ in range(args.runs):
+                if not warm and os.path.exists(session_file):
+                    os.remove(session_file)
+                elapsed, count = time_to_first_move(probe, extra)
+                samples.append(elapsed)
+                counts.append(count)
+            print("{:<28} {:>10.1f} {:>10.1f} {:>10}".format(
+                name, statistics.median(samples), max(samples), max(counts)))
+    probe.server.shutdown()
@@ -0,0 +1,72 @@
+import argparse
+import gc
+import time
+import tracemalloc
+
+from main import BoardIndex, BoardStore, decode_board
+from synthetic import make_tick_sequence
+
+# Perbandingan waktu dan memori: decode board penuh tiap tick vs BoardStore inkremental.
+# Setiap tick juga dicek bahwa kedua jalur menghasilkan Board dan indeks yang sama.
+
+# Decode penuh + bangun indeks dari nol (perilaku tanpa store)
+def full_rebuild(states):
+    boards = []
+    for raw in states:
+        board = decode_board(raw)
+        board.index
+        boards.append(board)
+    return boards
+
+# Decode inkremental + indeks diteruskan lewat delta
+def incremental(states):
+    store = BoardStore()
+    boards = []
+    for raw in states:
+        board = store.update(raw)
+        board.index
+        boards.append(board)
+    return boards
+
+# Cek kesetaraan board dan indeks (urutan objek dalam satu sel tidak dianggap penting)
+def verify(states):
+    store = BoardStore()
+    for raw in states:
+        board = store.update(raw)
+        expected = decode_board(raw)
+        assert board == expected, "Board inkremental berbeda"
+        index, fresh = board.index, BoardIndex.build(expected.game_objects)
+        assert index.by_type == fresh.by_type and index.slots == fresh.slots
+        assert index.bots_by_id == fresh.bots_by_id and index.bots_by_name == fresh.bots_by_name
+        assert index.teleport_positions == fresh.teleport_positions
+        as_sets = lambda occ: {cell: sorted(o.id for o in objs) for cell, objs in occ.items()}
+        assert as_sets(index.occupancy) == as_sets(fresh.occupancy)
+
+# Waktu per tick (ms) dan memori (KiB) untuk menyimpan seluruh riwayat board
+def measure(func, states):
+    gc.collect()
+    start = time.perf_counter()
+    func(states)
+    per_tick = (time.perf_counter() - start) / len(states) * 1000
+
+    tracemalloc.start()
+    boards = func(states)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del boards
+    return per_tick, retained / 1024
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark BoardStore inkremental")
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args()
+
+    print("{:>10} {:>7} {:>12} {:>12} {:>14} {:>14}".format(
+        "board", "objek", "penuh (ms)", "inkr. (ms)", "penuh (KiB)", "inkr. (KiB)"))
+    for width, diamonds, bots in [(15, 20, 5), (50, 200, 20), (100, 1000, 50)]:
+        states = make_tick_sequence(args.ticks, width=width, height=width, diamonds=diamonds, bots=bots, teleports=4)
+        verify(states)
+        full_ms, full_kib = measure(full_rebuild, states)
+        inc_ms, inc_kib = measure(incremental, states)
+        print("{:>10} {:>7} {:>12.3f} {:>12.3f} {:>14.0f} {:>14.0f}".format(
+            "{0}x{0}".format(width), len(states[0]["gameObjects"]), full_ms, inc_ms, full_kib, inc_kib))
@@ -0,0 +1,155 @@
+import atexit
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from queue import SimpleQueue
+from typing import Optional, TextIO
+
+# Logging berlevel untuk bot. Pemanggil hanya menyimpan record mentah (waktu, level,
+# format, argumen) tanpa memformat string; pemformatan dan penulisan ke stdout dilakukan
+# thread writer di background secara batch. Record terbaru selalu disimpan di ring buffer
+# (termasuk yang di bawah level aktif) dan dicetak saat terjadi error.
+
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR}
+
+_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARN", ERROR: "ERROR"}
+
+# Kode warna per level dan kode reset; colorama baru diimpor saat warna pertama kali dipakai
+_COLORS: Optional[tuple] = None
+
+def _colors() -> tuple:
+    global _COLORS
+    if _COLORS is None:
+        from colorama import Fore, Style
+        _COLORS = {DEBUG: Style.DIM, INFO: "", WARNING: Fore.YELLOW, ERROR: Fore.RED + Style.BRIGHT}, Style.RESET_ALL
+    return _COLORS
+
+# Penanda untuk menghentikan thread writer
+_STOP = object()
+
+# Logger dengan writer thread dan ring buffer event terakhir
+class BotLogger:
+    def __init__(self, level: int = INFO, stream: Optional[TextIO] = None, ring_size: int = 512,
+                 color: Optional[bool] = None, batch: int = 256):
+        self.level = level
+        self.stream = stream
+        self.color = color
+        self.batch = batch
+        self.ring = deque(maxlen=ring_size) if ring_size else None
+        self._queue = SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    # Ubah pengaturan logger (dipanggil dari argumen terminal)
+    def configure(self, level: Optional[int] = None, ring_size: Optional[int] = None,
+                  stream: Optional[TextIO] = None, color: Optional[bool] = None):
+        if level is not None:
+            self.level = level
+        if ring_size is not None:
+            self.ring = deque(self.ring or (), maxlen=ring_size) if ring_size else None
+        if stream is not None:
+            self.stream = stream
+        if color is not None:
+            self.color = color
+
+    # Simpan record ke ring buffer dan antrekan ke writer jika levelnya aktif
+    def log(self, level: int, msg: str, *args, exc_info=None):
+        record = (time.time(), level, msg, args, exc_info)
+        if self.ring is not None:
+            self.ring.append(record)
+        if level >= self.level:
+            self._start()
+            self._queue.put(record)
+
+    def debug(self, msg: str, *args):
+        self.log(DEBUG, msg, *args)
+
+    def info(self, msg: str, *args):
+        self.log(INFO, msg, *args)
+
+    def warning(self, msg: str, *args):
+        self.log(WARNING, msg, *args)
+
+    def error(self, msg: str, *args):
+        self.log(ERROR, msg, *args)
+
+    # Catat exception yang sedang ditangani beserta traceback-nya, lalu cetak ring buffer
+    def exception(self, msg: str, *args):
+        self.log(ERROR, msg, *args, exc_info=sys.exc_info())
+        self.dump()
+
+    # Cetak isi ring buffer (event terakhir, termasuk yang di bawah level aktif)
+    def dump(self):
+        if not self.ring:
+            return
+        self._start()
+        self._queue.put(list(self.ring))
+
+    # Hentikan writer setelah semua record terkirim
+    def close(self):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def _start(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="botlog-writer", daemon=True)
+                self._thread.start()
+
+    # Format satu record menjadi satu baris (ditambah traceback jika ada, kecuali saat dump ring buffer)
+    def _format(self, record, color: bool, with_traceback: bool = True) -> str:
+        created, level, msg, args, exc_info = record
+        try:
+            text = msg % args if args else msg
+        except (TypeError, ValueError):
+            text = "{} {}".format(msg, args)
+        stamp = time.strftime("%H:%M:%S", time.localtime(created)) + ".{:03d}".format(int(created * 1000) % 1000)
+        name = "{:<5}".format(_NAMES.get(level, level))
+        if color:
+            colors, reset = _colors()
+            if colors.get(level):
+                name = colors[level] + name + reset
+        line = "{} {} {}".format(stamp, name, text)
+        if exc_info and with_traceback:
+            line += "\n" + "".join(traceback.format_exception(*exc_info)).rstrip()
+        return line
+
+    # Thread writer: ambil record secara batch, format, tulis sekaligus lalu flush
+    def _run(self):
+        while True:
+            items = [self._queue.get()]
+            while len(items) < self.batch and not self._queue.empty():
+                items.append(self._queue.get())
+
+            stream = self.stream or sys.stdout
+            color = stream.isatty() if self.color is None else self.color
+            lines = []
+            stop = False
+            for item in items:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, list):
+                    lines.append("---- {} event terakhir ----".format(len(item)))
+                    lines.extend(self._format(record, color, False) for record in item)
+                    lines.append("---- akhir event ----")
+                else:
+                    lines.append(self._format(item, color))
+            if lines:
+                stream.write("\n".join(lines) + "\n")
+                stream.flush()
+            if stop:
+                return
+
+# Logger bersama untuk satu proses
+logger = BotLogger()
+
+atexit.register(logger.close)
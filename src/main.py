@@ -1,14 +1,43 @@
 import json
+import math
 import time
 import random
 import argparse
 import re
-import requests
-from dataclasses import dataclass
-from typing import List, Optional, Tuple, Union
-from requests import Response
-from dacite import from_dict
-from colorama import Fore, Style
+from collections import OrderedDict, deque
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, AbstractSet, Any, Callable, Deque, Dict, Iterable, List, Set, Optional, Tuple, Union, get_args, get_origin, get_type_hints
+from botlog import LEVELS, WARNING, logger
+from memo import DecisionMemo
+from metrics import BotMetrics, MetricsRegistry
+from planner import RoutePlanner
+from recording import GameRecorder, recording_path
+from retry import DEFAULT_RETRY, CircuitBreaker, CircuitOpenError, RetryPolicy, RetryStats, TransientError
+from session import DEFAULT_SESSION_FILE, BotSession, forget_session, load_session, save_session
+from tracker import OpponentTracker
+
+# requests dan dacite baru diimpor saat Api dipakai (impor requests ~100 ms), sehingga
+# simulator, turnamen, dan benchmark yang hanya memakai strategi tidak ikut membayarnya
+if TYPE_CHECKING:
+    import requests
+    from requests import Response
+
+# NumPy opsional: hanya dipakai untuk scoring diamond tervektorisasi, dan baru diimpor saat
+# board cukup ramai untuk membutuhkannya (board kecil tidak pernah membayar impornya)
+np = None
+_numpy_loaded = False
+
+def _load_numpy():
+    global np, _numpy_loaded
+    if not _numpy_loaded:
+        _numpy_loaded = True
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            np = None
+    return np
 
 @dataclass
 class Bot:
@@ -16,14 +45,25 @@ class Bot:
     email: str
     id: str
 
+# __slots__: tanpa __dict__ per objek, lebih kecil dan lebih cepat dibuat. Ditulis manual
+# (bukan dataclass(slots=True), yang baru ada di Python 3.10) agar tetap jalan di versi lama.
+# Dataclass frozen tanpa __dict__ perlu __getstate__/__setstate__ sendiri untuk pickle/copy.
 @dataclass(frozen=True)
 class Position:
+    __slots__ = ("y", "x")
     y: int
     x: int
 
+    def __getstate__(self):
+        return self.y, self.x
+
+    def __setstate__(self, state):
+        object.__setattr__(self, "y", state[0])
+        object.__setattr__(self, "x", state[1])
+
 @dataclass(frozen=True)
 class Base(Position):
-    pass
+    __slots__ = ()
 
 @dataclass
 class Properties:
@@ -60,6 +100,212 @@ class Feature:
     name: str
     config: Optional[Config] = None
 
+# Perubahan board dari satu tick ke tick berikutnya, objek dicocokkan berdasarkan id
+@dataclass
+class BoardDelta:
+    added: List[GameObject] = field(default_factory=list)
+    removed: List[GameObject] = field(default_factory=list)
+    moved: List[Tuple[GameObject, GameObject]] = field(default_factory=list)  # (lama, baru)
+    changed: List[Tuple[GameObject, GameObject]] = field(default_factory=list)  # properti berubah
+    full: bool = False  # True jika board dibangun ulang dari nol (tick pertama / board lain)
+
+    # Objek yang tetap ada tetapi berpindah dan/atau propertinya berubah (lama, baru)
+    @property
+    def updated(self) -> List[Tuple[GameObject, GameObject]]:
+        seen = {new.id for _, new in self.moved}
+        return self.moved + [pair for pair in self.changed if pair[1].id not in seen]
+
+    # Tipe objek yang jumlahnya berubah (ada yang ditambah atau dihapus)
+    @property
+    def resized_types(self) -> Set[str]:
+        return {obj.type for obj in self.added} | {obj.type for obj in self.removed}
+
+    def touches(self, obj_type: str) -> bool:
+        return obj_type in self.resized_types or any(new.type == obj_type for _, new in self.updated)
+
+    @property
+    def teleports_changed(self) -> bool:
+        return self.full or self.touches("TeleportGameObject")
+
+    def __bool__(self) -> bool:
+        return bool(self.full or self.added or self.removed or self.moved or self.changed)
+
+# Indeks objek board yang dibangun sekali per board state yang diterima,
+# agar strategi tidak perlu memindai game_objects berulang kali
+@dataclass
+class BoardIndex:
+    by_type: Dict[str, List[GameObject]] = field(default_factory=dict)
+    bots_by_name: Dict[str, GameObject] = field(default_factory=dict)
+    bots_by_id: Dict[int, GameObject] = field(default_factory=dict)
+    occupancy: Dict[Tuple[int, int], List[GameObject]] = field(default_factory=dict)  # (x, y) -> objek
+    teleport_positions: Set[Position] = field(default_factory=set)
+    slots: Dict[int, int] = field(default_factory=dict)  # id -> posisi objek di list by_type
+
+    @classmethod
+    def build(cls, game_objects: Optional[List[GameObject]]) -> "BoardIndex":
+        index = cls()
+        for obj in game_objects or []:
+            same_type = index.by_type.setdefault(obj.type, [])
+            index.slots[obj.id] = len(same_type)
+            same_type.append(obj)
+            if obj.position:
+                index.occupancy.setdefault((obj.position.x, obj.position.y), []).append(obj)
+            if obj.type == "BotGameObject":
+                index.bots_by_id[obj.id] = obj
+                if obj.properties and obj.properties.name is not None:
+                    index.bots_by_name.setdefault(obj.properties.name, obj)
+            elif obj.type == "TeleportGameObject" and obj.position:
+                index.teleport_positions.add(obj.position)
+        return index
+
+    # Indeks baru untuk tick berikutnya dari indeks ini + delta, tanpa memindai ulang semua objek.
+    # Hanya tipe yang jumlah objeknya berubah yang list-nya disusun ulang dari game_objects.
+    def apply(self, delta: BoardDelta, game_objects: List[GameObject]) -> "BoardIndex":
+        if delta.full:
+            return BoardIndex.build(game_objects)
+        if not delta:
+            index = BoardIndex(
+                self.by_type, self.bots_by_name, self.bots_by_id,
+                self.occupancy, self.teleport_positions, self.slots,
+            )
+            for name in ("diamond_arrays", "state_hash"):
+                if name in self.__dict__:
+                    index.__dict__[name] = self.__dict__[name]
+            return index
+
+        updated = delta.updated
+        resized = delta.resized_types
+        index = BoardIndex(
+            by_type={t: objs for t, objs in self.by_type.items() if t not in resized},
+            bots_by_name=dict(self.bots_by_name),
+            bots_by_id=dict(self.bots_by_id),
+            occupancy=dict(self.occupancy),
+            teleport_positions=self.teleport_positions,
+            slots=dict(self.slots),
+        )
+
+        # Tipe yang bertambah/berkurang: susun ulang list-nya agar urutannya sama dengan game_objects
+        for obj in delta.removed:
+            index.slots.pop(obj.id, None)
+        for obj_type in resized:
+            same_type = [obj for obj in game_objects if obj.type == obj_type]
+            if same_type:
+                index.by_type[obj_type] = same_type
+            else:
+                index.by_type.pop(obj_type, None)
+            for i, obj in enumerate(same_type):
+                index.slots[obj.id] = i
+
+        # Tipe lain: salin list sekali lalu ganti objek yang berubah di slot-nya
+        copied = set()
+        for _, new in updated:
+            if new.type in resized:
+                continue
+            if new.type not in copied:
+                index.by_type[new.type] = list(index.by_type[new.type])
+                copied.add(new.type)
+            index.by_type[new.type][index.slots[new.id]] = new
+
+        # Peta sel dan bot: hapus versi lama, masukkan versi baru
+        for old in delta.removed + [old for old, _ in updated]:
+            index._unplace(old)
+        for new in delta.added + [new for _, new in updated]:
+            index._place(new)
+
+        if delta.teleports_changed:
+            index.teleport_positions = {
+                obj.position for obj in index.of_type("TeleportGameObject") if obj.position
+            }
+        if "diamond_arrays" in self.__dict__ and not delta.touches("DiamondGameObject"):
+            index.__dict__["diamond_arrays"] = self.diamond_arrays
+        # Hash state: keluarkan kontribusi versi lama, masukkan versi baru (XOR)
+        if "state_hash" in self.__dict__:
+            diamond_hash, bot_hash = self.state_hash
+            for obj in delta.removed + delta.added + [obj for pair in updated for obj in pair]:
+                d, b = _state_term(obj)
+                diamond_hash ^= d
+                bot_hash ^= b
+            index.__dict__["state_hash"] = (diamond_hash, bot_hash)
+        return index
+
+    def _place(self, obj: GameObject):
+        if obj.position:
+            cell = (obj.position.x, obj.position.y)
+            self.occupancy[cell] = self.occupancy.get(cell, []) + [obj]
+        if obj.type == "BotGameObject":
+            self.bots_by_id[obj.id] = obj
+            if obj.properties and obj.properties.name is not None:
+                self.bots_by_name.setdefault(obj.properties.name, obj)
+
+    def _unplace(self, obj: GameObject):
+        if obj.position:
+            cell = (obj.position.x, obj.position.y)
+            rest = [o for o in self.occupancy.get(cell, []) if o.id != obj.id]
+            if rest:
+                self.occupancy[cell] = rest
+            else:
+                self.occupancy.pop(cell, None)
+        if obj.type == "BotGameObject":
+            self.bots_by_id.pop(obj.id, None)
+            if obj.properties and self.bots_by_name.get(obj.properties.name) is obj:
+                del self.bots_by_name[obj.properties.name]
+
+    def of_type(self, obj_type: str) -> List[GameObject]:
+        return self.by_type.get(obj_type, [])
+
+    @property
+    def bots(self) -> List[GameObject]:
+        return self.of_type("BotGameObject")
+
+    @property
+    def diamonds(self) -> List[GameObject]:
+        return self.of_type("DiamondGameObject")
+
+    # Semua objek yang berada di sel (x, y)
+    def at(self, x: int, y: int) -> List[GameObject]:
+        return self.occupancy.get((x, y), [])
+
+    # Array koordinat dan poin diamond (x, y, poin) untuk scoring NumPy, dibuat sekali per board
+    @cached_property
+    def diamond_arrays(self):
+        diamonds = [
+            obj for obj in self.diamonds
+            if obj.position and obj.properties and obj.properties.points is not None
+        ]
+        count = len(diamonds)
+        xs = np.fromiter((d.position.x for d in diamonds), dtype=np.int64, count=count)
+        ys = np.fromiter((d.position.y for d in diamonds), dtype=np.int64, count=count)
+        points = np.fromiter((d.properties.points for d in diamonds), dtype=np.int64, count=count)
+        return diamonds, xs, ys, points
+
+    # Hash state keputusan (diamond + teleport, bot) untuk memo keputusan: XOR kontribusi
+    # setiap objek. Dihitung saat pertama kali diminta, lalu diteruskan secara inkremental
+    # lewat apply sehingga biayanya O(delta) per tick.
+    @cached_property
+    def state_hash(self) -> Tuple[int, int]:
+        diamond_hash = bot_hash = 0
+        for obj_type in ("DiamondGameObject", "TeleportGameObject", "BotGameObject"):
+            for obj in self.of_type(obj_type):
+                d, b = _state_term(obj)
+                diamond_hash ^= d
+                bot_hash ^= b
+        return diamond_hash, bot_hash
+
+# Kontribusi satu objek ke hash state (bagian diamond/teleport, bagian bot). Skor dan sisa
+# waktu bot tidak ikut karena tidak memengaruhi keputusan dan berubah setiap tick.
+def _state_term(obj: GameObject) -> Tuple[int, int]:
+    pos = obj.position
+    props = obj.properties
+    if pos is None:
+        return 0, 0
+    if obj.type == "DiamondGameObject":
+        return hash((obj.id, pos.x, pos.y, props.points if props else None)), 0
+    if obj.type == "TeleportGameObject":
+        return hash((obj.id, pos.x, pos.y, props.pair_id if props else None)), 0
+    if obj.type == "BotGameObject" and props:
+        return 0, hash((obj.id, pos.x, pos.y, props.name, props.diamonds, props.inventory_size, props.base))
+    return 0, 0
+
 @dataclass
 class Board:
     id: int
@@ -69,37 +315,39 @@ class Board:
     minimum_delay_between_moves: int
     game_objects: Optional[List[GameObject]]
 
+    # Indeks dibuat saat pertama kali diakses, lalu disimpan selama objek Board ini dipakai
+    @cached_property
+    def index(self) -> BoardIndex:
+        return BoardIndex.build(self.game_objects)
+
     @property
     def bots(self) -> List[GameObject]:
-        return [d for d in self.game_objects if d.type == "BotGameObject"]
+        return self.index.bots
 
     @property
     def diamonds(self) -> List[GameObject]:
-        return [d for d in self.game_objects if d.type == "DiamondGameObject"]
+        return self.index.diamonds
 
     def get_bot(self, bot: Bot) -> Optional[GameObject]:
-        for b in self.bots:
-            if b.properties.name == bot.name:
-                return b
-        return None
+        return self.index.bots_by_name.get(bot.name)
 
     def is_valid_move(
         self, current_position: Position, delta_x: int, delta_y: int
     ) -> bool:
         if not (-1 <= delta_x <= 1) or not (-1 <= delta_y <= 1):
-            print("[INVALID MOVE] Delta values must be between -1 and 1 inclusive.")
+            logger.warning("[INVALID MOVE] Delta values must be between -1 and 1 inclusive.")
             return False
 
         if delta_x == delta_y:
-            print("[INVALID MOVE] Delta_x and delta_y cannot be equal.")
+            logger.warning("[INVALID MOVE] Delta_x and delta_y cannot be equal.")
             return False
 
         if not (0 <= current_position.x + delta_x < self.width):
-            print("[INVALID MOVE] X-coordinate out of bounds.")
+            logger.warning("[INVALID MOVE] X-coordinate out of bounds.")
             return False
 
         if not (0 <= current_position.y + delta_y < self.height):
-            print("[INVALID MOVE] Y-coordinate out of bounds.")
+            logger.warning("[INVALID MOVE] Y-coordinate out of bounds.")
             return False
 
         return True
@@ -110,7 +358,8 @@ def _unpack(data):
         return data.items()
     return data
 
-# Fungsi _snake_case mengubah string CamelCase ke snake_case
+# Fungsi _snake_case mengubah string CamelCase ke snake_case (hasil di-cache per key)
+@lru_cache(maxsize=None)
 def _snake_case(value):
     first_underscore = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", value)
     return re.sub("([a-z0-9])([A-Z])", r"\1_\2", first_underscore).lower()
@@ -149,46 +398,335 @@ def decode(data):
         formatted.append(decode_keys(item))
     return formatted
 
+# Membuat konverter untuk satu tipe field (dataclass, Optional, List, atau tipe dasar)
+def _compile_type(tp) -> Optional[Callable[[Any], Any]]:
+    if is_dataclass(tp):
+        return compile_decoder(tp)
+
+    origin = get_origin(tp)
+    if origin is Union:
+        inner = [t for t in get_args(tp) if t is not type(None)]
+        convert = _compile_type(inner[0]) if len(inner) == 1 else None
+        if convert is None:
+            return None
+        return lambda value: None if value is None else convert(value)
+
+    if origin in (list, List):
+        convert = _compile_type(get_args(tp)[0]) if get_args(tp) else None
+        if convert is None:
+            return None
+        return lambda value: [convert(item) for item in value]
+
+    # Tipe dasar (int, str, ...) disimpan apa adanya
+    return None
+
+# Fungsi compile_decoder membuat decoder satu kali per dataclass. Decoder menerima dict
+# mentah dari server (key camelCase) dan langsung membangun objeknya dalam satu kali jalan,
+# menggantikan decode() + from_dict().
+@lru_cache(maxsize=None)
+def compile_decoder(cls) -> Callable[[dict], Any]:
+    hints = get_type_hints(cls)
+    converters = {}
+    missing_defaults = {}
+    for f in fields(cls):
+        if not f.init:
+            continue
+        converters[f.name] = _compile_type(hints[f.name])
+        # Seperti dacite, field Optional tanpa default bernilai None jika tidak ada di data
+        if f.default is MISSING and f.default_factory is MISSING and type(None) in get_args(hints[f.name]):
+            missing_defaults[f.name] = None
+
+    # Tabel key mentah -> (nama field, konverter), diisi saat key pertama kali ditemui
+    key_table = {}
+    unknown = (None, None)
+
+    def decode_object(data: dict):
+        kwargs = dict(missing_defaults)
+        for key, value in data.items():
+            entry = key_table.get(key)
+            if entry is None:
+                name = _snake_case(key)
+                entry = key_table[key] = (name, converters[name]) if name in converters else unknown
+            name, convert = entry
+            if name is None:
+                continue
+            kwargs[name] = value if convert is None else convert(value)
+        return cls(**kwargs)
+
+    return decode_object
+
+# Decoder Board yang dipakai untuk setiap response berisi board state
+decode_board = compile_decoder(Board)
+
+# Penyimpan board state inkremental. Objek dari response baru dicocokkan dengan tick
+# sebelumnya berdasarkan id: objek yang tidak berubah dipakai ulang (instance yang sama),
+# hanya objek yang baru/berubah yang di-decode. Delta per tick tersedia di 'delta',
+# dan indeks board diteruskan dari tick sebelumnya lewat BoardIndex.apply.
+class BoardStore:
+    def __init__(self):
+        self.board: Optional[Board] = None
+        self.delta: Optional[BoardDelta] = None
+        self._objects: Dict[int, Tuple[dict, Optional[dict], GameObject]] = {}  # id -> (posisi, properti mentah, objek)
+        self._header: Optional[tuple] = None
+        self._header_features: Optional[list] = None
+        self._features: Optional[List[Feature]] = None
+        self._decode_position = compile_decoder(Position)
+        self._decode_properties = compile_decoder(Properties)
+        self._decode_feature = compile_decoder(Feature)
+
+    # Terima board mentah (key camelCase) dan kembalikan Board untuk tick ini
+    def update(self, raw: dict) -> Board:
+        raw_features = raw.get("features") or []
+        header = (raw.get("id"), raw.get("width"), raw.get("height"))
+        full = header != self._header
+        if full:
+            self._objects = {}
+        if full or raw_features != self._header_features:
+            self._features = [self._decode_feature(f) for f in raw_features]
+        self._header = header
+        self._header_features = raw_features
+
+        delta = BoardDelta(full=full)
+        previous = self._objects
+        current = {}
+        game_objects = []
+        for item in raw.get("gameObjects") or []:
+            obj_id = item["id"]
+            raw_position = item["position"]
+            raw_properties = item.get("properties")
+            prev = previous.get(obj_id)
+
+            if prev is not None and prev[2].type == item["type"]:
+                prev_position, prev_properties, prev_obj = prev
+                same_position = prev_position == raw_position
+                same_properties = prev_properties == raw_properties
+                if same_position and same_properties:
+                    obj = prev_obj
+                else:
+                    obj = GameObject(
+                        obj_id,
+                        prev_obj.position if same_position else self._decode_position(raw_position),
+                        item["type"],
+                        prev_obj.properties if same_properties else self._decode_object_properties(raw_properties),
+                    )
+                    if not same_position:
+                        delta.moved.append((prev_obj, obj))
+                    if not same_properties:
+                        delta.changed.append((prev_obj, obj))
+            else:
+                obj = GameObject(
+                    obj_id, self._decode_position(raw_position), item["type"],
+                    self._decode_object_properties(raw_properties),
+                )
+                if prev is not None:
+                    delta.removed.append(prev[2])
+                if not full:
+                    delta.added.append(obj)
+
+            current[obj_id] = (raw_position, raw_properties, obj)
+            game_objects.append(obj)
+
+        if not full:
+            delta.removed.extend(entry[2] for obj_id, entry in previous.items() if obj_id not in current)
+
+        board = Board(
+            raw.get("id"), raw.get("width"), raw.get("height"), self._features,
+            raw.get("minimumDelayBetweenMoves"), game_objects if raw.get("gameObjects") is not None else None,
+        )
+
+        # Teruskan indeks dari tick sebelumnya jika sudah pernah dibangun
+        if self.board is not None and not full and "index" in self.board.__dict__:
+            board.__dict__["index"] = self.board.index.apply(delta, game_objects)
+
+        self._objects = current
+        self.board = board
+        self.delta = delta
+        return board
+
+    def _decode_object_properties(self, raw_properties: Optional[dict]) -> Optional[Properties]:
+        return None if raw_properties is None else self._decode_properties(raw_properties)
+
+# Header JSON dibuat sekali dan dipakai ulang oleh setiap request
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Endpoint /bots membawa kredensial: password di body request, token di body response
+# (register/recover) dan di path (/bots/{token}/...). Token di path disamarkan di log.
+def log_endpoint(endpoint: str) -> str:
+    parts = endpoint.split("/")
+    if len(parts) > 2 and parts[1] == "bots" and parts[2] != "recover":
+        parts[2] = "***"
+    return "/".join(parts)
+
+# Log request (level debug, body /bots tidak dicatat)
+def log_request(method: str, endpoint: str, body: dict):
+    if endpoint.startswith("/bots"):
+        logger.debug(">>> %s %s", method, log_endpoint(endpoint))
+    else:
+        logger.debug(">>> %s %s %s", method, endpoint, body)
+
+# Log response: 2xx dan 404 recover (bot belum terdaftar, alur normal) di level debug, status
+# lain di level warning. Body response /bots tidak pernah dicatat.
+def log_response(endpoint: str, status: int, body):
+    if 200 <= status < 300 or (status == 404 and endpoint == "/bots/recover"):
+        logger.debug("<<< %s %s", status, log_endpoint(endpoint))
+    elif endpoint.startswith("/bots"):
+        logger.warning("<<< %s %s", status, log_endpoint(endpoint))
+    else:
+        logger.warning("<<< %s %s %s", status, endpoint, body)
+
 # Kelas untuk abstraksi API
 @dataclass
 class Api:
     url: str  # Base URL dari server API
+    pool_size: int = 10  # Jumlah koneksi yang disimpan di pool per host
+    connect_timeout: Optional[float] = 3.05  # Batas waktu membuka koneksi (detik)
+    read_timeout: Optional[float] = 10.0  # Batas waktu menunggu response (detik)
+    keep_alive: bool = True  # False = perilaku lama, koneksi baru untuk setiap request
+    rtt_window: int = 1000  # Jumlah sampel RTT terakhir yang disimpan
+    store: Optional[BoardStore] = None  # Jika diisi, board state di-decode secara inkremental
+    metrics: Optional[BotMetrics] = None  # Jika diisi, waktu fase http/json/decode dicatat
+    recorder: Optional[GameRecorder] = None  # Jika diisi, setiap board state direkam ke file
+    move_timeout: Optional[float] = None  # Batas waktu response move (None = read_timeout)
+    retry: RetryPolicy = DEFAULT_RETRY  # Retry request idempoten (lihat retry.py)
+    breaker: Optional[CircuitBreaker] = None  # None = breaker baru dengan setelan default
+
+    def __post_init__(self):
+        self.session = self._make_session() if self.keep_alive else None
+        self.rtt_samples: Deque[float] = deque(maxlen=self.rtt_window)
+        self.last_rtt: Optional[float] = None
+        self.breaker = self.breaker or CircuitBreaker()
+        self.retry_stats = RetryStats()
+        self._rng = random.Random()
+
+    # Membuat session dengan connection pool agar koneksi TCP dipakai ulang (keep-alive)
+    def _make_session(self) -> "requests.Session":
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(JSON_HEADERS)
+        return session
+
+    # Menutup semua koneksi di pool (dan file rekaman jika ada)
+    def close(self):
+        if self.session is not None:
+            self.session.close()
+        if self.recorder is not None:
+            self.recorder.close()
+
+    # Ringkasan RTT (dalam milidetik) dari sampel yang tersimpan
+    def rtt_stats(self) -> dict:
+        samples = sorted(self.rtt_samples)
+        if not samples:
+            return {"count": 0}
+        return {
+            "count": len(samples),
+            "mean_ms": sum(samples) / len(samples) * 1000,
+            "p50_ms": samples[len(samples) // 2] * 1000,
+            "p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000,
+            "max_ms": samples[-1] * 1000,
+        }
+
+    # Decode board state dari response (inkremental lewat store jika tersedia)
+    def _board(self, raw: dict) -> Board:
+        if self.recorder is not None:
+            self.recorder.write(raw)
+        start = time.perf_counter() if self.metrics is not None else 0.0
+        board = self.store.update(raw) if self.store is not None else decode_board(raw)
+        if self.metrics is not None:
+            self.metrics.record("decode", time.perf_counter() - start)
+        return board
 
     # Menggabungkan base URL dengan endpoint
     def _get_url(self, endpoint: str) -> str:
         return "{}{}".format(self.url, endpoint)
 
-    # Fungsi generik untuk membuat request HTTP
-    def _req(self, endpoint: str, method: str, body: dict) -> Response:
-        # Log permintaan
-        print(
-            ">>> {} {} {}".format(
-                Style.BRIGHT + method.upper() + Style.RESET_ALL,
-                Fore.GREEN + endpoint + Style.RESET_ALL,
-                body,
-            )
-        )
-
-        # Ambil fungsi HTTP yang sesuai (get, post, dll)
-        func = getattr(requests, method)
-        headers = {"Content-Type": "application/json"}
-
-        # Kirim request ke server
-        res = func(self._get_url(endpoint), headers=headers, data=json.dumps(body))
-
-        # Log responsenya
-        if res.status_code == 200:
-            print("<<< {} OK".format(res.status_code))
-        else:
-            print("<<< {} {}".format(res.status_code, res.text))
-
-        return res
+    # Fungsi generik untuk membuat request HTTP. Gangguan sementara (exception koneksi/timeout,
+    # status 5xx) diulang dengan backoff jika request idempoten; jika tetap gagal, atau ditolak
+    # circuit breaker, TransientError dilempar. Status 4xx dikembalikan apa adanya.
+    def _req(self, endpoint: str, method: str, body: dict, idempotent: bool = True,
+             read_timeout: Optional[float] = None) -> "Response":
+        import requests
+
+        # Log permintaan (hanya record mentah, diformat oleh thread writer)
+        log_request(method, endpoint, body)
+
+        data = json.dumps(body).encode()
+        timeout = (self.connect_timeout, read_timeout or self.read_timeout)
+        stats = self.retry_stats
+        stats.requests += 1
+
+        attempts = self.retry.attempts if idempotent else 1
+        for attempt in range(attempts):
+            wait = self.breaker.allow(time.monotonic())
+            if wait:
+                stats.rejected += 1
+                raise CircuitOpenError(wait)
+
+            # Kirim request ke server dan ukur round-trip time-nya
+            trial = self.breaker.is_open  # Lolos saat breaker terbuka = request percobaan
+            start = time.perf_counter()
+            try:
+                if self.session is not None:
+                    res = self.session.request(method, self._get_url(endpoint), data=data, timeout=timeout)
+                else:
+                    # Ambil fungsi HTTP yang sesuai (get, post, dll)
+                    func = getattr(requests, method)
+                    res = func(self._get_url(endpoint), headers=JSON_HEADERS, data=data, timeout=timeout)
+                error = "status {}".format(res.status_code) if res.status_code >= 500 else None
+            except requests.RequestException as exc:
+                error = "{}: {}".format(type(exc).__name__, exc)
+            except BaseException:
+                # Error selain gangguan transport (KeyboardInterrupt dan sejenisnya): lepaskan
+                # slot percobaan breaker sebelum exception diteruskan
+                if trial:
+                    self.breaker.release()
+                raise
+            elapsed = time.perf_counter() - start
+
+            if error is None:
+                self.breaker.success()
+                self.last_rtt = elapsed
+                self.rtt_samples.append(elapsed)
+                if self.metrics is not None:
+                    self.metrics.record("http", elapsed)
+
+                # Log responsenya
+                log_response(endpoint, res.status_code, res.text)
+                return res
+
+            stats.lost_seconds += elapsed
+            if self.breaker.failure(time.monotonic()):
+                stats.breaker_opens += 1
+                logger.warning("Circuit breaker terbuka setelah %s kegagalan berturut-turut", self.breaker.failures)
+            # Breaker terbuka: tidak ada gunanya mencoba lagi sekarang
+            if attempt + 1 == attempts or self.breaker.is_open:
+                break
+
+            # Backoff eksponensial dengan jitter sebelum mencoba lagi
+            delay = self.retry.backoff(attempt, self._rng)
+            stats.retries += 1
+            stats.lost_seconds += delay
+            if self.metrics is not None:
+                self.metrics.count("retry")
+            logger.warning("<<< %s %s gagal (%s), coba lagi dalam %.0f ms", method, log_endpoint(endpoint), error,
+                           delay * 1000)
+            time.sleep(delay)
+
+        stats.failures += 1
+        if self.metrics is not None:
+            self.metrics.count("request_failed")
+        raise TransientError("{} {} gagal: {}".format(method, log_endpoint(endpoint), error))
 
     # Ambil informasi bot dari token
     def bots_get(self, bot_token: str) -> Optional[Bot]:
         response = self._req("/bots/{}".format(bot_token), "get", {})
         data, status = self._return_response_and_status(response)
         if status == 200:
+            from dacite import from_dict
             return from_dict(Bot, data)
         return None
 
@@ -198,24 +736,27 @@ class Api:
             "/bots",
             "post",
             {"email": email, "name": name, "password": password, "team": team},
+            idempotent=False,
         )
         resp, status = self._return_response_and_status(response)
         if status == 200:
+            from dacite import from_dict
             return from_dict(Bot, resp)
         return None
 
     # Mengambil list board yang tersedia
     def boards_list(self) -> Optional[List[Board]]:
         response = self._req("/boards", "get", {})
-        resp, status = self._return_response_and_status(response)
+        resp, status = self._return_response_and_status(response, raw=True)
         if status == 200:
-            return [from_dict(Board, board) for board in resp]
+            return [decode_board(board) for board in resp]
         return None
 
-    # Bot bergabung ke board tertentu
+    # Bot bergabung ke board tertentu. Tidak diulang: join yang sudah diterapkan server tapi
+    # response-nya hilang akan ditolak jika dikirim ulang, jadi pemanggil mengecek keanggotaan
     def bots_join(self, bot_token: str, board_id: int) -> bool:
         response = self._req(
-            f"/bots/{bot_token}/join", "post", {"preferredBoardId": board_id}
+            f"/bots/{bot_token}/join", "post", {"preferredBoardId": board_id}, idempotent=False
         )
         resp, status = self._return_response_and_status(response)
         return status == 200
@@ -223,21 +764,30 @@ class Api:
     # Mengambil informasi detail dari sebuah board
     def boards_get(self, board_id: str) -> Optional[Board]:
         response = self._req("/boards/{}".format(board_id), "get", {})
-        resp, status = self._return_response_and_status(response)
+        resp, status = self._return_response_and_status(response, raw=True)
         if status == 200:
-            return from_dict(Board, resp)
+            return self._board(resp)
         return None
 
     # Mengirim perintah gerakan ke server dan mendapatkan board state terbaru
     def bots_move(self, bot_token: str, direction: str) -> Optional[Board]:
-        response = self._req(
-            "/bots/{}/move".format(bot_token),
-            "post",
-            {"direction": direction},
-        )
-        resp, status = self._return_response_and_status(response)
+        # Move tidak idempoten: tidak diulang di sini, pemanggil mengambil ulang state lewat boards_get
+        try:
+            response = self._req(
+                "/bots/{}/move".format(bot_token),
+                "post",
+                {"direction": direction},
+                idempotent=False,
+                read_timeout=self.move_timeout,
+            )
+            resp, status = self._return_response_and_status(response, raw=True)
+        except TransientError:
+            self.retry_stats.lost_moves += 1
+            if self.metrics is not None:
+                self.metrics.count("lost_move")
+            raise
         if status == 200:
-            return from_dict(Board, resp)
+            return self._board(resp)
         return None
 
     # Recover bot berdasarkan email dan password (jika sudah terdaftar)
@@ -247,26 +797,266 @@ class Api:
                 "/bots/recover", "post", {"email": email, "password": password}
             )
             resp, status = self._return_response_and_status(response)
-            if status == 201:  
-                return resp["id"]
-            return None
-        except:
+        except TransientError as exc:
+            logger.warning("Recover gagal: %s", exc)
             return None
+        if status == 201 and isinstance(resp, dict) and "id" in resp:
+            return resp["id"]
+        return None
 
-    # Ekstrak isi response dan kode status
-    def _return_response_and_status(self, response: Response) -> Tuple[Union[dict, List], int]:
+    # Ekstrak isi response dan kode status (raw=True: key dibiarkan camelCase untuk compile_decoder)
+    def _return_response_and_status(self, response: "Response", raw: bool = False) -> Tuple[Union[dict, List], int]:
 
-        # Parsing JSON dari server
-        resp = response.json()  
+        # Parsing JSON dari server (body rusak/terpotong dianggap gangguan sementara)
+        start = time.perf_counter() if self.metrics is not None else 0.0
+        try:
+            resp = response.json()
+        except ValueError as exc:
+            raise TransientError("response {} tidak valid: {}".format(response.status_code, exc)) from exc
+        if self.metrics is not None:
+            self.metrics.record("json", time.perf_counter() - start)
+
+        data = unwrap_data(resp)
+        return (data if raw else decode(data)), response.status_code
+
+# Ambil field 'data' dari body response jika tersedia
+def unwrap_data(resp):
+    response_data = resp.get("data") if isinstance(resp, dict) else resp
+    if not response_data:
+        response_data = resp
+    return response_data
+
+# Arah gerakan dan perubahan koordinatnya (dx, dy)
+DIRECTION_DELTAS = {
+    "NORTH": (0, -1),
+    "SOUTH": (0, 1),
+    "WEST": (-1, 0),
+    "EAST": (1, 0),
+}
+
+# Nilai jarak untuk sel yang tidak bisa dicapai
+UNREACHABLE = -1
+
+# Mask sel grid dalam bytearray (1 = dihindari), sel dikodekan sebagai y * width + x.
+# Sel di luar board juga dianggap terhalang. Mendukung 'pos in mask' seperti set Position.
+class GridMask:
+    __slots__ = ("width", "height", "cells")
+
+    def __init__(self, width: int, height: int, blocked: Iterable[Tuple[int, int]] = ()):
+        self.width = width
+        self.height = height
+        self.cells = bytearray(width * height)
+        for x, y in blocked:
+            if 0 <= x < width and 0 <= y < height:
+                self.cells[y * width + x] = 1
+
+    def blocked(self, x: int, y: int) -> bool:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return True
+        return self.cells[y * self.width + x] == 1
+
+    def __contains__(self, pos: Position) -> bool:
+        return self.blocked(pos.x, pos.y)
+
+# Mesin distance field: BFS di atas grid board dengan sel disimpan sebagai indeks y * width + x.
+# Teleport diperlakukan sebagai penghalang, atau (portals=True) sebagai portal yang
+# memindahkan bot ke pasangannya. Field per target di-cache dengan LRU.
+class DistanceFields:
+    def __init__(self, width: int, height: int, teleports: Dict[Tuple[int, int], Optional[str]],
+                 portals: bool = False, max_fields: int = 512):
+        self.width = width
+        self.height = height
+        self.portals = portals
+        self.max_fields = max_fields
+        self._fields: "OrderedDict[Tuple[bool, int], List[int]]" = OrderedDict()
+        self._arrays: Dict[Tuple[bool, int], Any] = {}  # Salinan NumPy dari field yang ada di cache
+
+        # Pasangan teleport berdasarkan pair_id (sel -> sel pasangannya)
+        groups: Dict[Optional[str], List[int]] = {}
+        for (x, y), pair_id in teleports.items():
+            groups.setdefault(pair_id, []).append(y * width + x)
+        links = {}
+        if portals:
+            for cells in groups.values():
+                if len(cells) == 2:
+                    links[cells[0]], links[cells[1]] = cells[1], cells[0]
+        self.blocked = GridMask(width, height, teleports)
+        blocked = self.blocked.cells
+
+        # Graf langkah: moves[u][arah] = sel tempat bot mendarat jika melangkah dari u
+        size = width * height
+        self.moves: List[Dict[str, int]] = [{} for _ in range(size)]
+        self.succ: List[List[int]] = [[] for _ in range(size)]
+        self.pred: List[List[int]] = [[] for _ in range(size)]
+        for y in range(height):
+            for x in range(width):
+                u = y * width + x
+                for direction, (dx, dy) in DIRECTION_DELTAS.items():
+                    nx, ny = x + dx, y + dy
+                    if not (0 <= nx < width and 0 <= ny < height):
+                        continue
+                    v = ny * width + nx
+                    if blocked[v]:
+                        if v not in links:
+                            continue
+                        v = links[v]
+                    self.moves[u][direction] = v
+                    self.succ[u].append(v)
+                    self.pred[v].append(u)
+
+    # Indeks sel dari sebuah posisi
+    def cell(self, pos: Position) -> int:
+        return pos.y * self.width + pos.x
+
+    # BFS dari satu sel mengikuti daftar tetangga (succ = maju, pred = mundur)
+    def _bfs(self, origin: int, neighbours: List[List[int]]) -> List[int]:
+        dist = [UNREACHABLE] * (self.width * self.height)
+        dist[origin] = 0
+        queue = deque([origin])
+        while queue:
+            u = queue.popleft()
+            d = dist[u] + 1
+            for v in neighbours[u]:
+                if dist[v] == UNREACHABLE:
+                    dist[v] = d
+                    queue.append(v)
+        return dist
+
+    def _cached(self, key: Tuple[bool, int], neighbours: List[List[int]]) -> List[int]:
+        field = self._fields.get(key)
+        if field is None:
+            field = self._fields[key] = self._bfs(key[1], neighbours)
+            if len(self._fields) > self.max_fields:
+                evicted, _ = self._fields.popitem(last=False)
+                self._arrays.pop(evicted, None)
+        else:
+            self._fields.move_to_end(key)
+        return field
+
+    # Field dalam bentuk array NumPy, dikonversi sekali selama field masih di cache
+    def _array(self, key: Tuple[bool, int], field: List[int]):
+        array = self._arrays.get(key)
+        if array is None:
+            array = self._arrays[key] = np.asarray(field, dtype=np.int64)
+        return array
+
+    def array_to(self, target: Position):
+        return self._array((True, self.cell(target)), self.field_to(target))
+
+    def array_from(self, source: Position):
+        if not self.portals:
+            return self.array_to(source)
+        return self._array((False, self.cell(source)), self.field_from(source))
+
+    # Jarak dari setiap sel MENUJU target (field[cell(asal)])
+    def field_to(self, target: Position) -> List[int]:
+        return self._cached((True, self.cell(target)), self.pred)
+
+    # Jarak DARI sumber ke setiap sel (field[cell(tujuan)])
+    def field_from(self, source: Position) -> List[int]:
+        # Tanpa portal grafnya simetris, jadi field ke/dari sel yang sama bisa dipakai bersama
+        if not self.portals:
+            return self.field_to(source)
+        return self._cached((False, self.cell(source)), self.succ)
+
+    # Panjang jalur terpendek dari a ke b (UNREACHABLE jika tidak ada jalur)
+    def distance(self, a: Position, b: Position) -> int:
+        return self.field_to(b)[self.cell(a)]
+
+# Cache mesin distance field per geometri board dan layout teleport. Field hanya
+# dihitung ulang jika teleport berpindah (key berubah).
+_distance_fields_cache: "OrderedDict[tuple, DistanceFields]" = OrderedDict()
+DISTANCE_FIELDS_CACHE_SIZE = 4
+
+# Ambil (atau buat) mesin distance field yang sesuai dengan board ini
+def distance_fields(board: Board, portals: bool = False) -> DistanceFields:
+    teleports = {
+        (obj.position.x, obj.position.y): obj.properties.pair_id if obj.properties else None
+        for obj in board.index.of_type("TeleportGameObject") if obj.position
+    }
+    key = (board.width, board.height, portals, tuple(sorted(teleports.items(), key=lambda item: item[0])))
+    fields = _distance_fields_cache.get(key)
+    if fields is None:
+        fields = _distance_fields_cache[key] = DistanceFields(board.width, board.height, teleports, portals)
+        if len(_distance_fields_cache) > DISTANCE_FIELDS_CACHE_SIZE:
+            _distance_fields_cache.popitem(last=False)
+    else:
+        _distance_fields_cache.move_to_end(key)
+    return fields
 
-        # Ambil field 'data' jika tersedia
-        response_data = resp.get("data") if isinstance(resp, dict) else resp
-        if not response_data:
-            response_data = resp
-        return decode(response_data), response.status_code
+# Parameter strategi greedy yang bisa di-tuning (lihat tournament.py).
+# Nilai default sama dengan perilaku awal bot.
+@dataclass(frozen=True)
+class StrategyParams:
+    distance_offset: float = 1.0  # skor diamond = nilai / (jarak + offset) ** distance_power
+    distance_power: float = 1.0
+    red_weight: float = 1.0  # pengali nilai diamond merah (2 poin)
+    contest_margin: int = 0  # diamond dilepas jika bot lain lebih dekat lebih dari margin langkah
+    return_ratio: float = 1.0  # pulang ke base jika inventori >= ratio * kapasitas
+
+    # Skor satu diamond dari poin dan jarak
+    def score(self, points: int, dist: int) -> float:
+        value = points * self.red_weight if points > 1 else points
+        return value / (dist + self.distance_offset) ** self.distance_power
+
+DEFAULT_PARAMS = StrategyParams()
+
+# Fungsi untuk memuat parameter strategi dari file JSON (misalnya hasil tournament.py).
+# Mengembalikan (parameter, planner): varian pemenang turnamen bisa memakai perencana rute.
+def load_params(path: str) -> Tuple[StrategyParams, bool]:
+    with open(path) as f:
+        raw = json.load(f)
+    if "params" in raw:
+        return StrategyParams(**raw["params"]), bool(raw.get("planner", False))
+    return StrategyParams(**raw), False
 
 # Fungsi untuk menentukan langkah berikutnya
-def get_next_move(board: Board, my_bot_data: Bot) -> Optional[Tuple[str, int]]:
+# Jika 'planner' diberikan, tujuan diambil dari rencana rute multi-diamond; strategi greedy
+# dipakai jika perencana tidak menemukan rute yang layak.
+# Jika 'memo' diberikan (dan tanpa perencana), keputusan untuk state yang sama diambil dari cache.
+# Jika 'tracker' diberikan, perkiraan target dan risiko tackle lawan ikut menentukan keputusan
+# (memo tidak dipakai karena keputusan bergantung pada riwayat lawan)
+# Diamond dengan id di 'exclude' tidak dipilih (misalnya sudah dibagikan ke anggota tim lain).
+def get_next_move(board: Board, my_bot_data: Bot, portals: bool = False,
+                  planner: Optional[RoutePlanner] = None,
+                  params: StrategyParams = DEFAULT_PARAMS,
+                  memo: Optional[DecisionMemo] = None,
+                  tracker: Optional[OpponentTracker] = None,
+                  exclude: Optional[AbstractSet[int]] = None) -> Optional[Tuple[str, int]]:
+    if memo is not None and planner is None and tracker is None and not exclude:
+        return _memoized_move(board, my_bot_data, portals, params, memo)
+    return _next_move(board, my_bot_data, portals, planner, params, tracker=tracker, exclude=exclude)
+
+# get_next_move lewat memo: cache per hash state, lalu target sebelumnya jika masih valid,
+# baru keputusan penuh
+def _memoized_move(board: Board, my_bot_data: Bot, portals: bool, params: StrategyParams,
+                   memo: DecisionMemo) -> Optional[Tuple[str, int]]:
+    key = (board.index.state_hash, board.width, board.height, my_bot_data.name, portals, params)
+    result = memo.get(key)
+    if result is not None:
+        return result
+
+    my_bot = board.get_bot(my_bot_data)
+    if not my_bot or not my_bot.position:
+        return None
+    fields = distance_fields(board, portals)
+    reused = memo.reusable_target(board, my_bot, fields, portals, params)
+    if reused:
+        target_pos, target_id = reused
+        direction = direction_towards(my_bot.position, target_pos, fields.blocked, fields)
+        result = (direction, target_id) if direction else None
+    if not result:
+        memo.miss()
+        result = _next_move(board, my_bot_data, portals, None, params, fields)
+        if result and result[1] >= 0:
+            memo.remember(board, my_bot, fields, portals, params, result[1])
+    memo.put(key, result)
+    return result
+
+def _next_move(board: Board, my_bot_data: Bot, portals: bool, planner: Optional[RoutePlanner],
+               params: StrategyParams, fields: Optional[DistanceFields] = None,
+               tracker: Optional[OpponentTracker] = None,
+               exclude: Optional[AbstractSet[int]] = None) -> Optional[Tuple[str, int]]:
     # Ambil objek bot dari board
     my_bot: GameObject = board.get_bot(my_bot_data)
 
@@ -280,17 +1070,25 @@ def get_next_move(board: Board, my_bot_data: Bot) -> Optional[Tuple[str, int]]:
     inventory = my_bot.properties.diamonds or 0
     max_inventory = my_bot.properties.inventory_size or 5
 
-    # Hindari semua posisi teleport
-    teleport_positions = {
-        obj.position for obj in board.game_objects
-        if obj.position and obj.type == "TeleportGameObject"
-    }
+    # Jarak jalur sebenarnya (BFS), teleport sebagai penghalang atau portal
+    fields = fields or distance_fields(board, portals)
+
+    # Hindari semua posisi teleport (mask grid, dipakai bersama selama teleport tidak berpindah)
+    teleport_positions = fields.blocked
+
+    # Perkiraan niat lawan dari riwayat posisinya. Saat membawa diamond, langkah ke sel yang
+    # mungkin dimasuki lawan yang bisa tackle dihindari jika ada langkah lain yang sama pendek.
+    opponents = None
+    if tracker is not None:
+        tracker.update(board, my_bot.properties.name, fields)
+        opponents = tracker.estimate(board, fields)
+    risky = opponents.risky if opponents is not None and inventory > 0 else None
 
-    # === PRIORITAS 0: Pulang ke base jika inventori penuh ===
-    if inventory >= max_inventory:
+    # === PRIORITAS 0: Pulang ke base jika inventori penuh (atau mencapai return_ratio) ===
+    if inventory >= max(1, math.ceil(params.return_ratio * max_inventory)):
         if base_pos:
             if not positions_equal(my_pos, base_pos):
-                direction = direction_towards(my_pos, base_pos, teleport_positions)
+                direction = direction_towards(my_pos, base_pos, teleport_positions, fields, risky)
                 if direction:
                     return direction, -1  # Menuju base
                 else:
@@ -301,17 +1099,27 @@ def get_next_move(board: Board, my_bot_data: Bot) -> Optional[Tuple[str, int]]:
                 return random_move(my_pos, teleport_positions)
         return None
 
+    # === PRIORITAS 1a: Ikuti rencana rute (diamond berurutan lalu pulang ke base) ===
+    if planner is not None:
+        planned = planner.next_target(board, my_bot, fields)
+        if planned:
+            target_pos, target_id = planned
+            direction = direction_towards(my_pos, target_pos, teleport_positions, fields, risky)
+            if direction:
+                return direction, target_id
+
     # === PRIORITAS 1: Cari diamond terbaik yang kita lebih dekat dari bot lain ===
     target = find_best_diamond(
         board, my_pos, inventory, max_inventory, teleport_positions,
-        prefer_closest=True, my_name=my_bot.properties.name
+        prefer_closest=True, my_name=my_bot.properties.name, fields=fields, params=params,
+        opponents=opponents, risky=risky, exclude=exclude,
     )
 
     # === PRIORITAS 2: Jika tidak ada, ambil diamond terbaik tanpa mempertimbangkan kedekatan bot lain ===
     if not target:
         target = find_best_diamond(
             board, my_pos, inventory, max_inventory, teleport_positions,
-            prefer_closest=False
+            prefer_closest=False, fields=fields, params=params, risky=risky, exclude=exclude,
         )
 
     # === PRIORITAS 3: Jika tetap tidak ada, lakukan gerakan acak (asal tidak masuk teleport) ===
@@ -321,17 +1129,67 @@ def get_next_move(board: Board, my_bot_data: Bot) -> Optional[Tuple[str, int]]:
 
     return random_move(my_pos, teleport_positions)  # -2 menandakan random step
 
+# Batas jumlah pasangan (diamond x bot) sebelum scoring tervektorisasi dipakai otomatis;
+# di bawah ini overhead NumPy lebih besar dari loop Python
+VECTORIZE_MIN_PAIRS = 256
+
 # Fungsi untuk mencari diamond terbaik
-def find_best_diamond(board, my_pos, inventory, max_inventory, avoid, prefer_closest=True, my_name=None):
+# Jika 'fields' diberikan, jarak memakai jalur BFS sebenarnya; jika tidak, jarak Manhattan.
+# 'vectorized' memilih scoring NumPy (None = otomatis jika NumPy ada dan board cukup ramai).
+# 'opponents' (OpponentView) menambahkan perkiraan target lawan ke cek kedekatan, 'risky'
+# diteruskan ke direction_towards. Diamond dengan id di 'exclude' dilewati.
+def find_best_diamond(board, my_pos, inventory, max_inventory, avoid, prefer_closest=True, my_name=None,
+                      fields=None, vectorized=None, params=DEFAULT_PARAMS, opponents=None, risky=None,
+                      exclude=None):
+    if vectorized is None:
+        vectorized = len(board.index.diamonds) * (len(board.index.bots) + 1) >= VECTORIZE_MIN_PAIRS
+    if vectorized and board.index.diamonds and _load_numpy() is not None:
+        target = _select_diamond_vectorized(board, my_pos, inventory, max_inventory, prefer_closest, my_name, fields,
+                                            params, opponents, exclude)
+    else:
+        target = _select_diamond(board, my_pos, inventory, max_inventory, prefer_closest, my_name, fields, params,
+                                 opponents, exclude)
+
+    # Jika ditemukan diamond yang valid, kembalikan arahnya dan ID-nya
+    if target:
+        target_pos, target_id = target
+        direction = direction_towards(my_pos, target_pos, avoid, fields, risky)
+        if direction:
+            return direction, target_id
+
+    # Tidak ada diamond valid ditemukan
+    return None
+
+# Pilih diamond terbaik dengan loop Python, mengembalikan (posisi, id) atau None
+def _select_diamond(board, my_pos, inventory, max_inventory, prefer_closest, my_name, fields,
+                    params=DEFAULT_PARAMS, opponents=None, exclude=None):
     # Inisialisasi variabel untuk menyimpan diamond terbaik
     best_score = -1
-    target_pos = None
-    target_id = None
+    target = None
 
-    # Iterasi semua objek di papan
-    for obj in board.game_objects:
-        # Lewati jika bukan diamond atau tidak memiliki posisi
-        if obj.type != "DiamondGameObject" or not obj.position:
+    # Fungsi jarak: sekali BFS dari posisi kita untuk semua diamond, field per diamond untuk bot lain
+    if fields is not None:
+        from_me = fields.field_from(my_pos)
+        my_distance = lambda pos: from_me[fields.cell(pos)]
+        bot_distance = lambda bot_pos, pos: fields.distance(bot_pos, pos)
+    else:
+        my_distance = lambda pos: manhattan_distance(my_pos, pos)
+        bot_distance = manhattan_distance
+
+    # Bot lain yang punya posisi, cukup disaring sekali untuk semua diamond. Lawan yang
+    # diperkirakan menuju target lain tidak dianggap bersaing; lawan yang menuju suatu diamond
+    # tercatat di 'claims' (id diamond -> jarak lawan)
+    elsewhere = opponents.elsewhere if opponents is not None else ()
+    claims = opponents.claims if opponents is not None else None
+    other_bots = [
+        bot for bot in board.index.bots
+        if bot.position and bot.properties.name != my_name and bot.properties.name not in elsewhere
+    ] if prefer_closest and my_name else []
+
+    # Iterasi semua diamond di papan
+    for obj in board.index.diamonds:
+        # Lewati jika tidak memiliki posisi atau sudah dibagikan ke bot lain
+        if not obj.position or (exclude and obj.id in exclude):
             continue
 
         pos = obj.position
@@ -349,57 +1207,107 @@ def find_best_diamond(board, my_pos, inventory, max_inventory, avoid, prefer_clo
         if positions_equal(pos, my_pos):
             continue
 
-        # Hitung jarak bot kita ke diamond ini
-        my_dist = manhattan_distance(my_pos, pos)
+        # Hitung jarak bot kita ke diamond ini, lewati jika tidak ada jalur
+        my_dist = my_distance(pos)
+        if my_dist == UNREACHABLE:
+            continue
+
+        # Lewati lebih awal jika skornya tidak lebih baik dari kandidat terbaik
+        score = params.score(points, my_dist)
+        if score <= best_score:
+            continue
 
         # === Cek apakah kita lebih dekat dari bot lain ===
         if prefer_closest and my_name:
+            # Diamond yang sedang dituju lawan yang tiba lebih dulu atau bersamaan dilepas
+            claim = claims.get(obj.id) if claims else None
+            if claim is not None and claim <= my_dist - params.contest_margin:
+                continue
+
             # Cek setiap bot lain
-            for bot in board.bots:
-                if not bot.position or bot.properties.name == my_name:
-                    continue
+            for bot in other_bots:
                 # Jika ada bot lain lebih dekat, diamond ini tidak dipilih
-                if manhattan_distance(bot.position, pos) < my_dist:
+                dist = bot_distance(bot.position, pos)
+                if dist != UNREACHABLE and dist < my_dist - params.contest_margin:
                     break
             else:
                 # Tidak ada bot lain lebih dekat: diamond ini kandidat
-                score = points / (my_dist + 1)
-                if score > best_score:
-                    best_score = score
-                    target_pos = pos
-                    target_id = obj.id
+                best_score = score
+                target = pos, obj.id
 
         # === Alternatif: Ambil diamond terbaik tanpa cek kedekatan bot lain ===
         elif not prefer_closest:
-            score = points / (my_dist + 1)
-            if score > best_score:
-                best_score = score
-                target_pos = pos
-                target_id = obj.id
+            best_score = score
+            target = pos, obj.id
 
-    # Jika ditemukan diamond yang valid, kembalikan arahnya dan ID-nya
-    if target_pos:
-        direction = direction_towards(my_pos, target_pos, avoid)
-        if direction:
-            return direction, target_id
+    return target
 
-    # Tidak ada diamond valid ditemukan
+# Versi NumPy dari _select_diamond: jarak, filter inventori dan skor semua diamond dihitung
+# dalam batch. Hasilnya sama dengan versi loop (diamond pertama menang jika skornya seri).
+def _select_diamond_vectorized(board, my_pos, inventory, max_inventory, prefer_closest, my_name, fields,
+                               params=DEFAULT_PARAMS, opponents=None, exclude=None):
+    # Sama seperti versi loop: tanpa nama bot, mode prefer_closest tidak memilih apa pun
+    if prefer_closest and not my_name:
+        return None
+
+    diamonds, xs, ys, points = board.index.diamond_arrays
+    if not diamonds:
+        return None
+
+    # Jarak dari kita ke semua diamond
+    if fields is not None:
+        cells = ys * fields.width + xs
+        my_dist = fields.array_from(my_pos)[cells]
+    else:
+        my_dist = np.abs(xs - my_pos.x) + np.abs(ys - my_pos.y)
+
+    valid = (points > 0) & (inventory + points <= max_inventory)
+    valid &= ~((xs == my_pos.x) & (ys == my_pos.y))
+    valid &= my_dist != UNREACHABLE
+    if exclude:
+        valid &= ~np.fromiter((obj.id in exclude for obj in diamonds), dtype=bool, count=len(diamonds))
+    values = np.where(points > 1, points * params.red_weight, points)
+    scores = np.where(valid, values / (my_dist + params.distance_offset) ** params.distance_power, -1.0)
+
+    elsewhere = opponents.elsewhere if opponents is not None else ()
+    claims = opponents.claims if opponents is not None and prefer_closest else None
+    others = [
+        bot.position for bot in board.index.bots
+        if bot.position and bot.properties.name != my_name and bot.properties.name not in elsewhere
+    ] if prefer_closest else []
+    if not others and not claims:
+        best = int(np.argmax(scores))
+        return (diamonds[best].position, diamonds[best].id) if scores[best] >= 0 else None
+
+    # Kandidat dicek berurutan dari skor tertinggi; untuk setiap kandidat, jarak semua bot
+    # lain dihitung sekaligus. Biasanya hanya beberapa kandidat teratas yang perlu dicek,
+    # jauh lebih murah daripada matriks penuh bot x diamond pada board yang ramai.
+    bx = np.fromiter((pos.x for pos in others), dtype=np.int64, count=len(others))
+    by = np.fromiter((pos.y for pos in others), dtype=np.int64, count=len(others))
+    if fields is not None:
+        bot_cells = by * fields.width + bx
+
+    for best in np.argsort(-scores, kind="stable"):
+        if scores[best] < 0:
+            break
+        claim = claims.get(diamonds[best].id) if claims else None
+        if claim is not None and claim <= my_dist[best] - params.contest_margin:
+            continue
+        if fields is not None:
+            # Field per diamond tetap di cache selama diamond tidak berpindah
+            bot_dist = fields.array_to(diamonds[best].position)[bot_cells]
+        else:
+            bot_dist = np.abs(bx - xs[best]) + np.abs(by - ys[best])
+        if not ((bot_dist != UNREACHABLE) & (bot_dist < my_dist[best] - params.contest_margin)).any():
+            return diamonds[best].position, diamonds[best].id
     return None
 
 # Memberikan langkah acak 
-def random_move(pos: Position, avoid: set) -> Optional[Tuple[str, int]]:
-    # Membuat dictionary arah dan posisi baru berdasarkan posisi saat ini
-    directions = {
-        "NORTH": Position(pos.x, pos.y - 1),
-        "SOUTH": Position(pos.x, pos.y + 1),
-        "WEST": Position(pos.x - 1, pos.y),
-        "EAST": Position(pos.x + 1, pos.y),
-    }
-
+def random_move(pos: Position, avoid) -> Optional[Tuple[str, int]]:
     # Menyaring hanya arah yang tidak menuju ke posisi yang ingin dihindari
     valid_moves = [
-        direction for direction, new_pos in directions.items()
-        if new_pos not in avoid
+        direction for direction, (dx, dy) in DIRECTION_DELTAS.items()
+        if not is_blocked(pos.x + dx, pos.y + dy, avoid)
     ]
 
     # Jika ada gerakan yang valid, pilih satu secara acak dan kembalikan dengan nilai -2
@@ -418,11 +1326,19 @@ def positions_equal(p1: Position, p2: Position) -> bool:
     return p1.x == p2.x and p1.y == p2.y
 
 # Fungsi untuk menentukan langkah ke tujuan
-def direction_towards(start: Position, goal: Position, avoid: Optional[set] = None) -> str:
+# Jika 'fields' diberikan, pilih langkah yang mengurangi jarak jalur BFS ke tujuan
+# ('risky': sel yang mungkin dimasuki lawan, dihindari jika ada langkah lain yang sama pendek)
+def direction_towards(start: Position, goal: Position, avoid=None,
+                      fields: Optional[DistanceFields] = None, risky=None) -> str:
     # Hitung selisih koordinat antara posisi tujuan dan posisi awal
     dx = goal.x - start.x
     dy = goal.y - start.y
 
+    if fields is not None:
+        direction = _direction_along_field(start, goal, dx, dy, fields, risky)
+        if direction:
+            return direction
+
     # Jika 'avoid' tidak diberikan, gunakan set kosong
     avoid = avoid or set()
 
@@ -455,30 +1371,133 @@ def direction_towards(start: Position, goal: Position, avoid: Optional[set] = No
         elif dx < 0 and not is_blocked(start.x - 1, start.y, avoid):
             return "WEST"
 
-    # Semua arah utama diblokir, buat daftar semua arah alternatif
-    directions = {
-        "EAST": Position(start.x + 1, start.y),
-        "WEST": Position(start.x - 1, start.y),
-        "SOUTH": Position(start.x, start.y + 1),
-        "NORTH": Position(start.x, start.y - 1),
-    }
-
-    # Tambahkan arah yang tidak ada di posisi yang dihindari ke dalam kandidat
-    for direction, pos in directions.items():
-        if pos not in avoid:
+    # Semua arah utama diblokir: tambahkan arah alternatif yang tidak dihindari ke kandidat
+    directions = ("EAST", "WEST", "SOUTH", "NORTH")
+    for direction in directions:
+        dx_step, dy_step = DIRECTION_DELTAS[direction]
+        if not is_blocked(start.x + dx_step, start.y + dy_step, avoid):
             candidates.append(direction)
 
     # Jika semua arah terblokir, tetap tambahkan semua arah sebagai kandidat (meski berisiko)
     if not candidates:
-        candidates = list(directions.keys())
+        candidates = list(directions)
 
     # Pilih dan kembalikan satu arah secara acak dari kandidat yang tersedia
     return random.choice(candidates)
 
-# Fungsi untuk mengecek apakah posisi tersebut termasuk dalam set 'avoid'
-def is_blocked(x: int, y: int, avoid: set) -> bool:
+# Pilih langkah dengan jarak ke tujuan terkecil. Jika seri, urutan arah mengikuti
+# prioritas greedy (sumbu yang selisihnya lebih besar lebih dulu), kecuali langkah yang
+# masuk ke sel 'risky' kalah dari langkah aman yang sama pendek
+def _direction_along_field(start: Position, goal: Position, dx: int, dy: int,
+                           fields: DistanceFields, risky=None) -> Optional[str]:
+    to_goal = fields.field_to(goal)
+    start_cell = fields.cell(start)
+
+    # Sudah di tujuan: tidak ada langkah yang mendekatkan
+    if to_goal[start_cell] == 0:
+        return None
+
+    horizontal = ["EAST", "WEST"] if dx >= 0 else ["WEST", "EAST"]
+    vertical = ["SOUTH", "NORTH"] if dy >= 0 else ["NORTH", "SOUTH"]
+    order = horizontal + vertical if abs(dx) >= abs(dy) else vertical + horizontal
+
+    moves = fields.moves[start_cell]
+    best_direction = None
+    best_dist = UNREACHABLE
+    best_risky = False
+    for direction in order:
+        landing = moves.get(direction)
+        if landing is None:
+            continue
+        dist = to_goal[landing]
+        if dist == UNREACHABLE:
+            continue
+        is_risky = risky is not None and landing in risky
+        if best_dist == UNREACHABLE or dist < best_dist or (dist == best_dist and best_risky and not is_risky):
+            best_direction, best_dist, best_risky = direction, dist, is_risky
+    return best_direction
+
+# Fungsi untuk mengecek apakah posisi tersebut termasuk dalam 'avoid'
+# (GridMask: cek bytearray tanpa membuat Position; set Position: perilaku lama)
+def is_blocked(x: int, y: int, avoid) -> bool:
+    if isinstance(avoid, GridMask):
+        return avoid.blocked(x, y)
     return Position(x=x, y=y) in avoid
 
+# Penjadwal langkah berbasis deadline: mencatat kapan langkah berikutnya boleh dikirim dan
+# hanya tidur selama sisa waktunya, bukan delay penuh setelah response diterima.
+# Waktu RTT, decode, dan keputusan berikutnya jadi tumpang tindih dengan masa tunggu.
+@dataclass
+class MovePacer:
+    period: float  # Minimum delay antar langkah (detik)
+    margin: float = 0.005  # Cadangan agar langkah tidak tiba di server lebih cepat dari aturan
+    next_at: float = 0.0  # Waktu (monotonic) paling awal langkah berikutnya boleh dikirim
+    moves: int = 0
+    missed: int = 0  # Jumlah langkah yang dikirim setelah deadline-nya lewat
+    late_total: float = 0.0  # Total keterlambatan (detik)
+    resync: bool = True  # Langkah berikutnya tidak dihitung terlambat (langkah pertama / setelah reset)
+
+    # Sisa waktu sampai langkah berikutnya boleh dikirim
+    def remaining(self, now: Optional[float] = None) -> float:
+        now = time.monotonic() if now is None else now
+        return max(0.0, self.next_at - now)
+
+    # Tidur hanya selama sisa waktu sampai deadline, mengembalikan lama tidur (detik)
+    def wait(self) -> float:
+        delay = self.remaining()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    # Catat pengiriman langkah dan hitung deadline berikutnya.
+    # Mengembalikan keterlambatan (detik) jika deadline terlewat, selain itu 0.
+    def mark_sent(self, now: Optional[float] = None) -> float:
+        now = time.monotonic() if now is None else now
+        late = 0.0 if self.resync else now - self.next_at
+        self.resync = False
+        self.moves += 1
+        self.next_at = now + self.period + self.margin
+        if late > self.margin:
+            self.missed += 1
+            self.late_total += late
+            return late
+        return 0.0
+
+    # Dipanggil setelah tick tanpa langkah (idle, ambil ulang state setelah gangguan): deadline
+    # lama tidak lagi berarti, jadi langkah berikutnya tidak dihitung terlambat. Periode
+    # mengikuti minimum delay board terbaru jika diberikan.
+    def reset(self, period: Optional[float] = None):
+        self.resync = True
+        if period is not None:
+            self.period = period
+
+    def summary(self) -> dict:
+        return {
+            "moves": self.moves,
+            "missed": self.missed,
+            "late_avg_ms": self.late_total / self.missed * 1000 if self.missed else 0.0,
+        }
+
+# Pastikan bot ada di 'board' (hasil list board atau boards_get). Jika sudah ada, board itu
+# langsung dipakai tanpa request lagi; jika belum, join lalu ambil board terbaru. Hasil join
+# (gagal, timeout, atau bukan 200) tidak langsung dipercaya: join bisa saja sudah diterapkan
+# server, jadi keanggotaan dicek dari board terbaru.
+def enter_board(api: Api, bot_id: str, name: str, board_id: int, board: Optional[Board]) -> Optional[Board]:
+    if board is None:
+        return None
+    if any(b.properties.name == name for b in board.bots):
+        logger.info("Bot '%s' sudah di board %s", name, board_id)
+        return board
+    try:
+        api.bots_join(bot_id, board_id)
+    except TransientError as exc:
+        logger.warning("Join gagal: %s; keanggotaan board dicek ulang", exc)
+    board = api.boards_get(board_id)
+    if board is None or not any(b.properties.name == name for b in board.bots):
+        return None
+    logger.info("Bot '%s' join board %s", name, board_id)
+    return board
+
 if __name__ == "__main__":
     # === PARSING ARGUMEN TERMINAL ===
     # Digunakan untuk menjalankan bot dengan konfigurasi berbeda dari terminal
@@ -488,7 +1507,33 @@ if __name__ == "__main__":
     parser.add_argument("--name", default="CBot")             # Nama bot (unik di board)
     parser.add_argument("--team", default="etimo")                     # Nama tim bot
     parser.add_argument("--url", default="http://localhost:3000/api")  # URL API
+    parser.add_argument("--pool-size", type=int, default=10)           # Ukuran connection pool
+    parser.add_argument("--connect-timeout", type=float, default=3.05) # Timeout koneksi (detik)
+    parser.add_argument("--read-timeout", type=float, default=10.0)    # Timeout response (detik)
+    parser.add_argument("--move-timeout", type=float, default=2.0)     # Timeout response move (detik)
+    parser.add_argument("--retries", type=int, default=3)              # Percobaan per request idempoten
+    parser.add_argument("--max-outage", type=float, default=30.0)      # Berhenti jika server mati selama ini (detik)
+    parser.add_argument("--no-keep-alive", action="store_true")        # Koneksi baru tiap request
+    parser.add_argument("--teleport-portals", action="store_true")     # Rute boleh lewat teleport
+    parser.add_argument("--pace-margin-ms", type=float, default=5.0)   # Cadangan waktu antar langkah
+    parser.add_argument("--no-incremental", action="store_true")       # Decode ulang seluruh board tiap tick
+    parser.add_argument("--metrics-dir", default=None)                 # Aktifkan instrumentasi + folder ekspor
+    parser.add_argument("--metrics-interval", type=float, default=10.0) # Interval ekspor metrik (detik)
+    parser.add_argument("--log-level", choices=list(LEVELS), default="info") # debug: log setiap request
+    parser.add_argument("--quiet", action="store_true")                # Mode produksi: hanya warning/error
+    parser.add_argument("--log-ring", type=int, default=512)           # Jumlah event terakhir yang dicetak saat error
+    parser.add_argument("--record-dir", default=None)                  # Rekam setiap board state ke folder ini
+    parser.add_argument("--planner", action="store_true")              # Perencana rute multi-diamond
+    parser.add_argument("--plan-budget-ms", type=float, default=5.0)   # Batas waktu pencarian rute per tick
+    parser.add_argument("--params", default=None)                      # File parameter strategi (hasil tournament.py)
+    parser.add_argument("--memo", action="store_true")                 # Memo keputusan per hash state board
+    parser.add_argument("--memo-size", type=int, default=256)          # Jumlah entry memo (LRU)
+    parser.add_argument("--tracker", action="store_true")              # Lacak lintasan lawan antar tick
+    parser.add_argument("--track-history", type=int, default=8)        # Panjang riwayat posisi per lawan
+    parser.add_argument("--fast-start", action="store_true")           # Pakai token dan board dari sesi tersimpan
+    parser.add_argument("--session-file", default=DEFAULT_SESSION_FILE) # File cache sesi untuk --fast-start
     args = parser.parse_args()
+    logger.configure(WARNING if args.quiet else LEVELS[args.log_level], ring_size=args.log_ring)
 
     # Simpan argumen ke variabel
     EMAIL = args.email
@@ -497,74 +1542,180 @@ if __name__ == "__main__":
     TEAM = args.team
     BASE_URL = args.url
 
+    # === INSTRUMENTASI (opsional) ===
+    registry = MetricsRegistry(args.metrics_dir, args.metrics_interval) if args.metrics_dir else None
+    metrics = registry.for_bot(NAME) if registry else None
+
     # === INISIALISASI OBJEK API ===
-    api = Api(BASE_URL)
-
-    # === LOGIN ATAU DAFTARKAN BOT ===
-    bot_id = api.bots_recover(EMAIL, PASSWORD)
-    if not bot_id:
-        # Jika tidak bisa recover, daftar bot baru
-        bot_obj = api.bots_register(NAME, EMAIL, PASSWORD, TEAM)
-        if not bot_obj:
-            print("[FATAL] Gagal mendaftar bot.")
+    api = Api(
+        BASE_URL,
+        pool_size=args.pool_size,
+        connect_timeout=args.connect_timeout,
+        read_timeout=args.read_timeout,
+        keep_alive=not args.no_keep_alive,
+        store=None if args.no_incremental else BoardStore(),
+        metrics=metrics,
+        recorder=GameRecorder(recording_path(args.record_dir, NAME)) if args.record_dir else None,
+        move_timeout=args.move_timeout,
+        retry=RetryPolicy(attempts=max(1, args.retries)),
+    )
+
+    # === FAST START: token dan board dari sesi sebelumnya (tanpa recover dan list board) ===
+    session = load_session(args.session_file, BASE_URL, EMAIL, NAME) if args.fast_start else None
+    board_state = None
+    if session is not None:
+        bot_id, board_id = session.bot_id, session.board_id
+        board_state = enter_board(api, bot_id, NAME, board_id, api.boards_get(board_id))
+        if board_state is None:
+            logger.info("Sesi tersimpan tidak berlaku, login ulang.")
+            forget_session(args.session_file, BASE_URL, EMAIL)
+            session = None
+        else:
+            logger.info("Fast start: bot %s di board %s dari sesi tersimpan", bot_id, board_id)
+
+    if board_state is None:
+        # === LOGIN ATAU DAFTARKAN BOT ===
+        bot_id = api.bots_recover(EMAIL, PASSWORD)
+        if not bot_id:
+            # Jika tidak bisa recover, daftar bot baru
+            bot_obj = api.bots_register(NAME, EMAIL, PASSWORD, TEAM)
+            if not bot_obj:
+                logger.error("Gagal mendaftar bot.")
+                exit()
+            bot_id = bot_obj.id
+            logger.info("Bot baru terdaftar: %s", bot_id)
+        else:
+            logger.info("Bot ditemukan: %s", bot_id)
+
+        # === DAPATKAN BOARD DAN GABUNG JIKA PERLU ===
+        boards = api.boards_list()
+        if not boards:
+            logger.error("Tidak ada board tersedia.")
             exit()
-        bot_id = bot_obj.id
-        print(f"[INFO] Bot baru terdaftar: {bot_id}")
-    else:
-        print(f"[INFO] Bot ditemukan: {bot_id}")
+
+        # Daftar board sudah berisi board lengkap, jadi tidak perlu boards_get sebelum cek/join
+        board_id = boards[0].id
+        board_state = enter_board(api, bot_id, NAME, board_id, boards[0])
+        if board_state is None:
+            logger.error("Gagal join board.")
+            exit()
+        if args.fast_start:
+            save_session(args.session_file, BotSession(BASE_URL, EMAIL, NAME, bot_id, board_id))
 
     # Buat objek bot untuk digunakan dalam pemrosesan logika
     bot_data = Bot(name=NAME, email=EMAIL, id=bot_id)
 
-    # === DAPATKAN BOARD DAN GABUNG JIKA PERLU ===
-    boards = api.boards_list()
-    if not boards:
-        print("[FATAL] Tidak ada board tersedia.")
-        exit()
+    # Parameter strategi (default = perilaku awal bot)
+    params, use_planner = load_params(args.params) if args.params else (DEFAULT_PARAMS, False)
 
-    board_id = boards[0].id 
-    board_state = api.boards_get(board_id)
+    # Perencana rute (opsional, atau dari file parameter), rencana disimpan antar tick
+    planner = RoutePlanner(args.plan_budget_ms) if args.planner or use_planner else None
 
-    # Cek apakah bot sudah tergabung di board
-    if not any(b.properties.name == NAME for b in board_state.bots):
-        # Jika belum, coba gabung ke board
-        if not api.bots_join(bot_id, board_id):
-            print("[FATAL] Gagal join board.")
-            exit()
-        print(f"[INFO] Bot '{NAME}' join board {board_id}")
-    else:
-        print(f"[INFO] Bot '{NAME}' sudah di board {board_id}")
+    # Memo keputusan (opsional), hit rate dicatat sebagai counter metrik
+    memo = DecisionMemo(args.memo_size, metrics) if args.memo else None
+    tracker = OpponentTracker(args.track_history) if args.tracker else None
 
-    # Mengambil kondisi board terbaru
-    board_state = api.boards_get(board_id)
+    # Penjadwal langkah sesuai minimum delay board
+    pacer = MovePacer(board_state.minimum_delay_between_moves / 1000, args.pace_margin_ms / 1000)
 
     # === BOT LOOP ===
     # Loop utama selama bot masih hidup di board
+    moved = False
+    stale = False  # True setelah gangguan: state diambil ulang lewat boards_get sebelum memutuskan
+    outage_since: Optional[float] = None  # Awal gangguan yang sedang berlangsung
     while True:
         try:
-            # Dapatkan langkah selanjutnya dari strategi greedy
-            move_result = get_next_move(board_state, bot_data)
+            if stale:
+                api.retry_stats.refetches += 1
+                board_state = api.boards_get(board_id)
+                if board_state is None:
+                    logger.info("Board tidak tersedia lagi. Permainan selesai.")
+                    break
+                stale = False
+                pacer.reset(board_state.minimum_delay_between_moves / 1000)
+
+            # Dapatkan langkah selanjutnya dari strategi greedy (dihitung selagi menunggu deadline)
+            start = time.perf_counter() if metrics is not None else 0.0
+            move_result = get_next_move(board_state, bot_data, args.teleport_portals, planner, params, memo,
+                                        tracker)
+            if metrics is not None:
+                metrics.record("decide", time.perf_counter() - start)
+                registry.maybe_export()
             if move_result:
                 move, target_pos = move_result
-                print(f"[MOVE] {NAME} bergerak {move} ke {target_pos}")
+                logger.debug("[MOVE] %s bergerak %s ke %s", NAME, move, target_pos)
+
+                # Tunggu sisa waktu sampai langkah boleh dikirim
+                slept = pacer.wait()
+                if metrics is not None:
+                    metrics.record("sleep", slept)
+                late = pacer.mark_sent()
+                if late:
+                    logger.info("[PACE] %s terlambat %.1f ms dari deadline", NAME, late * 1000)
 
                 # Kirim perintah move ke server
                 board_state = api.bots_move(bot_id, move)
 
                 # Jika response kosong, artinya game over (bot sudah dikeluarkan dari board)
                 if board_state is None:
-                    print("[INFO] Bot tidak lagi aktif. Permainan selesai.")
+                    if session is not None and not moved:
+                        # Langkah pertama dari sesi tersimpan ditolak: token tidak berlaku lagi
+                        logger.warning("Token dari sesi tersimpan ditolak, sesi dihapus.")
+                        forget_session(args.session_file, BASE_URL, EMAIL)
+                    logger.info("Bot tidak lagi aktif. Permainan selesai.")
                     break
-            else:
-                # Tidak ada langkah diperlukan, bot idle
-                print("[INFO] Tidak ada langkah. Bot idle.")
-                continue
+                moved = True
+                if outage_since is not None:
+                    logger.info("Koneksi pulih setelah %.0f ms", (time.monotonic() - outage_since) * 1000)
+                    outage_since = None
 
-            # Delay agar sesuai aturan board (minimum delay antar move)
-            time.sleep((board_state.minimum_delay_between_moves / 1000))
+                # Ikuti minimum delay terbaru dari board
+                pacer.period = board_state.minimum_delay_between_moves / 1000
+            else:
+                # Tidak ada langkah diperlukan, bot idle: tunggu satu periode lalu ambil board terbaru
+                logger.debug("Tidak ada langkah. Bot idle.")
+                time.sleep(pacer.period)
+                board_state = api.boards_get(board_id)
+                if board_state is None:
+                    break
+                pacer.reset(board_state.minimum_delay_between_moves / 1000)
+
+        except TransientError as exc:
+            # Koneksi putus, timeout, atau server error: bot tetap jalan dan mengambil ulang state.
+            # Jika breaker terbuka, tunggu sampai request percobaan boleh dikirim.
+            now = time.monotonic()
+            outage_since = outage_since or now
+            if now - outage_since > args.max_outage:
+                logger.error("Server tidak bisa dihubungi selama %.0f detik, bot berhenti: %s", now - outage_since, exc)
+                break
+            logger.warning("Gangguan: %s; state diambil ulang", exc)
+            if isinstance(exc, CircuitOpenError):
+                api.retry_stats.lost_seconds += exc.retry_in
+                time.sleep(exc.retry_in)
+            stale = True
+
+        except Exception:
+            # Error lain (bug strategi, dll.) tidak diulang.
+            # Traceback dan event terakhir dari ring buffer dicetak untuk diagnosis.
+            logger.exception("Loop bot berhenti karena error")
+            break
 
-        except Exception as e:
-            # Penanganan exception umum, seperti koneksi gagal, dll
+        except KeyboardInterrupt:
+            # Ctrl+C (atau SIGINT dari load test): berhenti dengan rapi agar ringkasan dan metrik tetap ditulis
+            logger.info("Bot dihentikan.")
             break
 
-    print(f"[INFO] Selesai.")
\ No newline at end of file
+    # Tampilkan ringkasan round-trip time dan gangguan selama permainan
+    logger.info("RTT: %s", api.rtt_stats())
+    logger.info("Retry: %s", api.retry_stats.summary())
+    logger.info("Pacing: %s", pacer.summary())
+    if memo is not None:
+        logger.info("Memo: %s", memo.stats.summary())
+    if tracker is not None:
+        logger.info("Tracker: %s", tracker.stats.summary())
+    if registry is not None:
+        registry.export()
+        logger.info("%s", registry.summary())
+    api.close()
+    logger.info("Selesai.")
+    logger.close()
\ No newline at end of file
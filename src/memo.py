@@ -0,0 +1,172 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# Memo keputusan get_next_move per bot. Key-nya hash state ringkas dari BoardIndex
+# (BoardIndex.state_hash, diperbarui inkremental per delta) ditambah nama bot, mode
+# portal, dan parameter strategi, sehingga state yang sama persis tidak dihitung ulang.
+# Entry lama dibuang dengan LRU.
+#
+# Selain itu target diamond terakhir dipakai ulang selama masih valid (lihat reusable_target),
+# sehingga scan semua diamond dilewati selama bot berjalan ke target yang sama. Syarat valid
+# dipilih agar hasilnya sama dengan scan penuh, bukan sekadar mirip.
+#
+# Modul ini tidak mengimpor main: board, bot, dan distance field dipakai secara duck-typed.
+
+UNREACHABLE = -1
+
+# Statistik memo (juga dicatat sebagai counter metrik memo_hit, memo_reuse, memo_miss)
+@dataclass
+class MemoStats:
+    hits: int = 0  # Keputusan diambil dari cache (state sama persis)
+    reused: int = 0  # Target sebelumnya dipakai ulang, hanya arah yang dihitung
+    misses: int = 0  # Keputusan dihitung penuh
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.reused + self.misses
+        return (self.hits + self.reused) / total if total else 0.0
+
+    def summary(self) -> dict:
+        return {
+            "hits": self.hits,
+            "reused": self.reused,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+# Target yang terakhir dipilih dari scan diamond, beserta state saat dipilih
+@dataclass
+class _LastTarget:
+    name: str
+    key: tuple  # (portals, params)
+    diamond_hash: int
+    inventory: int
+    max_inventory: int
+    target_id: int
+    dist: int  # Jarak jalur ke target saat ini
+    cell: int  # Sel bot saat ini
+    steps: int  # Langkah sejak scan
+    from_scan: List[int]  # Distance field dari posisi bot saat scan
+    others: Optional[Dict[int, int]] = None  # poin -> jarak terdekat diamond lain saat scan (lazy)
+
+# Memo keputusan untuk satu bot
+class DecisionMemo:
+    def __init__(self, size: int = 256, metrics=None):
+        self.size = size
+        self.metrics = metrics  # BotMetrics opsional
+        self.stats = MemoStats()
+        self._cache: "OrderedDict[tuple, Tuple[str, int]]" = OrderedDict()
+        self._last: Optional[_LastTarget] = None
+
+    def _count(self, event: str):
+        if self.metrics is not None:
+            self.metrics.count(event)
+
+    # Keputusan tersimpan untuk key ini, atau None
+    def get(self, key: tuple) -> Optional[Tuple[str, int]]:
+        result = self._cache.get(key)
+        if result is None:
+            return None
+        self._cache.move_to_end(key)
+        self.stats.hits += 1
+        self._count("memo_hit")
+        return result
+
+    # Simpan keputusan. Langkah acak (target -2) tidak disimpan agar tetap acak.
+    def put(self, key: tuple, result: Optional[Tuple[str, int]]):
+        if result is None or result[1] == -2:
+            return
+        self._cache[key] = result
+        if len(self._cache) > self.size:
+            self._cache.popitem(last=False)
+            self.stats.evictions += 1
+
+    def miss(self):
+        self.stats.misses += 1
+        self._count("memo_miss")
+
+    # Catat target diamond hasil scan agar bisa dipakai ulang di tick berikutnya
+    def remember(self, board, me, fields, portals: bool, params, target_id: int):
+        target = self._diamond(board, target_id)
+        if target is None:
+            self._last = None
+            return
+        from_me = fields.field_from(me.position)
+        self._last = _LastTarget(
+            me.properties.name, (portals, params), board.index.state_hash[0], me.properties.diamonds or 0,
+            me.properties.inventory_size or 5, target_id, from_me[fields.cell(target.position)],
+            fields.cell(me.position), 0, from_me,
+        )
+
+    # Untuk setiap nilai poin, jarak diamond lain (selain target) terdekat dari posisi scan.
+    # Dihitung sekali saat target pertama kali akan dipakai ulang.
+    @staticmethod
+    def _nearest_others(board, fields, last: _LastTarget) -> Dict[int, int]:
+        others: Dict[int, int] = {}
+        for obj in board.index.diamonds:
+            points = obj.properties.points if obj.properties else None
+            if obj.id == last.target_id or not obj.position or not points or points <= 0 \
+                    or last.inventory + points > last.max_inventory:
+                continue
+            dist = last.from_scan[fields.cell(obj.position)]
+            if dist != UNREACHABLE and dist < others.get(points, dist + 1):
+                others[points] = dist
+        return others
+
+    # (posisi, id) target sebelumnya jika hasil scan diamond pasti sama untuk state ini, atau None.
+    # Syaratnya: diamond, teleport, dan inventori tidak berubah; bot maju satu langkah mendekati
+    # target; tidak ada bot lain yang lebih dekat ke target; dan skor target lebih tinggi dari
+    # batas atas skor diamond lain (jarak diamond lain berkurang paling banyak satu per langkah).
+    def reusable_target(self, board, me, fields, portals: bool, params) -> Optional[tuple]:
+        last = self._last
+        self._last = None
+        if last is None or last.name != me.properties.name or last.key != (portals, params):
+            return None
+        if last.diamond_hash != board.index.state_hash[0] or last.inventory != (me.properties.diamonds or 0):
+            return None
+        if params.distance_power <= 0:
+            return None
+        target = self._diamond(board, last.target_id)
+        if target is None:
+            return None
+        # Bot harus berpindah tepat satu langkah (bukan di-tackle) dan mendekati target
+        cell = fields.cell(me.position)
+        if cell not in fields.moves[last.cell].values():
+            return None
+        dist = fields.distance(me.position, target.position)
+        if dist <= 0 or dist != last.dist - 1:
+            return None
+        steps = last.steps + 1
+        score = params.score(target.properties.points, dist)
+        if last.others is None:
+            last.others = self._nearest_others(board, fields, last)
+        for points, other in last.others.items():
+            bound = max(0, other - steps)
+            if bound + params.distance_offset <= 0 or params.score(points, bound) >= score:
+                return None
+        # Target dilepas jika bot lain lebih dekat (aturan yang sama dengan find_best_diamond)
+        to_target = fields.field_to(target.position)
+        for bot in board.index.bots:
+            if bot.position and bot.properties.name != last.name:
+                other = to_target[fields.cell(bot.position)]
+                if other != UNREACHABLE and other < dist - params.contest_margin:
+                    return None
+        last.dist, last.cell, last.steps = dist, cell, steps
+        self._last = last
+        self.stats.reused += 1
+        self._count("memo_reuse")
+        return target.position, target.id
+
+    # Diamond dengan id tertentu di board (lewat slot indeks), atau None jika sudah hilang
+    @staticmethod
+    def _diamond(board, target_id: int):
+        if target_id < 0:
+            return None
+        slot = board.index.slots.get(target_id)
+        diamonds = board.index.diamonds
+        if slot is None or slot >= len(diamonds) or diamonds[slot].id != target_id:
+            return None
+        return diamonds[slot]
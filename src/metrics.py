@@ -0,0 +1,152 @@
+import os
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+# Instrumentasi per fase tick (http, json, decode, decide, sleep) dengan histogram
+# berbucket tetap per bot. Ekspor berkala ke file teks format Prometheus dan CSV.
+# Jika instrumentasi dimatikan, objek metrics bernilai None dan pemanggil hanya
+# melakukan satu pengecekan 'is not None' tanpa memanggil timer sama sekali.
+
+# Batas atas bucket histogram dalam milidetik (bucket terakhir = +Inf)
+BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Urutan fase dalam satu tick, dipakai untuk ringkasan dan ekspor
+PHASES = ("http", "json", "decode", "decide", "sleep")
+
+# Histogram latensi dengan bucket tetap (murah: satu bisect dan beberapa penjumlahan)
+class Histogram:
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0  # detik
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        self.counts[bisect_left(BUCKETS_MS, seconds * 1000)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    # Perkiraan persentil (ms): batas atas bucket yang memuat persentil tersebut
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max * 1000)
+        return self.max * 1000
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total / self.count * 1000 if self.count else 0.0
+
+# Metrik satu bot: histogram per fase dan counter bebas (misalnya retry, cache hit)
+class BotMetrics:
+    def __init__(self, bot: str):
+        self.bot = bot
+        self.phases: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+
+    def record(self, phase: str, seconds: float):
+        hist = self.phases.get(phase)
+        if hist is None:
+            hist = self.phases[phase] = Histogram()
+        hist.record(seconds)
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+# Kumpulan metrik semua bot dalam satu proses beserta ekspor berkalanya
+class MetricsRegistry:
+    def __init__(self, directory: Optional[str] = None, interval: float = 10.0, prefix: str = "complexity_bot"):
+        self.directory = directory
+        self.interval = interval
+        self.prefix = prefix
+        self.bots: Dict[str, BotMetrics] = {}
+        self._next_export = time.monotonic() + interval
+
+    def for_bot(self, bot: str) -> BotMetrics:
+        metrics = self.bots.get(bot)
+        if metrics is None:
+            metrics = self.bots[bot] = BotMetrics(bot)
+        return metrics
+
+    # Dipanggil sekali per tick: ekspor jika interval sudah lewat
+    def maybe_export(self, now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        if now >= self._next_export:
+            self._next_export = now + self.interval
+            self.export()
+
+    def _phase_names(self, metrics: BotMetrics) -> List[str]:
+        return [p for p in PHASES if p in metrics.phases] + sorted(set(metrics.phases) - set(PHASES))
+
+    # Teks format Prometheus (histogram kumulatif per bot dan fase)
+    def prometheus_text(self) -> str:
+        name = self.prefix + "_phase_seconds"
+        lines = [
+            "# HELP {} Latency of each tick phase.".format(name),
+            "# TYPE {} histogram".format(name),
+        ]
+        for metrics in self.bots.values():
+            for phase in self._phase_names(metrics):
+                hist = metrics.phases[phase]
+                labels = 'bot="{}",phase="{}"'.format(metrics.bot, phase)
+                cumulative = 0
+                for bound, count in zip(BUCKETS_MS, hist.counts):
+                    cumulative += count
+                    lines.append('{}_bucket{{{},le="{}"}} {}'.format(name, labels, bound / 1000, cumulative))
+                lines.append('{}_bucket{{{},le="+Inf"}} {}'.format(name, labels, hist.count))
+                lines.append("{}_sum{{{}}} {}".format(name, labels, hist.total))
+                lines.append("{}_count{{{}}} {}".format(name, labels, hist.count))
+
+        counter = self.prefix + "_events_total"
+        lines.append("# TYPE {} counter".format(counter))
+        for metrics in self.bots.values():
+            for key, value in sorted(metrics.counters.items()):
+                lines.append('{}{{bot="{}",event="{}"}} {}'.format(counter, metrics.bot, key, value))
+        return "\n".join(lines) + "\n"
+
+    # Tabel CSV ringkasan per bot dan fase
+    def csv_text(self) -> str:
+        rows = ["bot,phase,count,mean_ms,p50_ms,p99_ms,max_ms"]
+        for metrics in self.bots.values():
+            for phase in self._phase_names(metrics):
+                hist = metrics.phases[phase]
+                rows.append("{},{},{},{:.3f},{:.3f},{:.3f},{:.3f}".format(
+                    metrics.bot, phase, hist.count, hist.mean_ms,
+                    hist.quantile(0.5), hist.quantile(0.99), hist.max * 1000,
+                ))
+        return "\n".join(rows) + "\n"
+
+    # Tulis file ekspor secara atomik (tulis ke file sementara lalu rename)
+    def export(self):
+        if not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        for filename, text in (("metrics.prom", self.prometheus_text()), ("metrics.csv", self.csv_text())):
+            path = os.path.join(self.directory, filename)
+            with open(path + ".tmp", "w") as f:
+                f.write(text)
+            os.replace(path + ".tmp", path)
+
+    # Ringkasan yang dicetak di akhir permainan
+    def summary(self) -> str:
+        lines = []
+        for metrics in self.bots.values():
+            lines.append("[METRICS] {}".format(metrics.bot))
+            for phase in self._phase_names(metrics):
+                hist = metrics.phases[phase]
+                lines.append("  {:<8} n={:<6} mean={:.3f}ms p50<={:.3f}ms p99<={:.3f}ms max={:.3f}ms".format(
+                    phase, hist.count, hist.mean_ms, hist.quantile(0.5), hist.quantile(0.99), hist.max * 1000,
+                ))
+            for key, value in sorted(metrics.counters.items()):
+                lines.append("  {:<8} {}".format(key, value))
+        return "\n".join(lines)
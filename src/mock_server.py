@@ -0,0 +1,261 @@
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from synthetic import make_board_json, make_bot_json, make_tick_sequence
+
+# Server tiruan (stand-in) untuk endpoint Etimo yang dipakai oleh kelas Api.
+# Hanya memodelkan perpindahan bot, cukup untuk mengukur performa sisi klien.
+# Objek lain di board bisa statis, atau diputar ulang dari urutan state (rekaman .cbr
+# atau state sintetis) satu tick per minimumDelayBetweenMoves.
+
+DELTAS = {"NORTH": (0, -1), "SOUTH": (0, 1), "WEST": (-1, 0), "EAST": (1, 0)}
+
+# Kelas state permainan yang disimpan di memori server
+class MockGame:
+    def __init__(self, board: Optional[dict] = None, states: Optional[List[dict]] = None):
+        self.states = states  # Urutan state latar; None = board statis
+        self.board = board or (states[0] if states else make_board_json())
+        self.bots = {}  # token -> data bot (id, name, email, password, team)
+        self.own: Dict[str, dict] = {}  # nama -> objek bot klien yang di-overlay di atas state latar
+        self.requests = 0
+        self.moves: Dict[str, int] = {}  # nama -> jumlah langkah yang diterima
+        self.started = time.monotonic()
+        self.lock = threading.RLock()
+
+    # Board saat ini: board statis, atau state latar pada tick sekarang ditambah bot klien
+    def current(self) -> dict:
+        if self.states is None:
+            return self.board
+        tick_ms = max(1, self.board["minimumDelayBetweenMoves"])
+        state = self.states[int((time.monotonic() - self.started) * 1000 / tick_ms) % len(self.states)]
+        objects = [
+            obj for obj in state["gameObjects"]
+            if obj["type"] != "BotGameObject" or obj["properties"]["name"] not in self.own
+        ]
+        return dict(state, gameObjects=objects + list(self.own.values()))
+
+    # Mencari objek bot di board berdasarkan nama
+    def _bot_object(self, name: str) -> Optional[dict]:
+        if self.states is not None:
+            return self.own.get(name)
+        for obj in self.board["gameObjects"]:
+            if obj["type"] == "BotGameObject" and obj["properties"]["name"] == name:
+                return obj
+        return None
+
+    def register(self, body: dict):
+        with self.lock:
+            for bot in self.bots.values():
+                if bot["email"] == body.get("email") or bot["name"] == body.get("name"):
+                    return 409, {"message": "Bot already exists"}
+            token = str(uuid.uuid4())
+            self.bots[token] = dict(body, id=token)
+            return 200, {"data": {"id": token, "name": body.get("name"), "email": body.get("email")}}
+
+    def recover(self, body: dict):
+        with self.lock:
+            for bot in self.bots.values():
+                if bot["email"] == body.get("email") and bot["password"] == body.get("password"):
+                    return 201, {"data": {"id": bot["id"]}}
+            return 404, {"message": "Bot not found"}
+
+    def join(self, token: str):
+        with self.lock:
+            bot = self.bots.get(token)
+            if bot is None:
+                return 404, {"message": "Bot not found"}
+            if self._bot_object(bot["name"]) is None:
+                objects = self.board["gameObjects"]
+                base = {"x": 0, "y": 0}
+                if self.states is None:
+                    obj_id = max((o["id"] for o in objects), default=0) + 1
+                    objects.append(make_bot_json(obj_id, bot["name"], dict(base), base))
+                else:
+                    # Id di luar rentang id objek latar
+                    obj_id = 1_000_000 + len(self.own)
+                    self.own[bot["name"]] = make_bot_json(obj_id, bot["name"], dict(base), base)
+            return 200, {"data": self.current()}
+
+    def move(self, token: str, direction: str):
+        with self.lock:
+            bot = self.bots.get(token)
+            obj = self._bot_object(bot["name"]) if bot else None
+            if obj is None:
+                return 403, {"message": "Bot not on board"}
+            dx, dy = DELTAS.get(direction, (0, 0))
+            pos = obj["position"]
+            nx, ny = pos["x"] + dx, pos["y"] + dy
+            if not (0 <= nx < self.board["width"] and 0 <= ny < self.board["height"]):
+                return 400, {"message": "Move out of bounds"}
+            obj["position"] = {"x": nx, "y": ny}
+            self.moves[bot["name"]] = self.moves.get(bot["name"], 0) + 1
+            return 200, {"data": self.current()}
+
+    def board_json(self, board_id: str):
+        if str(self.board["id"]) != str(board_id):
+            return 404, {"message": "Board not found"}
+        return 200, {"data": self.current()}
+
+    # Statistik untuk load test: jumlah request dan langkah per bot sejak server dijalankan
+    def stats(self):
+        with self.lock:
+            return 200, {"data": {
+                "requests": self.requests,
+                "moves": dict(self.moves),
+                "uptime": time.monotonic() - self.started,
+            }}
+
+# Handler HTTP yang memetakan path ke method MockGame
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Mendukung keep-alive
+    disable_nagle_algorithm = True  # Header dan body dikirim terpisah, hindari delay Nagle
+    game: MockGame = None
+    fail_rate: float = 0.0  # Peluang gangguan per request (untuk menguji retry di sisi bot)
+    latency: float = 0.0  # Jeda tetap per request (detik), mensimulasikan jaringan dan server
+    jitter: float = 0.0  # Tambahan jeda acak 0..jitter (detik)
+
+    def log_message(self, format, *args):
+        pass
+
+    # Hitung request lalu tunggu latensi simulasi (server threaded, request lain tetap dilayani)
+    def _simulate_latency(self):
+        with self.game.lock:
+            self.game.requests += 1
+        delay = self.latency + (random.random() * self.jitter if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+
+    # Gangguan acak sebelum request diproses: koneksi diputus tanpa response atau status 503.
+    # True jika request tidak boleh diproses lagi.
+    def _inject_fault(self) -> bool:
+        if not self.fail_rate or random.random() >= self.fail_rate:
+            return False
+        if random.random() < 0.5:
+            self.close_connection = True
+            self.connection.shutdown(2)  # socket.SHUT_RDWR
+        else:
+            self._send(503, {"message": "Service unavailable"})
+        return True
+
+    def _send(self, status: int, payload):
+        # Serialisasi dilakukan di dalam lock agar board tidak berubah saat di-encode
+        with self.game.lock:
+            body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self):
+        self._body()  # Tetap baca body agar koneksi keep-alive tidak rusak
+        path = self.path.split("?")[0]
+        if path == "/api/mock/stats":
+            return self._send(*self.game.stats())
+        self._simulate_latency()
+        if self._inject_fault():
+            return
+        if path == "/api/boards":
+            return self._send(200, {"data": [self.game.current()]})
+        match = re.fullmatch(r"/api/boards/([^/]+)", path)
+        if match:
+            return self._send(*self.game.board_json(match.group(1)))
+        return self._send(404, {"message": "Not found"})
+
+    def do_POST(self):
+        body = self._body()
+        self._simulate_latency()
+        if self._inject_fault():
+            return
+        path = self.path.split("?")[0]
+        if path == "/api/bots":
+            return self._send(*self.game.register(body))
+        if path == "/api/bots/recover":
+            return self._send(*self.game.recover(body))
+        match = re.fullmatch(r"/api/bots/([^/]+)/join", path)
+        if match:
+            return self._send(*self.game.join(match.group(1)))
+        match = re.fullmatch(r"/api/bots/([^/]+)/move", path)
+        if match:
+            return self._send(*self.game.move(match.group(1), body.get("direction")))
+        return self._send(404, {"message": "Not found"})
+
+# Server HTTP threaded; koneksi yang diputus klien (bot dihentikan) bukan error
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+# Fungsi untuk membuat server (port 0 = pilih port kosong secara otomatis)
+def make_server(host: str = "127.0.0.1", port: int = 0, game: Optional[MockGame] = None,
+                fail_rate: float = 0.0, latency_ms: float = 0.0, jitter_ms: float = 0.0) -> MockServer:
+    handler = type("BoundMockHandler", (MockHandler,), {
+        "game": game or MockGame(),
+        "fail_rate": fail_rate,
+        "latency": latency_ms / 1000,
+        "jitter": jitter_ms / 1000,
+    })
+    return MockServer((host, port), handler)
+
+# Fungsi untuk menjalankan server di thread terpisah, mengembalikan (server, base_url)
+def start_in_thread(game: Optional[MockGame] = None):
+    server = make_server(game=game)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    return server, "http://{}:{}/api".format(host, port)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mock Etimo server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--delay", type=int, default=100)  # minimumDelayBetweenMoves (ms)
+    parser.add_argument("--fail-rate", type=float, default=0.0)  # Peluang request gagal (0..1)
+    parser.add_argument("--latency-ms", type=float, default=0.0)  # Jeda per request
+    parser.add_argument("--jitter-ms", type=float, default=0.0)   # Tambahan jeda acak per request
+    parser.add_argument("--width", type=int, default=15)
+    parser.add_argument("--height", type=int, default=15)
+    parser.add_argument("--diamonds", type=int, default=10)
+    parser.add_argument("--bots", type=int, default=2)            # Bot latar (bukan klien)
+    parser.add_argument("--teleports", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ticks", type=int, default=0)           # >0: state sintetis yang berubah tiap tick
+    parser.add_argument("--recording", default=None)              # Putar ulang state dari rekaman .cbr
+    args = parser.parse_args()
+
+    shape = dict(width=args.width, height=args.height, diamonds=args.diamonds, bots=args.bots,
+                 teleports=args.teleports, delay=args.delay)
+    if args.recording:
+        from recording import GameRecording
+        with GameRecording(args.recording) as recording:
+            states = list(recording)
+        for state in states:
+            state["minimumDelayBetweenMoves"] = args.delay
+        game = MockGame(states=states)
+    elif args.ticks > 0:
+        game = MockGame(states=make_tick_sequence(args.ticks, args.seed, **shape))
+    else:
+        game = MockGame(make_board_json(seed=args.seed, **shape))
+
+    server = make_server(args.host, args.port, game, args.fail_rate, args.latency_ms, args.jitter_ms)
+    print(f"[INFO] Mock server berjalan di http://{args.host}:{args.port}/api")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
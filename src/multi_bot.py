@@ -0,0 +1,588 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from dacite import from_dict
+
+from botlog import DEBUG, LEVELS, WARNING, logger
+from main import (
+    DEFAULT_PARAMS,
+    Board,
+    BoardStore,
+    Bot,
+    JSON_HEADERS,
+    MovePacer,
+    StrategyParams,
+    decode,
+    decode_board,
+    get_next_move,
+    load_params,
+    log_endpoint,
+    log_request,
+    log_response,
+    unwrap_data,
+)
+from memo import DecisionMemo
+from metrics import BotMetrics, MetricsRegistry
+from planner import RoutePlanner
+from recording import GameRecorder, recording_path
+from retry import DEFAULT_RETRY, CircuitBreaker, CircuitOpenError, RetryPolicy, RetryStats, TransientError
+from team import TeamCoordinator
+from tracker import OpponentTracker
+
+# Runner asyncio untuk menjalankan banyak bot dalam satu proses dan satu event loop.
+# Pengganti run-bots.sh: semua bot berbagi satu connection pool HTTP non-blocking.
+
+# Klien HTTP/1.1 non-blocking dengan pool koneksi keep-alive yang dipakai bersama
+class AsyncHttpClient:
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = 10,
+        connect_timeout: Optional[float] = 3.05,
+        read_timeout: Optional[float] = 10.0,
+        rtt_window: int = 1000,
+    ):
+        parsed = urlsplit(url)
+        self.host = parsed.hostname
+        self.port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        self.ssl = parsed.scheme == "https"
+        self.prefix = parsed.path.rstrip("/")
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.rtt_samples: Deque[float] = deque(maxlen=rtt_window)
+
+        # Header statis di-encode sekali
+        host_header = self.host if parsed.port is None else "{}:{}".format(self.host, self.port)
+        extra = "".join("{}: {}\r\n".format(k, v) for k, v in JSON_HEADERS.items())
+        self._header_tail = "Host: {}\r\n{}Connection: keep-alive\r\n".format(host_header, extra).encode()
+
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots = asyncio.Semaphore(pool_size)
+
+    # Ambil koneksi idle dari pool atau buka koneksi baru
+    async def _acquire(self):
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=self.ssl), self.connect_timeout
+        )
+        return reader, writer, False
+
+    # Membaca satu response HTTP (status, body mentah, apakah koneksi bisa dipakai ulang)
+    async def _read_response(self, reader: asyncio.StreamReader):
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Koneksi ditutup oleh server")
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            body = b"".join(chunks)
+        else:
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+        keep_alive = headers.get("connection", "").lower() != "close"
+        return status, body, keep_alive
+
+    # Fungsi generik untuk membuat request HTTP, mengembalikan (status, body mentah).
+    # 'read_timeout' menggantikan batas waktu response default untuk request ini.
+    async def request(self, method: str, endpoint: str, body: dict, read_timeout: Optional[float] = None):
+        data = json.dumps(body).encode()
+        head = "{} {}{} HTTP/1.1\r\nContent-Length: {}\r\n".format(
+            method.upper(), self.prefix, endpoint, len(data)
+        ).encode()
+        payload = head + self._header_tail + b"\r\n" + data
+
+        async with self._slots:
+            start = time.perf_counter()
+            for attempt in range(2):
+                reader, writer, reused = await self._acquire()
+                try:
+                    writer.write(payload)
+                    await writer.drain()
+                    status, resp, keep_alive = await asyncio.wait_for(
+                        self._read_response(reader), read_timeout or self.read_timeout
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    # Koneksi keep-alive yang sudah basi: coba sekali lagi dengan koneksi baru
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                break
+
+            if keep_alive:
+                self._idle.append((reader, writer))
+            else:
+                writer.close()
+            self.rtt_samples.append(time.perf_counter() - start)
+            return status, resp
+
+    # Menutup semua koneksi idle
+    async def close(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+# Gangguan transport dari AsyncHttpClient yang layak dicoba ulang
+TRANSPORT_ERRORS = (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError)
+
+# Versi async dari kelas Api. Satu AsyncApi per bot (untuk metrik per bot),
+# semua memakai klien HTTP (dan circuit breaker) yang sama
+@dataclass
+class AsyncApi:
+    client: AsyncHttpClient
+    metrics: Optional[BotMetrics] = None  # Jika diisi, waktu fase http/json/decode dicatat
+    recorder: Optional[GameRecorder] = None  # Jika diisi, setiap board state direkam ke file
+    store: Optional[BoardStore] = None  # Jika diisi, board di-decode inkremental (bisa dipakai bersama satu tim)
+    move_timeout: Optional[float] = None  # Batas waktu response move (None = read_timeout klien)
+    retry: RetryPolicy = DEFAULT_RETRY  # Retry request idempoten (lihat retry.py)
+    breaker: Optional[CircuitBreaker] = None  # None = breaker baru dengan setelan default
+
+    def __post_init__(self):
+        self.breaker = self.breaker or CircuitBreaker()
+        self.retry_stats = RetryStats()
+        self._rng = random.Random()
+
+    # Kirim request dengan retry untuk request idempoten (sama seperti Api._req di main.py)
+    async def _send(self, endpoint: str, method: str, body: dict, idempotent: bool, read_timeout: Optional[float]):
+        stats = self.retry_stats
+        stats.requests += 1
+        attempts = self.retry.attempts if idempotent else 1
+        for attempt in range(attempts):
+            wait = self.breaker.allow(time.monotonic())
+            if wait:
+                stats.rejected += 1
+                raise CircuitOpenError(wait)
+            trial = self.breaker.is_open  # Lolos saat breaker terbuka = request percobaan
+            start = time.perf_counter()
+            try:
+                status, content = await self.client.request(method, endpoint, body, read_timeout)
+                error = "status {}".format(status) if status >= 500 else None
+            except TRANSPORT_ERRORS as exc:
+                error = "{}: {}".format(type(exc).__name__, exc)
+            except BaseException:
+                # Dibatalkan (CancelledError) atau error lain: lepaskan slot percobaan breaker
+                if trial:
+                    self.breaker.release()
+                raise
+            elapsed = time.perf_counter() - start
+            if error is None:
+                self.breaker.success()
+                return status, content, elapsed
+
+            stats.lost_seconds += elapsed
+            if self.breaker.failure(time.monotonic()):
+                stats.breaker_opens += 1
+                logger.warning("Circuit breaker terbuka setelah %s kegagalan berturut-turut", self.breaker.failures)
+            # Breaker terbuka: tidak ada gunanya mencoba lagi sekarang
+            if attempt + 1 == attempts or self.breaker.is_open:
+                break
+            delay = self.retry.backoff(attempt, self._rng)
+            stats.retries += 1
+            stats.lost_seconds += delay
+            if self.metrics is not None:
+                self.metrics.count("retry")
+            logger.warning("<<< %s %s gagal (%s), coba lagi dalam %.0f ms", method, log_endpoint(endpoint), error,
+                           delay * 1000)
+            await asyncio.sleep(delay)
+
+        stats.failures += 1
+        if self.metrics is not None:
+            self.metrics.count("request_failed")
+        raise TransientError("{} {} gagal: {}".format(method, log_endpoint(endpoint), error))
+
+    async def _call(self, endpoint: str, method: str, body: dict, raw: bool = False, idempotent: bool = True,
+                    read_timeout: Optional[float] = None):
+        log_request(method, endpoint, body)
+        status, content, elapsed = await self._send(endpoint, method, body, idempotent, read_timeout)
+        log_response(endpoint, status, content)
+        if self.metrics is not None:
+            parsed_at = time.perf_counter()
+            self.metrics.record("http", elapsed)
+        try:
+            resp = json.loads(content) if content else None
+        except ValueError as exc:
+            raise TransientError("response {} tidak valid: {}".format(status, exc)) from exc
+        if self.metrics is not None:
+            self.metrics.record("json", time.perf_counter() - parsed_at)
+        if resp is None:
+            return None, status
+        data = unwrap_data(resp)
+        return (data if raw else decode(data)), status
+
+    # Decode board state dari response (inkremental lewat store jika tersedia)
+    def _board(self, raw: dict) -> Board:
+        if self.recorder is not None:
+            self.recorder.write(raw)
+        start = time.perf_counter() if self.metrics is not None else 0.0
+        board = self.store.update(raw) if self.store is not None else decode_board(raw)
+        if self.metrics is not None:
+            self.metrics.record("decode", time.perf_counter() - start)
+        return board
+
+    async def bots_register(self, name: str, email: str, password: str, team: str) -> Optional[Bot]:
+        resp, status = await self._call(
+            "/bots", "post", {"email": email, "name": name, "password": password, "team": team}, idempotent=False
+        )
+        return from_dict(Bot, resp) if status == 200 else None
+
+    async def bots_recover(self, email: str, password: str) -> Optional[str]:
+        try:
+            resp, status = await self._call("/bots/recover", "post", {"email": email, "password": password})
+        except TransientError as exc:
+            logger.warning("Recover gagal: %s", exc)
+            return None
+        return resp["id"] if status == 201 and isinstance(resp, dict) and "id" in resp else None
+
+    async def boards_list(self) -> Optional[List[Board]]:
+        resp, status = await self._call("/boards", "get", {}, raw=True)
+        return [decode_board(board) for board in resp] if status == 200 else None
+
+    async def boards_get(self, board_id) -> Optional[Board]:
+        resp, status = await self._call("/boards/{}".format(board_id), "get", {}, raw=True)
+        return self._board(resp) if status == 200 else None
+
+    async def bots_join(self, bot_token: str, board_id: int) -> bool:
+        _, status = await self._call(f"/bots/{bot_token}/join", "post", {"preferredBoardId": board_id},
+                                     idempotent=False)
+        return status == 200
+
+    # Move tidak idempoten: tidak diulang di sini, pemanggil mengambil ulang state lewat boards_get
+    async def bots_move(self, bot_token: str, direction: str) -> Optional[Board]:
+        try:
+            resp, status = await self._call("/bots/{}/move".format(bot_token), "post", {"direction": direction},
+                                            raw=True, idempotent=False, read_timeout=self.move_timeout)
+        except TransientError:
+            self.retry_stats.lost_moves += 1
+            if self.metrics is not None:
+                self.metrics.count("lost_move")
+            raise
+        return self._board(resp) if status == 200 else None
+
+# Konfigurasi satu bot dari file config
+@dataclass
+class BotConfig:
+    email: str
+    name: str
+    password: str = "123456"
+    team: str = "etimo"
+
+# Konfigurasi runner (dibaca dari file JSON)
+@dataclass
+class RunnerConfig:
+    url: str = "http://localhost:3000/api"
+    pool_size: int = 10
+    connect_timeout: float = 3.05
+    read_timeout: float = 10.0
+    teleport_portals: bool = False  # Rute boleh lewat teleport (lihat get_next_move)
+    pace_margin_ms: float = 5.0  # Cadangan waktu antar langkah (lihat MovePacer)
+    planner: bool = False  # Pakai perencana rute multi-diamond (lihat RoutePlanner)
+    plan_budget_ms: float = 5.0  # Batas waktu pencarian rute per tick per bot
+    memo: bool = False  # Memo keputusan per hash state board (lihat DecisionMemo)
+    memo_size: int = 256
+    tracker: bool = False  # Lacak lintasan lawan antar tick (lihat OpponentTracker)
+    params: Optional[dict] = None  # Parameter strategi (lihat StrategyParams / tournament.py)
+    params_file: Optional[str] = None  # File hasil tournament.py (parameter + planner), menggantikan 'params'
+    team: bool = False  # Semua bot satu tim: board bersama + pembagian diamond (lihat TeamCoordinator)
+    move_timeout: float = 2.0  # Batas waktu response move (detik)
+    retries: int = 3  # Percobaan per request idempoten (lihat RetryPolicy)
+    max_outage: float = 30.0  # Bot berhenti jika server tidak bisa dihubungi selama ini (detik)
+    bots: List[BotConfig] = field(default_factory=list)
+
+# Statistik hasil menjalankan semua bot
+@dataclass
+class RunnerStats:
+    moves: int = 0
+    missed: int = 0  # Langkah yang dikirim setelah deadline-nya lewat
+    elapsed: float = 0.0
+    per_bot: dict = field(default_factory=dict)
+    retries: dict = field(default_factory=dict)  # Statistik gangguan per bot (RetryStats.summary)
+    memo: dict = field(default_factory=dict)  # Statistik memo keputusan per bot (MemoStats.summary)
+    tracker: dict = field(default_factory=dict)  # Statistik pelacak lawan per bot (TrackerStats.summary)
+
+    @property
+    def moves_per_sec(self) -> float:
+        return self.moves / self.elapsed if self.elapsed else 0.0
+
+# Membaca file config JSON
+def load_config(path: str) -> RunnerConfig:
+    with open(path) as f:
+        raw = json.load(f)
+    raw["bots"] = [BotConfig(**b) for b in raw.get("bots", [])]
+    return RunnerConfig(**raw)
+
+# Login/daftar bot, mengembalikan token atau None
+async def login(api: AsyncApi, cfg: BotConfig) -> Optional[str]:
+    bot_id = await api.bots_recover(cfg.email, cfg.password)
+    if bot_id:
+        return bot_id
+    bot_obj = await api.bots_register(cfg.name, cfg.email, cfg.password, cfg.team)
+    return bot_obj.id if bot_obj else None
+
+# Ambil ulang board setelah gangguan sampai berhasil (menunggu breaker jika terbuka).
+# Mengembalikan (board, awal gangguan); board None jika gangguan lebih lama dari 'max_outage'.
+async def refetch(api: AsyncApi, board_id: int, exc: Exception, outage_since: Optional[float],
+                  max_outage: float) -> Tuple[Optional[Board], Optional[float]]:
+    outage_since = outage_since or time.monotonic()
+    while True:
+        if time.monotonic() - outage_since > max_outage:
+            logger.error("Server tidak bisa dihubungi selama %.0f detik, bot berhenti: %s", max_outage, exc)
+            return None, outage_since
+        logger.warning("Gangguan: %s; state diambil ulang", exc)
+        if isinstance(exc, CircuitOpenError):
+            api.retry_stats.lost_seconds += exc.retry_in
+            await asyncio.sleep(exc.retry_in)
+        try:
+            api.retry_stats.refetches += 1
+            return await api.boards_get(board_id), outage_since
+        except TransientError as error:
+            exc = error
+
+# Login, join board, dan ambil board pertama. Gangguan di tahap ini diulang seperti di loop
+# gerakan (menunggu breaker jika terbuka) sampai 'max_outage', sehingga satu bot yang gagal
+# startup tidak menghentikan bot lain. Join sendiri tidak diulang otomatis karena bisa saja
+# sudah diterapkan server walau response-nya hilang: keanggotaan dicek dari board terbaru, dan
+# join dikirim lagi hanya jika bot memang belum ada di board. Mengembalikan (token, board) atau None.
+async def start_bot(api: AsyncApi, cfg: BotConfig, board: Board,
+                    max_outage: float) -> Optional[Tuple[str, Optional[Board]]]:
+    outage_since: Optional[float] = None
+    bot_id: Optional[str] = None
+    current: Optional[Board] = board  # Board terakhir yang diketahui; None jika perlu diambil ulang
+    fresh = rejected = False
+    while True:
+        try:
+            if bot_id is None:
+                bot_id = await login(api, cfg)
+                if not bot_id:
+                    logger.error("%s: gagal mendaftar bot.", cfg.name)
+                    return None
+            if current is None:
+                current = await api.boards_get(board.id)
+                if current is None:
+                    return bot_id, None
+                fresh = True
+            if any(b.properties.name == cfg.name for b in current.bots):
+                return bot_id, current if fresh else await api.boards_get(board.id)
+            if rejected:
+                logger.error("%s: gagal join board.", cfg.name)
+                return None
+            current = None  # Apa pun hasil join, keanggotaan dicek dari board terbaru
+            rejected = not await api.bots_join(bot_id, board.id)
+        except TransientError as exc:
+            outage_since = outage_since or time.monotonic()
+            if time.monotonic() - outage_since > max_outage:
+                logger.error("%s: server tidak bisa dihubungi selama %.0f detik saat startup: %s",
+                             cfg.name, max_outage, exc)
+                return None
+            logger.warning("%s: gangguan saat startup: %s; dicoba lagi", cfg.name, exc)
+            if isinstance(exc, CircuitOpenError):
+                api.retry_stats.lost_seconds += exc.retry_in
+                await asyncio.sleep(exc.retry_in)
+
+# Task untuk satu bot: join board lalu jalankan loop gerakan dengan pacing sendiri
+async def run_bot(api: AsyncApi, cfg: BotConfig, board: Board, stats: RunnerStats,
+                  portals: bool = False, margin: float = 0.005, planner: Optional[RoutePlanner] = None,
+                  params: StrategyParams = DEFAULT_PARAMS, team: Optional[TeamCoordinator] = None,
+                  max_outage: float = 30.0, memo: Optional[DecisionMemo] = None,
+                  tracker: Optional[OpponentTracker] = None):
+    started = await start_bot(api, cfg, board, max_outage)
+    if started is None:
+        return
+    bot_id, board_state = started
+    bot_data = Bot(name=cfg.name, email=cfg.email, id=bot_id)
+
+    stats.per_bot[cfg.name] = 0
+    metrics = api.metrics
+    pacer = None
+    outage_since: Optional[float] = None
+    while board_state is not None:
+        if pacer is None:
+            pacer = MovePacer(board_state.minimum_delay_between_moves / 1000, margin)
+        pacer.period = board_state.minimum_delay_between_moves / 1000
+
+        start = time.perf_counter() if metrics is not None else 0.0
+        if team is not None:
+            # Board terbaru tim (bisa dari response bot lain yang lebih baru)
+            board_state = team.board or board_state
+            move_result = team.next_move(board_state, bot_data)
+        else:
+            move_result = get_next_move(board_state, bot_data, portals, planner, params, memo, tracker)
+        if metrics is not None:
+            metrics.record("decide", time.perf_counter() - start)
+        if not move_result:
+            # Tidak ada langkah, tunggu satu periode sebelum mencoba lagi
+            await asyncio.sleep(pacer.period)
+            try:
+                board_state = await api.boards_get(board.id)
+            except TransientError as exc:
+                board_state, outage_since = await refetch(api, board.id, exc, outage_since, max_outage)
+            pacer.reset()  # Periode diperbarui dari board di awal loop
+            continue
+
+        move, target = move_result
+        logger.debug("[MOVE] %s bergerak %s ke %s", cfg.name, move, target)
+
+        # Tunggu sisa waktu sampai langkah boleh dikirim
+        delay = pacer.remaining()
+        await asyncio.sleep(delay)
+        if metrics is not None:
+            metrics.record("sleep", delay)
+        late = pacer.mark_sent()
+        if late:
+            stats.missed += 1
+            logger.debug("[PACE] %s terlambat %.1f ms dari deadline", cfg.name, late * 1000)
+
+        try:
+            board_state = await api.bots_move(bot_id, move)
+            stats.moves += 1
+            stats.per_bot[cfg.name] += 1
+            outage_since = None
+        except TransientError as exc:
+            # Gangguan: bot tetap jalan, state diambil ulang lewat boards_get (idempoten)
+            board_state, outage_since = await refetch(api, board.id, exc, outage_since, max_outage)
+            pacer.reset()
+
+    logger.info("%s tidak lagi aktif. Permainan selesai.", cfg.name)
+
+# Ekspor metrik secara berkala di background
+async def export_periodically(registry: MetricsRegistry):
+    while True:
+        await asyncio.sleep(registry.interval)
+        registry.export()
+
+# Menjalankan semua bot dari config dalam satu event loop
+async def run_bots(config: RunnerConfig, duration: Optional[float] = None,
+                   registry: Optional[MetricsRegistry] = None, record_dir: Optional[str] = None) -> RunnerStats:
+    client = AsyncHttpClient(
+        config.url,
+        pool_size=config.pool_size,
+        connect_timeout=config.connect_timeout,
+        read_timeout=config.read_timeout,
+    )
+    api = AsyncApi(client)
+    stats = RunnerStats()
+
+    # Daftar board cukup diambil sekali untuk semua bot
+    boards = await api.boards_list()
+    if not boards:
+        logger.error("Tidak ada board tersedia.")
+        return stats
+
+    params = StrategyParams(**config.params) if config.params else DEFAULT_PARAMS
+    use_planner = config.planner
+    if config.params_file:
+        params, tuned_planner = load_params(config.params_file)
+        use_planner = use_planner or tuned_planner
+    team = TeamCoordinator(
+        [cfg.name for cfg in config.bots], config.teleport_portals, params
+    ) if config.team else None
+
+    # Satu AsyncApi per bot (pool koneksi tetap bersama) agar metrik dan rekaman terpisah.
+    # Dalam mode tim semua bot men-decode lewat BoardStore milik koordinator.
+    # Circuit breaker dipakai bersama: server yang mati berlaku untuk semua bot
+    breaker = CircuitBreaker()
+    retry = RetryPolicy(attempts=max(1, config.retries))
+    apis = [AsyncApi(
+        client,
+        registry.for_bot(cfg.name) if registry else None,
+        GameRecorder(recording_path(record_dir, cfg.name)) if record_dir else None,
+        team.store if team else None,
+        config.move_timeout,
+        retry,
+        breaker,
+    ) for cfg in config.bots]
+
+    memos = [DecisionMemo(config.memo_size, bot_api.metrics) if config.memo else None for bot_api in apis]
+    trackers = [OpponentTracker() if config.tracker else None for _ in apis]
+
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(run_bot(
+        bot_api, cfg, boards[0], stats, config.teleport_portals, config.pace_margin_ms / 1000,
+        RoutePlanner(config.plan_budget_ms) if use_planner else None, params, team, config.max_outage, memo,
+        tracker,
+    )) for bot_api, cfg, memo, tracker in zip(apis, config.bots, memos, trackers)]
+    exporter = asyncio.create_task(export_periodically(registry)) if registry else None
+    try:
+        await asyncio.wait_for(asyncio.gather(*tasks), duration)
+    except asyncio.TimeoutError:
+        pass
+    except Exception:
+        # Satu bot gagal: catat traceback beserta event terakhir lalu hentikan semua bot
+        logger.exception("Runner berhenti karena error")
+        for task in tasks:
+            task.cancel()
+    finally:
+        stats.elapsed = time.perf_counter() - start
+        if exporter is not None:
+            exporter.cancel()
+            registry.export()
+        for cfg, bot_api, memo, tracker in zip(config.bots, apis, memos, trackers):
+            stats.retries[cfg.name] = bot_api.retry_stats.summary()
+            if memo is not None:
+                stats.memo[cfg.name] = memo.stats.summary()
+            if tracker is not None:
+                stats.tracker[cfg.name] = tracker.stats.summary()
+            if bot_api.recorder is not None:
+                bot_api.recorder.close()
+        await client.close()
+    if team is not None:
+        logger.info("Tim: %s", team.stats)
+    return stats
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Complexity bot (multi bot, satu proses)")
+    parser.add_argument("--config", default="bots.json")        # File konfigurasi bot
+    parser.add_argument("--duration", type=float, default=None) # Batas waktu jalan (detik)
+    parser.add_argument("--verbose", action="store_true")       # Tampilkan setiap langkah dan request
+    parser.add_argument("--log-level", choices=list(LEVELS), default="info")
+    parser.add_argument("--quiet", action="store_true")         # Mode produksi: hanya warning/error
+    parser.add_argument("--metrics-dir", default=None)          # Aktifkan instrumentasi + folder ekspor
+    parser.add_argument("--metrics-interval", type=float, default=10.0)
+    parser.add_argument("--record-dir", default=None)           # Rekam board setiap bot ke folder ini
+    args = parser.parse_args()
+    logger.configure(WARNING if args.quiet else DEBUG if args.verbose else LEVELS[args.log_level])
+
+    config = load_config(args.config)
+    registry = MetricsRegistry(args.metrics_dir, args.metrics_interval) if args.metrics_dir else None
+    stats = asyncio.run(run_bots(config, args.duration, registry, args.record_dir))
+    if registry is not None:
+        logger.info("%s", registry.summary())
+    logger.info("%s langkah dalam %.1f detik (%.1f langkah/detik)", stats.moves, stats.elapsed, stats.moves_per_sec)
+    logger.info("%s langkah melewati deadline", stats.missed)
+    for name, summary in stats.retries.items():
+        logger.info("Retry %s: %s", name, summary)
+    for name, summary in stats.memo.items():
+        logger.info("Memo %s: %s", name, summary)
+    for name, summary in stats.tracker.items():
+        logger.info("Tracker %s: %s", name, summary)
+    logger.info("Selesai.")
+    logger.close()
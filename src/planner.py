@@ -0,0 +1,284 @@
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+# Perencana rute multi-diamond: mencari urutan pengambilan diamond yang berakhir di base,
+# dibatasi kapasitas inventori dan sisa waktu (milliseconds_left), dengan branch-and-bound.
+# Nilai sebuah rute = poin yang disetor / jumlah langkah sampai base (poin per langkah),
+# termasuk diamond yang sudah ada di inventori.
+#
+# Pencarian bersifat anytime: berhenti saat budget per tick habis dan memakai rute terbaik
+# yang sudah ditemukan. Budget berupa waktu (budget_ms), atau jumlah node (max_nodes) agar
+# hasilnya deterministik, tidak bergantung pada kecepatan/beban mesin (dipakai turnamen). Rencana dipakai ulang di tick berikutnya dan hanya dicari ulang jika
+# rencana rusak (diamond hilang/berpindah, inventori tidak sesuai, bot keluar jalur, diamond
+# pertama direbut bot lain, waktu tidak cukup) atau pencarian sebelumnya belum selesai.
+#
+# Modul ini tidak mengimpor main: board, bot, dan distance field dipakai secara duck-typed
+# (board.index, fields.field_to/field_from/cell seperti DistanceFields di main.py).
+
+UNREACHABLE = -1
+
+# Satu titik tujuan dalam rencana (diamond atau base)
+@dataclass
+class PlanStep:
+    id: int  # id diamond, -1 untuk base
+    position: object  # Position dari board
+    points: int = 0
+
+# Statistik perencana untuk evaluasi dan debugging
+@dataclass
+class PlannerStats:
+    searches: int = 0
+    complete: int = 0  # pencarian yang selesai sebelum budget habis
+    reused: int = 0  # tick yang memakai rencana lama tanpa mencari ulang
+    nodes: int = 0
+    search_ms: float = 0.0
+
+# Perencana untuk satu bot (menyimpan rencana antar tick)
+class RoutePlanner:
+    def __init__(self, budget_ms: float = 5.0, max_candidates: int = 12, safety_moves: int = 2,
+                 max_nodes: Optional[int] = None):
+        self.budget_ms = budget_ms
+        self.max_nodes = max_nodes  # Jika diisi, menggantikan budget waktu
+        self.max_candidates = max_candidates
+        self.safety_moves = safety_moves
+        self.plan: List[PlanStep] = []
+        self.stats = PlannerStats()
+        self._fields = None
+        self._inventory = 0
+        self._last_dist = None
+        self._complete = False
+
+    def reset(self):
+        self.plan = []
+        self._fields = None
+        self._last_dist = None
+        self._complete = False
+
+    # Tujuan berikutnya (posisi, id target) atau None jika tidak ada rute yang layak
+    def next_target(self, board, me, fields, now: Optional[float] = None) -> Optional[Tuple[object, int]]:
+        now = time.perf_counter() if now is None else now
+        props = me.properties
+        inventory = props.diamonds or 0
+        max_inventory = props.inventory_size or 5
+        base = props.base
+        if base is None:
+            return None
+        steps_left = self._steps_left(board, props)
+        my_cell = fields.cell(me.position)
+
+        valid = self._advance(board, me, fields, inventory, steps_left, my_cell)
+        if valid and self._complete:
+            self.stats.reused += 1
+        else:
+            incumbent = self.plan if valid else []
+            deadline = now + self.budget_ms / 1000 if self.max_nodes is None else float("inf")
+            self._search(board, me, fields, inventory, max_inventory, steps_left, incumbent, deadline)
+            self._fields = fields
+            self._inventory = inventory
+            self._last_dist = self._distance_to_next(fields, my_cell)
+        if not self.plan:
+            return None
+        step = self.plan[0]
+        return step.position, step.id
+
+    # Jumlah langkah yang masih bisa dilakukan sebelum waktu habis
+    def _steps_left(self, board, props) -> Optional[int]:
+        if props.milliseconds_left is None:
+            return None
+        delay = board.minimum_delay_between_moves or 100
+        return max(0, props.milliseconds_left // delay - self.safety_moves)
+
+    def _distance_to_next(self, fields, my_cell: int) -> Optional[int]:
+        if not self.plan:
+            return None
+        return fields.field_to(self.plan[0].position)[my_cell]
+
+    # Perbarui rencana lama dengan kondisi board sekarang; False jika rencana rusak
+    def _advance(self, board, me, fields, inventory: int, steps_left: Optional[int], my_cell: int) -> bool:
+        if not self.plan or fields is not self._fields:
+            return False
+        index = board.index
+
+        # Diamond pertama sudah diambil: inventori bertambah sesuai poinnya
+        first = self.plan[0]
+        if first.id != -1 and _find(index, first.id) is None:
+            if fields.cell(first.position) != my_cell or inventory != self._inventory + first.points:
+                return False
+            self.plan.pop(0)
+            self._inventory = inventory
+            self._last_dist = self._distance_to_next(fields, my_cell)
+        elif first.id == -1 and fields.cell(first.position) == my_cell:
+            return False  # Sudah di base: rencana selesai
+        if inventory != self._inventory:
+            return False  # Di-tackle atau mengambil diamond di luar rencana
+
+        # Semua diamond berikutnya masih ada di tempat yang sama
+        for step in self.plan:
+            if step.id == -1:
+                continue
+            obj = _find(index, step.id)
+            if obj is None or obj.position != step.position:
+                return False
+
+        # Bot tidak menjauh dari tujuan berikutnya (misalnya terkirim pulang karena tackle)
+        dist = self._distance_to_next(fields, my_cell)
+        if dist is None or dist == UNREACHABLE or (self._last_dist is not None and dist > self._last_dist):
+            return False
+        self._last_dist = dist
+
+        # Sisa rute masih muat dalam waktu yang tersisa
+        if steps_left is not None and self._route_steps(fields, my_cell) > steps_left:
+            return False
+
+        # Diamond pertama tidak boleh lebih dekat ke bot lain
+        if self.plan[0].id != -1:
+            target = fields.field_to(self.plan[0].position)
+            name = me.properties.name
+            for bot in index.bots:
+                if bot.position and bot.properties and bot.properties.name != name:
+                    rival = target[fields.cell(bot.position)]
+                    if rival != UNREACHABLE and rival < dist:
+                        return False
+        return True
+
+    # Total langkah rencana dari sel sekarang sampai base
+    def _route_steps(self, fields, my_cell: int) -> int:
+        total = 0
+        cell = my_cell
+        for step in self.plan:
+            dist = fields.field_to(step.position)[cell]
+            if dist == UNREACHABLE:
+                return 1 << 30
+            total += dist
+            cell = fields.cell(step.position)
+        return total
+
+    # Branch-and-bound dengan batas waktu. 'incumbent' adalah rencana lama yang masih valid
+    # (dipakai sebagai solusi awal yang harus dikalahkan).
+    def _search(self, board, me, fields, inventory: int, max_inventory: int, steps_left: Optional[int],
+                incumbent: List[PlanStep], deadline: float):
+        started = time.perf_counter()
+        self.stats.searches += 1
+        props = me.properties
+        my_cell = fields.cell(me.position)
+        base = props.base
+        to_base = fields.field_to(base)
+        from_me = fields.field_from(me.position)
+        limit = steps_left if steps_left is not None else 1 << 30
+        capacity = max_inventory - inventory
+
+        # Kandidat: diamond yang muat, bisa dicapai, dan bisa dibawa pulang sebelum waktu habis
+        candidates = []
+        for obj in board.index.diamonds:
+            points = obj.properties.points if obj.properties else None
+            if not obj.position or not points or points <= 0 or points > capacity:
+                continue
+            cell = fields.cell(obj.position)
+            dist = from_me[cell]
+            if cell == my_cell or dist == UNREACHABLE or to_base[cell] == UNREACHABLE:
+                continue
+            if dist + to_base[cell] > limit:
+                continue
+            candidates.append((points / (dist + 1), dist, cell, obj))
+        candidates.sort(key=lambda item: (-item[0], item[1]))
+
+        # Field per kandidat (jarak ke kandidat dari semua sel) dan jarak bot lain terdekat.
+        # Field dihitung selama budget masih ada (minimal satu); sisanya di-cache di 'fields'
+        # sehingga tick berikutnya bisa mempertimbangkan lebih banyak kandidat.
+        rivals_cells = [
+            fields.cell(bot.position) for bot in board.index.bots
+            if bot.position and bot.properties and bot.properties.name != props.name
+        ]
+        cells, objs, fields_to, rivals = [], [], [], []
+        for _, _, cell, obj in candidates[:self.max_candidates]:
+            if objs and time.perf_counter() >= deadline:
+                break
+            target = fields.field_to(obj.position)
+            near = [target[c] for c in rivals_cells if target[c] != UNREACHABLE]
+            cells.append(cell)
+            objs.append(obj)
+            fields_to.append(target)
+            rivals.append(min(near) if near else 1 << 30)
+        count = len(objs)
+        points = [obj.properties.points for obj in objs]
+        min_point = min(points) if points else 0
+
+        best_rate = -1.0
+        best_route: Optional[List[int]] = None
+        if incumbent:
+            steps = self._route_steps(fields, my_cell)
+            delivered = inventory + sum(step.points for step in incumbent)
+            if delivered > 0 and steps <= limit:
+                best_rate = delivered / max(1, steps)
+
+        nodes = 0
+        max_nodes = self.max_nodes if self.max_nodes is not None else 1 << 62
+        timed_out = False
+        route: List[int] = []
+
+        # DFS: cur = sel sekarang, steps = langkah sejauh ini, carried = poin di inventori
+        def expand(cur: int, steps: int, carried: int, used: int):
+            nonlocal best_rate, best_route, nodes, timed_out
+            nodes += 1
+            if nodes > max_nodes or (nodes & 63 == 0 and time.perf_counter() >= deadline):
+                timed_out = True
+                return
+
+            home = to_base[cur]
+            # Opsi: pulang sekarang
+            if carried > 0 and home != UNREACHABLE and steps + home <= limit:
+                rate = carried / max(1, steps + home)
+                if rate > best_rate:
+                    best_rate, best_route = rate, list(route)
+
+            # Batas atas: kapasitas sisa terisi penuh, langkah minimal = langsung pulang
+            room = max_inventory - carried
+            if room < min_point or home == UNREACHABLE:
+                return
+            if (carried + room) / max(1, steps + home) <= best_rate:
+                return
+
+            # Anak diurutkan dari poin per langkah terbaik
+            children = []
+            for i in range(count):
+                if used >> i & 1 or points[i] > room:
+                    continue
+                dist = fields_to[i][cur]
+                if dist == UNREACHABLE:
+                    continue
+                arrive = steps + dist
+                # Bot lain yang lebih dekat hanya dicek untuk diamond pertama (seperti strategi
+                # greedy); posisi bot lain untuk langkah yang lebih jauh tidak bisa diprediksi
+                if arrive + to_base[cells[i]] > limit or (not route and rivals[i] < arrive):
+                    continue
+                children.append((points[i] / max(1, dist), i, arrive))
+            children.sort(reverse=True)
+            for _, i, arrive in children:
+                route.append(i)
+                expand(cells[i], arrive, carried + points[i], used | (1 << i))
+                route.pop()
+                if timed_out:
+                    return
+
+        expand(my_cell, 0, inventory, 0)
+
+        if best_route is not None:
+            self.plan = [PlanStep(objs[i].id, objs[i].position, points[i]) for i in best_route]
+            self.plan.append(PlanStep(-1, base))
+        elif not incumbent:
+            self.plan = []
+        self._complete = not timed_out
+        self.stats.complete += not timed_out
+        self.stats.nodes += nodes
+        self.stats.search_ms += (time.perf_counter() - started) * 1000
+
+# Cari diamond berdasarkan id lewat slot indeks board (tanpa memindai semua objek)
+def _find(index, obj_id: int):
+    slot = index.slots.get(obj_id)
+    if slot is None:
+        return None
+    diamonds = index.of_type("DiamondGameObject")
+    if slot < len(diamonds) and diamonds[slot].id == obj_id:
+        return diamonds[slot]
+    return None
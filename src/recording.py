@@ -0,0 +1,570 @@
+import argparse
+import mmap
+import os
+import random
+import struct
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Rekaman permainan dalam format biner ringkas untuk post-mortem dan tuning strategi offline.
+# Yang direkam adalah board mentah (key camelCase, seperti hasil json.loads response server),
+# sehingga recorder tidak bergantung pada main dan bisa dipakai bersama atau tanpa BoardStore.
+#
+# Isi file:
+#   MAGIC, lalu satu record per tick: [panjang payload (varint)][jenis (1 byte)][payload]
+#   - keyframe (K): seluruh board, tabel string direset
+#   - delta (D): id yang dihapus, objek baru, perubahan posisi/properti, dan urutan objek
+#     jika berubah
+#   Saat ditutup: record indeks (I) berisi offset setiap tick, diikuti offset indeks (u64)
+#   dan FOOTER. Jika file tidak ditutup dengan benar, reader memindai record satu per satu.
+#
+# Nilai properti dikodekan dengan tag (None/bool/int/str/dict/list/float). String disimpan
+# sekali per segmen keyframe lalu dirujuk dengan nomor urut, sehingga delta satu tick
+# biasanya hanya beberapa byte per bot yang bergerak.
+
+MAGIC = b"CBREC\x01"
+FOOTER = b"CBRI"
+KEYFRAME, DELTA, INDEX = ord("K"), ord("D"), ord("I")
+
+# Tag nilai
+T_NONE, T_FALSE, T_TRUE, T_INT, T_STR, T_NEWSTR, T_DICT, T_FLOAT, T_LIST = range(9)
+
+# Bit flag pada record delta dan pada objek yang berubah
+F_TOP, F_ORDER = 1, 2
+U_POSITION, U_PROPERTIES, U_REPLACE = 1, 2, 4
+
+_F64 = struct.Struct("<d")
+_U64 = struct.Struct("<Q")
+
+# === ENCODING ===
+
+def _put_uint(buf: bytearray, n: int):
+    while n > 0x7F:
+        buf.append((n & 0x7F) | 0x80)
+        n >>= 7
+    buf.append(n)
+
+def _put_sint(buf: bytearray, n: int):
+    _put_uint(buf, (n << 1) if n >= 0 else ((-n << 1) - 1))
+
+# Tulis satu nilai JSON; string baru ditambahkan ke tabel string segmen aktif
+def _put_value(buf: bytearray, value, strings: Dict[str, int]):
+    if value is None:
+        buf.append(T_NONE)
+    elif value is True:
+        buf.append(T_TRUE)
+    elif value is False:
+        buf.append(T_FALSE)
+    elif isinstance(value, int):
+        buf.append(T_INT)
+        _put_sint(buf, value)
+    elif isinstance(value, str):
+        ref = strings.get(value)
+        if ref is None:
+            strings[value] = len(strings)
+            data = value.encode()
+            buf.append(T_NEWSTR)
+            _put_uint(buf, len(data))
+            buf += data
+        else:
+            buf.append(T_STR)
+            _put_uint(buf, ref)
+    elif isinstance(value, dict):
+        buf.append(T_DICT)
+        _put_uint(buf, len(value))
+        for key, item in value.items():
+            _put_value(buf, key, strings)
+            _put_value(buf, item, strings)
+    elif isinstance(value, float):
+        buf.append(T_FLOAT)
+        buf += _F64.pack(value)
+    else:
+        buf.append(T_LIST)
+        _put_uint(buf, len(value))
+        for item in value:
+            _put_value(buf, item, strings)
+
+# Satu objek board lengkap: id, tipe, x, y, properti
+def _put_object(buf: bytearray, obj_id: int, entry: tuple, strings: Dict[str, int]):
+    obj_type, x, y, properties = entry
+    _put_sint(buf, obj_id)
+    _put_value(buf, obj_type, strings)
+    _put_uint(buf, x)
+    _put_uint(buf, y)
+    _put_value(buf, properties, strings)
+
+# Perubahan properti: key yang diisi/berubah lalu key yang dihapus
+def _put_properties_diff(buf: bytearray, old: dict, new: dict, strings: Dict[str, int]):
+    changed = [(key, value) for key, value in new.items() if key not in old or old[key] != value]
+    removed = [key for key in old if key not in new]
+    _put_uint(buf, len(changed))
+    for key, value in changed:
+        _put_value(buf, key, strings)
+        _put_value(buf, value, strings)
+    _put_uint(buf, len(removed))
+    for key in removed:
+        _put_value(buf, key, strings)
+
+# Ubah board mentah menjadi (header, {id: (tipe, x, y, properti)}, urutan id)
+def _split_board(raw: dict) -> Tuple[dict, Dict[int, tuple], List[int]]:
+    top = {key: value for key, value in raw.items() if key != "gameObjects"}
+    objects = {}
+    order = []
+    for item in raw.get("gameObjects") or []:
+        position = item["position"]
+        objects[item["id"]] = (item["type"], position["x"], position["y"], item.get("properties"))
+        order.append(item["id"])
+    return top, objects, order
+
+# Penulis rekaman. Cukup panggil write(raw) untuk setiap board yang diterima lalu close().
+class GameRecorder:
+    def __init__(self, path: str, keyframe_interval: int = 256):
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._offset = len(MAGIC)
+        self._offsets: List[int] = []
+        self._since_keyframe = 0
+        self._strings: Dict[str, int] = {}
+        self._top: Optional[dict] = None
+        self._objects: Dict[int, tuple] = {}
+        self._order: List[int] = []
+        self._start = time.monotonic()
+
+    @property
+    def ticks(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def size(self) -> int:
+        return self._offset
+
+    def write(self, raw: dict, now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        top, objects, order = _split_board(raw)
+        buf = bytearray()
+        _put_uint(buf, int((now - self._start) * 1000))
+
+        # Keyframe untuk tick pertama, board lain, atau setelah keyframe_interval tick
+        board_changed = self._top is None or any(
+            top.get(key) != self._top.get(key) for key in ("id", "width", "height")
+        )
+        if board_changed or self._since_keyframe >= self.keyframe_interval:
+            kind = KEYFRAME
+            self._strings = {}
+            self._since_keyframe = 0
+            _put_value(buf, top, self._strings)
+            _put_uint(buf, len(order))
+            for obj_id in order:
+                _put_object(buf, obj_id, objects[obj_id], self._strings)
+        else:
+            kind = DELTA
+            self._put_delta(buf, top, objects, order)
+        self._since_keyframe += 1
+
+        self._top, self._objects, self._order = top, objects, order
+        self._append(kind, buf)
+
+    def _put_delta(self, buf: bytearray, top: dict, objects: Dict[int, tuple], order: List[int]):
+        previous = self._objects
+        strings = self._strings
+        removed = [obj_id for obj_id in self._order if obj_id not in objects]
+        added = []
+        updated = []
+        for obj_id in order:
+            entry = objects[obj_id]
+            old = previous.get(obj_id)
+            if old is None or old[0] != entry[0]:
+                if old is not None:
+                    removed.append(obj_id)  # Tipe berubah: hapus lalu tambahkan lagi
+                added.append(obj_id)
+            elif old != entry:
+                updated.append((obj_id, old, entry))
+
+        # Urutan hanya disimpan jika berbeda dari (urutan lama - dihapus) + ditambah
+        gone = set(removed)
+        expected = [obj_id for obj_id in self._order if obj_id not in gone] + added
+        flags = (F_TOP if top != self._top else 0) | (F_ORDER if expected != order else 0)
+
+        _put_uint(buf, flags)
+        if flags & F_TOP:
+            _put_value(buf, top, strings)
+        _put_uint(buf, len(removed))
+        for obj_id in removed:
+            _put_sint(buf, obj_id)
+        _put_uint(buf, len(added))
+        for obj_id in added:
+            _put_object(buf, obj_id, objects[obj_id], strings)
+        _put_uint(buf, len(updated))
+        for obj_id, old, new in updated:
+            mask = U_POSITION if old[1:3] != new[1:3] else 0
+            if old[3] != new[3]:
+                both_dicts = isinstance(old[3], dict) and isinstance(new[3], dict)
+                mask |= U_PROPERTIES if both_dicts else U_REPLACE
+            _put_sint(buf, obj_id)
+            buf.append(mask)
+            if mask & U_POSITION:
+                _put_uint(buf, new[1])
+                _put_uint(buf, new[2])
+            if mask & U_PROPERTIES:
+                _put_properties_diff(buf, old[3], new[3], strings)
+            elif mask & U_REPLACE:
+                _put_value(buf, new[3], strings)
+        if flags & F_ORDER:
+            _put_uint(buf, len(order))
+            for obj_id in order:
+                _put_sint(buf, obj_id)
+
+    def _append(self, kind: int, payload: bytearray):
+        head = bytearray()
+        _put_uint(head, len(payload))
+        head.append(kind)
+        self._file.write(head)
+        self._file.write(payload)
+        if kind != INDEX:
+            self._offsets.append(self._offset)
+        self._offset += len(head) + len(payload)
+        if kind == KEYFRAME:
+            self._file.flush()
+
+    # Tulis indeks offset dan footer lalu tutup file
+    def close(self):
+        if self._file.closed:
+            return
+        index_offset = self._offset
+        buf = bytearray()
+        _put_uint(buf, len(self._offsets))
+        last = 0
+        for offset in self._offsets:
+            _put_uint(buf, offset - last)
+            last = offset
+        self._append(INDEX, buf)
+        self._file.write(_U64.pack(index_offset) + FOOTER)
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# Nama file rekaman untuk satu bot dalam satu permainan
+def recording_path(directory: str, name: str) -> str:
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, "{}-{}.cbr".format(name, time.strftime("%Y%m%d-%H%M%S")))
+
+# === DECODING ===
+
+# Pembaca nilai dari buffer hasil mmap
+class _Cursor:
+    __slots__ = ("data", "pos", "strings")
+
+    def __init__(self, data, pos: int, strings: List[str]):
+        self.data = data
+        self.pos = pos
+        self.strings = strings
+
+    def uint(self) -> int:
+        data = self.data
+        result = shift = 0
+        while True:
+            byte = data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def sint(self) -> int:
+        n = self.uint()
+        return (n >> 1) if not n & 1 else -((n + 1) >> 1)
+
+    def value(self):
+        tag = self.data[self.pos]
+        self.pos += 1
+        if tag == T_INT:
+            return self.sint()
+        if tag == T_STR:
+            return self.strings[self.uint()]
+        if tag == T_NEWSTR:
+            size = self.uint()
+            text = bytes(self.data[self.pos:self.pos + size]).decode()
+            self.pos += size
+            self.strings.append(text)
+            return text
+        if tag == T_DICT:
+            result = {}
+            for _ in range(self.uint()):
+                key = self.value()
+                result[key] = self.value()
+            return result
+        if tag == T_NONE:
+            return None
+        if tag == T_TRUE:
+            return True
+        if tag == T_FALSE:
+            return False
+        if tag == T_FLOAT:
+            value = _F64.unpack_from(self.data, self.pos)[0]
+            self.pos += 8
+            return value
+        if tag == T_LIST:
+            return [self.value() for _ in range(self.uint())]
+        raise ValueError("Tag nilai tidak dikenal: {}".format(tag))
+
+    def object(self) -> Tuple[int, tuple]:
+        obj_id = self.sint()
+        obj_type = self.value()
+        x = self.uint()
+        y = self.uint()
+        return obj_id, (obj_type, x, y, self.value())
+
+# State board hasil rekonstruksi sampai tick tertentu
+@dataclass
+class _State:
+    tick: int
+    elapsed_ms: int
+    strings: List[str]
+    top: dict
+    objects: Dict[int, tuple]
+    order: List[int]
+
+    # Board mentah dalam format response server. Dict properti dipakai bersama antar
+    # tick (tidak pernah diubah di tempat), jadi hasilnya jangan dimodifikasi.
+    def raw(self) -> dict:
+        board = dict(self.top)
+        objects = self.objects
+        board["gameObjects"] = [
+            {
+                "id": obj_id,
+                "position": {"x": objects[obj_id][1], "y": objects[obj_id][2]},
+                "type": objects[obj_id][0],
+                "properties": objects[obj_id][3],
+            }
+            for obj_id in self.order
+        ]
+        return board
+
+# Pembaca rekaman: file di-mmap, indeks offset dibaca dari footer (atau dipindai ulang),
+# dan tick mana pun direkonstruksi dari keyframe terdekat sebelum tick tersebut
+class GameRecording:
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError("Bukan file rekaman: {}".format(path))
+        self.offsets = self._read_index() or self._scan()
+        self.keyframes = [tick for tick, offset in enumerate(self.offsets) if self._kind(offset) == KEYFRAME]
+        self._state: Optional[_State] = None
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    # Header record: (jenis, awal payload, akhir payload)
+    def _record(self, offset: int) -> Tuple[int, int, int]:
+        cursor = _Cursor(self._map, offset, [])
+        size = cursor.uint()
+        return self._map[cursor.pos], cursor.pos + 1, cursor.pos + 1 + size
+
+    def _kind(self, offset: int) -> int:
+        return self._record(offset)[0]
+
+    def _read_index(self) -> Optional[List[int]]:
+        data = self._map
+        tail = len(FOOTER) + _U64.size
+        if len(data) < len(MAGIC) + tail or data[-len(FOOTER):] != FOOTER:
+            return None
+        index_offset = _U64.unpack_from(data, len(data) - tail)[0]
+        kind, start, _ = self._record(index_offset)
+        if kind != INDEX:
+            return None
+        cursor = _Cursor(data, start, [])
+        offsets = []
+        last = 0
+        for _ in range(cursor.uint()):
+            last += cursor.uint()
+            offsets.append(last)
+        return offsets
+
+    # Pindai record satu per satu (file yang tidak ditutup, misalnya bot crash)
+    def _scan(self) -> List[int]:
+        offsets = []
+        offset = len(MAGIC)
+        end = len(self._map)
+        while offset < end:
+            try:
+                kind, _, record_end = self._record(offset)
+            except IndexError:
+                break
+            if record_end > end or kind not in (KEYFRAME, DELTA):
+                break
+            offsets.append(offset)
+            offset = record_end
+        # Record pertama harus keyframe; buang delta yang tidak punya keyframe
+        return offsets if offsets and self._kind(offsets[0]) == KEYFRAME else []
+
+    def _apply(self, tick: int, state: Optional[_State]) -> _State:
+        kind, start, _ = self._record(self.offsets[tick])
+        if kind == KEYFRAME:
+            cursor = _Cursor(self._map, start, [])
+            elapsed_ms = cursor.uint()
+            top = cursor.value()
+            objects = {}
+            order = []
+            for _ in range(cursor.uint()):
+                obj_id, entry = cursor.object()
+                objects[obj_id] = entry
+                order.append(obj_id)
+            return _State(tick, elapsed_ms, cursor.strings, top, objects, order)
+
+        cursor = _Cursor(self._map, start, state.strings)
+        elapsed_ms = cursor.uint()
+        flags = cursor.uint()
+        top = cursor.value() if flags & F_TOP else state.top
+        objects = dict(state.objects)
+        removed = set()
+        for _ in range(cursor.uint()):
+            obj_id = cursor.sint()
+            removed.add(obj_id)
+            objects.pop(obj_id, None)
+        added = []
+        for _ in range(cursor.uint()):
+            obj_id, entry = cursor.object()
+            objects[obj_id] = entry
+            added.append(obj_id)
+        for _ in range(cursor.uint()):
+            obj_id = cursor.sint()
+            mask = self._map[cursor.pos]
+            cursor.pos += 1
+            obj_type, x, y, properties = objects[obj_id]
+            if mask & U_POSITION:
+                x = cursor.uint()
+                y = cursor.uint()
+            if mask & U_PROPERTIES:
+                properties = dict(properties)
+                for _ in range(cursor.uint()):
+                    key = cursor.value()
+                    properties[key] = cursor.value()
+                for _ in range(cursor.uint()):
+                    del properties[cursor.value()]
+            elif mask & U_REPLACE:
+                properties = cursor.value()
+            objects[obj_id] = (obj_type, x, y, properties)
+        if flags & F_ORDER:
+            order = [cursor.sint() for _ in range(cursor.uint())]
+        else:
+            order = [obj_id for obj_id in state.order if obj_id not in removed] + added
+        return _State(tick, elapsed_ms, state.strings, top, objects, order)
+
+    # State pada tick tertentu; melanjutkan dari state terakhir jika masih satu segmen
+    def _state_at(self, tick: int) -> _State:
+        if not 0 <= tick < len(self.offsets):
+            raise IndexError("Tick {} di luar rekaman ({} tick)".format(tick, len(self.offsets)))
+        keyframe = self.keyframes[bisect_right(self.keyframes, tick) - 1]
+        state = self._state
+        if state is None or not keyframe <= state.tick <= tick:
+            state = self._apply(keyframe, None)
+        while state.tick < tick:
+            state = self._apply(state.tick + 1, state)
+        self._state = state
+        return state
+
+    # Board mentah pada tick tertentu
+    def raw(self, tick: int) -> dict:
+        return self._state_at(tick).raw()
+
+    # Milidetik sejak awal rekaman saat board tick tersebut diterima
+    def elapsed_ms(self, tick: int) -> int:
+        return self._state_at(tick).elapsed_ms
+
+    # Board ter-decode pada tick tertentu
+    def board(self, tick: int):
+        from main import decode_board
+        return decode_board(self.raw(tick))
+
+    def __iter__(self) -> Iterator[dict]:
+        for tick in range(len(self.offsets)):
+            yield self.raw(tick)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# === REPLAY ===
+
+# Satu langkah replay: keputusan strategi saat ini vs langkah yang terlihat di rekaman
+@dataclass
+class ReplayStep:
+    tick: int
+    decided: Optional[str]
+    target: Optional[int]
+    observed: Optional[str]  # Arah dari posisi tick ini ke tick berikutnya (None jika diam/teleport)
+    decide_ms: float
+
+# Jalankan ulang get_next_move untuk bot bernama `name` pada setiap tick rekaman
+def replay(recording: GameRecording, name: str, portals: bool = False, seed: Optional[int] = 0) -> List[ReplayStep]:
+    from main import DIRECTION_DELTAS, Bot, BoardStore, get_next_move
+
+    if seed is not None:
+        random.seed(seed)
+    directions = {delta: direction for direction, delta in DIRECTION_DELTAS.items()}
+    bot_data = Bot(name=name, email="", id="")
+    store = BoardStore()
+    steps = []
+    positions = []
+    for tick, raw in enumerate(recording):
+        board = store.update(raw)
+        me = board.get_bot(bot_data)
+        positions.append((me.position.x, me.position.y) if me else None)
+        if me is None:
+            continue
+        start = time.perf_counter()
+        result = get_next_move(board, bot_data, portals)
+        elapsed = (time.perf_counter() - start) * 1000
+        decided, target = result if result else (None, None)
+        steps.append(ReplayStep(tick, decided, target, None, elapsed))
+
+    # Langkah yang teramati: selisih posisi bot antara dua tick berurutan
+    for step in steps:
+        if step.tick + 1 < len(positions) and positions[step.tick + 1] and positions[step.tick]:
+            (x0, y0), (x1, y1) = positions[step.tick], positions[step.tick + 1]
+            step.observed = directions.get((x1 - x0, y1 - y0))
+    return steps
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Baca dan replay rekaman permainan")
+    parser.add_argument("path")
+    parser.add_argument("--tick", type=int, default=None)       # Cetak board pada tick ini
+    parser.add_argument("--replay", default=None)               # Nama bot yang keputusannya diulang
+    parser.add_argument("--teleport-portals", action="store_true")
+    args = parser.parse_args()
+
+    with GameRecording(args.path) as recording:
+        print("[INFO] {} tick, {} keyframe, {} byte ({:.1f} byte/tick)".format(
+            len(recording), len(recording.keyframes), os.path.getsize(args.path),
+            os.path.getsize(args.path) / max(1, len(recording)),
+        ))
+        if args.tick is not None:
+            raw = recording.raw(args.tick)
+            print("[TICK {}] +{} ms, {} objek".format(args.tick, recording.elapsed_ms(args.tick), len(raw["gameObjects"])))
+            for item in raw["gameObjects"]:
+                print("  {id:>6} {type:<24} ({x}, {y}) {properties}".format(**item, **item["position"]))
+        if args.replay:
+            steps = replay(recording, args.replay, args.teleport_portals)
+            observed = [s for s in steps if s.observed]
+            same = sum(1 for s in observed if s.decided == s.observed)
+            print("[REPLAY] {}: {} keputusan, {}/{} sama dengan langkah terekam, rata-rata {:.3f} ms".format(
+                args.replay, len(steps), same, len(observed),
+                sum(s.decide_ms for s in steps) / max(1, len(steps)),
+            ))
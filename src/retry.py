@@ -0,0 +1,109 @@
+import random
+from dataclasses import dataclass
+from typing import Optional
+
+# Kebijakan retry untuk request ke server: backoff eksponensial terbatas dengan jitter,
+# circuit breaker, dan statistik berapa banyak request, langkah, dan waktu yang hilang
+# karena gangguan. Modul ini tidak bergantung pada library HTTP, sehingga Api (requests)
+# dan AsyncApi (asyncio) memakai logika yang sama.
+#
+# Hanya request idempoten (GET, recover, join) yang diulang di level transport. Move yang
+# gagal tidak dikirim ulang (bisa saja sudah diproses server); loop bot mengambil ulang
+# state lewat boards_get lalu memutuskan langkah baru.
+
+# Gangguan sementara (koneksi putus, timeout, status 5xx, body rusak) setelah retry habis
+class TransientError(Exception):
+    pass
+
+# Request ditolak tanpa dikirim karena circuit breaker sedang terbuka
+class CircuitOpenError(TransientError):
+    def __init__(self, retry_in: float):
+        super().__init__("circuit breaker terbuka, coba lagi dalam {:.0f} ms".format(retry_in * 1000))
+        self.retry_in = retry_in
+
+# Jumlah percobaan dan jeda antar percobaan
+@dataclass(frozen=True)
+class RetryPolicy:
+    attempts: int = 3  # Total percobaan per request idempoten (termasuk yang pertama)
+    base_delay: float = 0.05  # Jeda sebelum retry pertama (detik), dikali 2 setiap retry
+    max_delay: float = 1.0  # Batas atas jeda
+    jitter: float = 0.5  # Bagian jeda yang diacak, agar banyak bot tidak retry bersamaan
+
+    def backoff(self, attempt: int, rng: random.Random) -> float:
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * (1 - self.jitter * rng.random())
+
+DEFAULT_RETRY = RetryPolicy()
+
+# Circuit breaker: setelah 'threshold' kegagalan berturut-turut, request ditolak langsung selama
+# 'reset_timeout' detik. Setelah itu satu request percobaan boleh lewat (half-open); jika berhasil
+# breaker tertutup lagi, jika gagal breaker terbuka lagi.
+class CircuitBreaker:
+    def __init__(self, threshold: int = 5, reset_timeout: float = 2.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    # 0 jika request boleh dikirim, atau sisa waktu (detik) sampai boleh mencoba lagi
+    def allow(self, now: float) -> float:
+        if self.opened_at is None:
+            return 0.0
+        remaining = self.opened_at + self.reset_timeout - now
+        if remaining > 0:
+            return remaining
+        if self._trial:
+            # Request percobaan lain sedang berjalan (beberapa bot berbagi breaker)
+            return self.reset_timeout / 4
+        self._trial = True
+        return 0.0
+
+    # Request percobaan berakhir tanpa hasil (exception selain gangguan transport, misalnya
+    # dibatalkan atau KeyboardInterrupt): request berikutnya boleh menjadi percobaan baru.
+    # Tanpa ini breaker terkunci selamanya karena success/failure tidak pernah dipanggil.
+    def release(self):
+        self._trial = False
+
+    def success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+
+    # Catat kegagalan; True jika breaker baru saja terbuka
+    def failure(self, now: float) -> bool:
+        self.failures += 1
+        if self._trial or (self.opened_at is None and self.failures >= self.threshold):
+            was_open = self.opened_at is not None
+            self.opened_at = now
+            self._trial = False
+            return not was_open
+        return False
+
+# Statistik gangguan selama permainan
+@dataclass
+class RetryStats:
+    requests: int = 0
+    retries: int = 0  # Percobaan ulang request idempoten
+    failures: int = 0  # Request yang tetap gagal setelah retry habis
+    rejected: int = 0  # Request yang ditolak circuit breaker tanpa dikirim
+    breaker_opens: int = 0
+    refetches: int = 0  # boards_get untuk mengambil ulang state setelah gangguan
+    lost_moves: int = 0  # Langkah yang gagal dikirim
+    lost_seconds: float = 0.0  # Waktu untuk request gagal, jeda backoff, dan menunggu breaker
+
+    def summary(self) -> dict:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "breaker_opens": self.breaker_opens,
+            "refetches": self.refetches,
+            "lost_moves": self.lost_moves,
+            "lost_ms": round(self.lost_seconds * 1000, 1),
+        }
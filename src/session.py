@@ -0,0 +1,62 @@
+import json
+import os
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+# Cache sesi bot di disk untuk fast start: token bot dan id board terakhir disimpan per
+# (url, email), sehingga bot yang di-restart tidak perlu recover/register dan list board lagi.
+# Password tidak disimpan. Beberapa bot boleh memakai file yang sama (entry per email).
+
+DEFAULT_SESSION_FILE = ".cbot_session.json"
+
+# Data sesi satu bot
+@dataclass
+class BotSession:
+    url: str
+    email: str
+    name: str
+    bot_id: str
+    board_id: int
+
+def _key(url: str, email: str) -> str:
+    return "{} {}".format(url, email)
+
+# Baca seluruh isi file sesi (kosong jika file tidak ada atau rusak)
+def _read(path: str) -> dict:
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+# Tulis file sesi secara atomik (file sementara lalu os.replace), hanya bisa dibaca pemilik
+def _write(path: str, data: dict):
+    tmp = "{}.{}.tmp".format(path, os.getpid())
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+    os.replace(tmp, path)
+
+# Ambil sesi tersimpan untuk bot ini (None jika belum ada atau nama bot berbeda)
+def load_session(path: str, url: str, email: str, name: str) -> Optional[BotSession]:
+    entry = _read(path).get(_key(url, email))
+    if not isinstance(entry, dict):
+        return None
+    try:
+        session = BotSession(**entry)
+    except TypeError:
+        return None
+    return session if session.name == name else None
+
+def save_session(path: str, session: BotSession):
+    data = _read(path)
+    data[_key(session.url, session.email)] = asdict(session)
+    _write(path, data)
+
+# Hapus sesi yang ternyata tidak berlaku lagi (token ditolak server)
+def forget_session(path: str, url: str, email: str):
+    data = _read(path)
+    if data.pop(_key(url, email), None) is not None:
+        _write(path, data)
@@ -0,0 +1,306 @@
+import argparse
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from main import (
+    DIRECTION_DELTAS,
+    Base,
+    Board,
+    Bot,
+    Config,
+    Feature,
+    GameObject,
+    Position,
+    Properties,
+    get_next_move,
+)
+from memo import DecisionMemo, MemoStats
+from tracker import OpponentTracker, TrackerStats
+from planner import RoutePlanner
+from team import TeamCoordinator
+
+# Simulator lokal (tanpa HTTP) untuk aturan board yang dimodelkan bot: diamond dengan poin,
+# inventory_size, base, teleport, tackle, dan rasio generate diamond dari Config.
+# Deterministik untuk seed yang sama, sehingga strategi bisa dibandingkan secara offline.
+
+# Strategi menerima board dan data bot, mengembalikan (arah, target) seperti get_next_move
+Strategy = Callable[[Board, Bot], Optional[Tuple[str, int]]]
+
+# Konfigurasi permainan (nilai default mengikuti board standar Etimo)
+@dataclass
+class SimConfig:
+    width: int = 15
+    height: int = 15
+    seconds: int = 60
+    delay: int = 100  # minimum_delay_between_moves (ms), satu tick = satu langkah per bot
+    inventory_size: int = 5
+    can_tackle: bool = True
+    generation_ratio: float = 0.1
+    min_ratio_for_generation: float = 0.01
+    red_ratio: float = 0.2
+    teleport_pairs: int = 1
+    diamond_button: bool = True
+
+    @property
+    def ticks(self) -> int:
+        return self.seconds * 1000 // self.delay
+
+    # Fitur board dalam bentuk yang sama dengan response server
+    def features(self) -> List[Feature]:
+        return [
+            Feature("DiamondProvider", Config(
+                generation_ratio=self.generation_ratio,
+                min_ratio_for_generation=self.min_ratio_for_generation,
+                red_ratio=self.red_ratio,
+            )),
+            Feature("TeleportProvider", Config(pairs=self.teleport_pairs)),
+            Feature("BotProvider", Config(inventory_size=self.inventory_size, can_tackle=self.can_tackle)),
+            Feature("TimerProvider", Config(seconds=self.seconds)),
+        ]
+
+# State satu bot di dalam simulator
+@dataclass
+class SimBot:
+    object_id: int
+    base_id: int
+    name: str
+    strategy: Strategy
+    base: Tuple[int, int]
+    position: Tuple[int, int]
+    diamonds: int = 0
+    score: int = 0
+    tackles: int = 0
+
+# Hasil satu permainan
+@dataclass
+class GameResult:
+    seed: int
+    ticks: int
+    elapsed: float
+    scores: Dict[str, int]
+    decision_times: List[float] = field(default_factory=list)
+
+    @property
+    def ticks_per_sec(self) -> float:
+        return self.ticks / self.elapsed if self.elapsed else 0.0
+
+    # Persentil latensi keputusan dalam milidetik
+    def decision_ms(self, q: float) -> float:
+        samples = sorted(self.decision_times)
+        if not samples:
+            return 0.0
+        return samples[min(len(samples) - 1, int(len(samples) * q))] * 1000
+
+# Simulator board
+class LocalGame:
+    def __init__(self, config: SimConfig, strategies: Dict[str, Strategy], seed: int = 0):
+        self.config = config
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.tick = 0
+        self._next_id = 1
+
+        self.bots: List[SimBot] = []
+        self.diamonds: Dict[Tuple[int, int], Tuple[int, int]] = {}  # sel -> (id, poin)
+        self.teleports: Dict[Tuple[int, int], Tuple[int, str]] = {}  # sel -> (id, pair_id)
+        self.teleport_links: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        self.button: Optional[Tuple[int, Tuple[int, int]]] = None  # (id, sel)
+
+        for name, strategy in strategies.items():
+            base = self._free_cell()
+            self.bots.append(SimBot(self._new_id(), self._new_id(), name, strategy, base, base))
+
+        for pair in range(config.teleport_pairs):
+            a, b = self._free_cell(), self._free_cell()
+            self.teleports[a] = (self._new_id(), str(pair))
+            self.teleports[b] = (self._new_id(), str(pair))
+            self.teleport_links[a], self.teleport_links[b] = b, a
+
+        self._generate_diamonds()
+        if config.diamond_button:
+            self.button = (self._new_id(), self._free_cell())
+
+    def _new_id(self) -> int:
+        self._next_id += 1
+        return self._next_id - 1
+
+    # Sel yang sedang ditempati objek apa pun
+    def _occupied(self) -> set:
+        used = {bot.position for bot in self.bots} | {bot.base for bot in self.bots}
+        used |= self.diamonds.keys() | self.teleports.keys()
+        if self.button:
+            used.add(self.button[1])
+        return used
+
+    def _free_cell(self) -> Tuple[int, int]:
+        used = self._occupied()
+        while True:
+            cell = (self.rng.randrange(self.config.width), self.rng.randrange(self.config.height))
+            if cell not in used:
+                return cell
+
+    # Generate diamond baru sesuai generation_ratio dan red_ratio
+    def _generate_diamonds(self):
+        cells = self.config.width * self.config.height
+        for _ in range(max(1, int(cells * self.config.generation_ratio))):
+            points = 2 if self.rng.random() < self.config.red_ratio else 1
+            self.diamonds[self._free_cell()] = (self._new_id(), points)
+
+    # Generate ulang jika jumlah diamond di bawah min_ratio_for_generation
+    def _maybe_regenerate(self):
+        cells = self.config.width * self.config.height
+        if len(self.diamonds) < cells * self.config.min_ratio_for_generation:
+            self._generate_diamonds()
+
+    # Board state dalam bentuk objek yang sama dengan hasil decode response server
+    def snapshot(self) -> Board:
+        config = self.config
+        ms_left = max(0, (config.ticks - self.tick) * config.delay)
+        objects = []
+        for bot in self.bots:
+            x, y = bot.position
+            bx, by = bot.base
+            objects.append(GameObject(bot.object_id, Position(y=y, x=x), "BotGameObject", Properties(
+                diamonds=bot.diamonds,
+                score=bot.score,
+                name=bot.name,
+                inventory_size=config.inventory_size,
+                can_tackle=config.can_tackle,
+                milliseconds_left=ms_left,
+                time_joined="1970-01-01T00:00:00.000Z",
+                base=Base(y=by, x=bx),
+            )))
+            objects.append(GameObject(bot.base_id, Position(y=by, x=bx), "BaseGameObject", Properties(name=bot.name)))
+        for (x, y), (obj_id, pair_id) in self.teleports.items():
+            objects.append(GameObject(obj_id, Position(y=y, x=x), "TeleportGameObject", Properties(pair_id=pair_id)))
+        for (x, y), (obj_id, points) in self.diamonds.items():
+            objects.append(GameObject(obj_id, Position(y=y, x=x), "DiamondGameObject", Properties(points=points)))
+        if self.button:
+            obj_id, (x, y) = self.button
+            objects.append(GameObject(obj_id, Position(y=y, x=x), "DiamondButtonGameObject"))
+        return Board(1, config.width, config.height, config.features(), config.delay, objects)
+
+    # Terapkan satu langkah untuk satu bot
+    def apply_move(self, bot: SimBot, direction: Optional[str]):
+        if direction not in DIRECTION_DELTAS:
+            return
+        dx, dy = DIRECTION_DELTAS[direction]
+        x, y = bot.position[0] + dx, bot.position[1] + dy
+        if not (0 <= x < self.config.width and 0 <= y < self.config.height):
+            return  # Langkah keluar board ditolak server
+        cell = (x, y)
+
+        # Tackle: bot lain di sel tujuan dikirim pulang, diamond-nya diambil
+        other = next((b for b in self.bots if b is not bot and b.position == cell), None)
+        if other is not None:
+            if not self.config.can_tackle:
+                return
+            taken = min(other.diamonds, self.config.inventory_size - bot.diamonds)
+            bot.diamonds += taken
+            other.diamonds = 0
+            other.position = other.base
+            bot.tackles += 1
+
+        # Teleport memindahkan bot ke pasangannya
+        cell = self.teleport_links.get(cell, cell)
+        bot.position = cell
+
+        diamond = self.diamonds.get(cell)
+        if diamond and bot.diamonds + diamond[1] <= self.config.inventory_size:
+            bot.diamonds += diamond[1]
+            del self.diamonds[cell]
+
+        if cell == bot.base:
+            bot.score += bot.diamonds
+            bot.diamonds = 0
+
+        # Tombol diamond: semua diamond di-generate ulang dan tombol pindah
+        if self.button and cell == self.button[1]:
+            self.diamonds.clear()
+            self._generate_diamonds()
+            self.button = (self.button[0], self._free_cell())
+
+        self._maybe_regenerate()
+
+    # Jalankan satu tick: semua bot mengambil keputusan dari snapshot yang sama
+    def step(self, decision_times: Optional[List[float]] = None):
+        board = self.snapshot()
+        order = list(self.bots)
+        self.rng.shuffle(order)
+        for bot in order:
+            start = time.perf_counter()
+            result = bot.strategy(board, Bot(name=bot.name, email="", id=str(bot.object_id)))
+            if decision_times is not None:
+                decision_times.append(time.perf_counter() - start)
+            self.apply_move(bot, result[0] if result else None)
+        self.tick += 1
+
+    # Jalankan permainan sampai waktu habis
+    def run(self) -> GameResult:
+        decision_times = []
+        start = time.perf_counter()
+        while self.tick < self.config.ticks:
+            self.step(decision_times)
+        elapsed = time.perf_counter() - start
+        return GameResult(self.seed, self.tick, elapsed, {b.name: b.score for b in self.bots}, decision_times)
+
+# Mainkan satu permainan dengan seed tertentu. Modul random global juga di-seed karena
+# strategi memakai random.choice untuk langkah acak.
+def play(config: SimConfig, strategies: Dict[str, Strategy], seed: int = 0) -> GameResult:
+    random.seed(seed)
+    return LocalGame(config, strategies, seed).run()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulator lokal Complexity bot")
+    parser.add_argument("--bots", type=int, default=4)
+    parser.add_argument("--games", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--width", type=int, default=15)
+    parser.add_argument("--height", type=int, default=15)
+    parser.add_argument("--seconds", type=int, default=60)
+    parser.add_argument("--planner-bots", type=int, default=0)   # Jumlah bot (pertama) yang memakai RoutePlanner
+    parser.add_argument("--plan-budget-ms", type=float, default=5.0)
+    parser.add_argument("--team-bots", type=int, default=0)     # Jumlah bot (terakhir) dalam satu TeamCoordinator
+    parser.add_argument("--memo", action="store_true")           # Bot greedy memakai DecisionMemo
+    parser.add_argument("--tracker-bots", type=int, default=0)  # Jumlah bot (setelah PBot) yang memakai OpponentTracker
+    args = parser.parse_args()
+
+    config = SimConfig(width=args.width, height=args.height, seconds=args.seconds)
+    memos = []  # Memo semua bot greedy (statistiknya dijumlahkan di akhir)
+    trackers = []  # Pelacak lawan semua KBot
+    for game in range(args.games):
+        # Perencana menyimpan rencana antar tick, jadi dibuat baru untuk setiap permainan
+        strategies = {}
+        team_start = args.bots - args.team_bots
+        team = TeamCoordinator(["TBot{}".format(i + 1) for i in range(team_start, args.bots)])
+        for i in range(args.bots):
+            if i >= team_start:
+                strategies["TBot{}".format(i + 1)] = team.next_move
+            elif i < args.planner_bots:
+                planner = RoutePlanner(args.plan_budget_ms)
+                strategies["PBot{}".format(i + 1)] = lambda board, bot, planner=planner: get_next_move(
+                    board, bot, planner=planner)
+            elif i < args.planner_bots + args.tracker_bots:
+                # Riwayat lawan hanya berlaku dalam satu permainan
+                trackers.append(OpponentTracker())
+                strategies["KBot{}".format(i + 1)] = lambda board, bot, tracker=trackers[-1]: get_next_move(
+                    board, bot, tracker=tracker)
+            elif args.memo:
+                memos.append(DecisionMemo())
+                strategies["CBot{}".format(i + 1)] = lambda board, bot, memo=memos[-1]: get_next_move(
+                    board, bot, memo=memo)
+            else:
+                strategies["CBot{}".format(i + 1)] = get_next_move
+        result = play(config, strategies, args.seed + game)
+        print("[GAME {}] seed={} {:.0f} tick/detik, keputusan p50={:.3f}ms p99={:.3f}ms skor={}".format(
+            game + 1, result.seed, result.ticks_per_sec,
+            result.decision_ms(0.5), result.decision_ms(0.99), result.scores,
+        ))
+    if memos:
+        total = MemoStats(*(sum(getattr(m.stats, f) for m in memos) for f in ("hits", "reused", "misses", "evictions")))
+        print("[MEMO] {}".format(total.summary()))
+    if trackers:
+        total = TrackerStats(*(sum(getattr(t.stats, f) for t in trackers) for f in ("updates", "predictions", "correct")))
+        print("[TRACKER] {}".format(total.summary()))
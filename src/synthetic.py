@@ -0,0 +1,184 @@
+import json
+import random
+from typing import Optional
+
+# Modul untuk membuat board sintetis dalam format JSON yang sama dengan server Etimo
+# (key camelCase, dibungkus sama seperti response API). Dipakai oleh mock server dan benchmark.
+
+DEFAULT_FEATURES = [
+    {
+        "name": "DiamondButtonProvider",
+        "config": None,
+    },
+    {
+        "name": "DiamondProvider",
+        "config": {"generationRatio": 0.1, "minRatioForGeneration": 0.01, "redRatio": 0.2},
+    },
+    {
+        "name": "TeleportProvider",
+        "config": {"pairs": 1},
+    },
+    {
+        "name": "BotProvider",
+        "config": {"inventorySize": 5, "canTackle": True},
+    },
+    {
+        "name": "TimerProvider",
+        "config": {"seconds": 60},
+    },
+]
+
+# Fungsi untuk membuat satu posisi acak yang belum terpakai
+def _free_cell(rng: random.Random, width: int, height: int, used: set) -> dict:
+    while True:
+        cell = (rng.randrange(width), rng.randrange(height))
+        if cell not in used or len(used) >= width * height:
+            used.add(cell)
+            return {"x": cell[0], "y": cell[1]}
+
+# Fungsi untuk membuat objek bot dalam format JSON server
+def make_bot_json(obj_id: int, name: str, position: dict, base: dict, diamonds: int = 0) -> dict:
+    return {
+        "id": obj_id,
+        "position": position,
+        "type": "BotGameObject",
+        "properties": {
+            "diamonds": diamonds,
+            "score": 0,
+            "name": name,
+            "inventorySize": 5,
+            "canTackle": True,
+            "millisecondsLeft": 60000,
+            "timeJoined": "2024-01-01T00:00:00.000Z",
+            "base": dict(base),
+        },
+    }
+
+# Fungsi untuk membuat board JSON sintetis dengan jumlah objek tertentu
+def make_board_json(
+    width: int = 15,
+    height: int = 15,
+    diamonds: int = 10,
+    bots: int = 2,
+    teleports: int = 2,
+    seed: Optional[int] = 0,
+    board_id: int = 1,
+    delay: int = 100,
+) -> dict:
+    rng = random.Random(seed)
+    used = set()
+    objects = []
+    next_id = 1
+
+    # Bot beserta base-nya
+    for i in range(bots):
+        base = _free_cell(rng, width, height, used)
+        objects.append(make_bot_json(next_id, "bot{}".format(i), dict(base), base, rng.randint(0, 4)))
+        objects.append({
+            "id": next_id + 1,
+            "position": dict(base),
+            "type": "BaseGameObject",
+            "properties": {"name": "bot{}".format(i)},
+        })
+        next_id += 2
+
+    # Teleport selalu berpasangan (pairId sama)
+    for i in range(teleports):
+        objects.append({
+            "id": next_id,
+            "position": _free_cell(rng, width, height, used),
+            "type": "TeleportGameObject",
+            "properties": {"pairId": str(i // 2)},
+        })
+        next_id += 1
+
+    # Diamond biru (1 poin) dan merah (2 poin)
+    for _ in range(diamonds):
+        objects.append({
+            "id": next_id,
+            "position": _free_cell(rng, width, height, used),
+            "type": "DiamondGameObject",
+            "properties": {"points": 2 if rng.random() < 0.2 else 1},
+        })
+        next_id += 1
+
+    objects.append({
+        "id": next_id,
+        "position": _free_cell(rng, width, height, used),
+        "type": "DiamondButtonGameObject",
+        "properties": None,
+    })
+
+    return {
+        "id": board_id,
+        "width": width,
+        "height": height,
+        "features": [dict(f) for f in DEFAULT_FEATURES],
+        "minimumDelayBetweenMoves": delay,
+        "gameObjects": objects,
+    }
+
+# Fungsi untuk membuat board JSON skenario tetap (untuk tes): bot "me" (base di pojok kiri
+# bawah), lawan (x, y[, diamonds[, can_tackle]]) dengan base di pojok kanan bawah,
+# diamond (x, y, poin), dan teleport (x, y, pair)
+def make_scenario_json(me=(0, 0), inventory: int = 0, rivals=(), diamonds=(), teleports=(),
+                       size: int = 10) -> dict:
+    corner = size - 1
+    objects = [make_bot_json(1, "me", {"x": me[0], "y": me[1]}, {"x": 0, "y": corner}, inventory)]
+    for i, rival in enumerate(rivals):
+        x, y, carried, can_tackle = (tuple(rival) + (0, True))[:4]
+        bot = make_bot_json(10 + i, "rival{}".format(i), {"x": x, "y": y}, {"x": corner, "y": corner}, carried)
+        bot["properties"]["canTackle"] = can_tackle
+        objects.append(bot)
+    for i, (x, y, pair) in enumerate(teleports):
+        objects.append({"id": 50 + i, "position": {"x": x, "y": y}, "type": "TeleportGameObject",
+                        "properties": {"pairId": pair}})
+    for i, (x, y, points) in enumerate(diamonds):
+        objects.append({"id": 100 + i, "position": {"x": x, "y": y}, "type": "DiamondGameObject",
+                        "properties": {"points": points}})
+    return {
+        "id": 1,
+        "width": size,
+        "height": size,
+        "features": [dict(f) for f in DEFAULT_FEATURES],
+        "minimumDelayBetweenMoves": 100,
+        "gameObjects": objects,
+    }
+
+# Fungsi untuk membuat urutan board JSON per tick: bot bergerak satu langkah, diamond yang
+# terinjak hilang dan sesekali diamond baru muncul. Setiap tick adalah salinan baru
+# (seperti hasil json.loads dari response server).
+def make_tick_sequence(ticks: int, seed: Optional[int] = 0, **board_kwargs) -> list:
+    rng = random.Random(seed)
+    board = make_board_json(seed=seed, **board_kwargs)
+    width, height = board["width"], board["height"]
+    next_id = max(obj["id"] for obj in board["gameObjects"]) + 1
+    states = []
+    for _ in range(ticks):
+        objects = board["gameObjects"]
+        diamonds = {
+            (obj["position"]["x"], obj["position"]["y"]): obj
+            for obj in objects if obj["type"] == "DiamondGameObject"
+        }
+        for obj in objects:
+            if obj["type"] != "BotGameObject":
+                continue
+            dx, dy = rng.choice([(0, 1), (0, -1), (1, 0), (-1, 0)])
+            x = min(width - 1, max(0, obj["position"]["x"] + dx))
+            y = min(height - 1, max(0, obj["position"]["y"] + dy))
+            obj["position"] = {"x": x, "y": y}
+            obj["properties"]["millisecondsLeft"] -= board["minimumDelayBetweenMoves"]
+            diamond = diamonds.pop((x, y), None)
+            if diamond is not None:
+                objects.remove(diamond)
+                obj["properties"]["diamonds"] += diamond["properties"]["points"]
+        if rng.random() < 0.1:
+            objects.append({
+                "id": next_id,
+                "position": {"x": rng.randrange(width), "y": rng.randrange(height)},
+                "type": "DiamondGameObject",
+                "properties": {"points": 1},
+            })
+            next_id += 1
+        states.append(json.dumps(board))
+    return [json.loads(state) for state in states]
@@ -0,0 +1,217 @@
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from main import (
+    DEFAULT_PARAMS,
+    UNREACHABLE,
+    Board,
+    BoardStore,
+    Bot,
+    StrategyParams,
+    direction_towards,
+    distance_fields,
+    get_next_move,
+)
+
+# Koordinator tim untuk beberapa bot dalam satu proses. Semua anggota memakai satu BoardStore
+# (setiap response di-decode inkremental terhadap board terakhir tim, objek yang tidak berubah
+# dipakai bersama) dan mengambil keputusan dari board terbaru tim. Diamond dibagi ke anggota
+# sekaligus dengan assignment (metode Hungaria) di atas jarak jalur BFS, sehingga dua bot satu
+# tim tidak mengejar diamond yang sama. Assignment dihitung ulang hanya jika diamond (atau
+# teleport) atau inventori anggota berubah, bukan setiap kali response anggota menghasilkan
+# board baru, sehingga target tidak berpindah-pindah antar anggota dalam satu tick.
+
+# Biaya untuk pasangan bot-diamond yang tidak mungkin
+INFEASIBLE = 1e9
+
+# Assignment biaya minimum (metode Hungaria, O(n^2 m)) untuk matriks n x m dengan n <= m.
+# Mengembalikan kolom untuk setiap baris.
+def solve_assignment(cost: List[List[float]]) -> List[int]:
+    n = len(cost)
+    if n == 0:
+        return []
+    m = len(cost[0])
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    match = [0] * (m + 1)  # match[kolom] = baris (1-based), 0 = kosong
+    way = [0] * (m + 1)
+    for row in range(1, n + 1):
+        match[0] = row
+        col0 = 0
+        minv = [math.inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[col0] = True
+            row0 = match[col0]
+            delta = math.inf
+            col1 = 0
+            costs = cost[row0 - 1]
+            for col in range(1, m + 1):
+                if used[col]:
+                    continue
+                current = costs[col - 1] - u[row0] - v[col]
+                if current < minv[col]:
+                    minv[col] = current
+                    way[col] = col0
+                if minv[col] < delta:
+                    delta = minv[col]
+                    col1 = col
+            for col in range(m + 1):
+                if used[col]:
+                    u[match[col]] += delta
+                    v[col] -= delta
+                else:
+                    minv[col] -= delta
+            col0 = col1
+            if match[col0] == 0:
+                break
+        while col0:
+            col1 = way[col0]
+            match[col0] = match[col1]
+            col0 = col1
+
+    result = [-1] * n
+    for col in range(1, m + 1):
+        if match[col]:
+            result[match[col] - 1] = col - 1
+    return result
+
+# Statistik koordinator
+@dataclass
+class TeamStats:
+    assignments: int = 0  # assignment yang dihitung
+    decisions: int = 0
+    assigned: int = 0  # keputusan yang mengikuti assignment (sisanya strategi greedy biasa)
+
+# Koordinator untuk satu tim (nama bot anggota)
+class TeamCoordinator:
+    def __init__(self, names: List[str], portals: bool = False, params: StrategyParams = DEFAULT_PARAMS,
+                 candidates_per_bot: int = 8):
+        self.names = set(names)
+        self.portals = portals
+        self.params = params
+        self.candidates_per_bot = candidates_per_bot
+        self.store = BoardStore()
+        self.stats = TeamStats()
+        self._key: Optional[tuple] = None  # State yang menentukan assignment terakhir
+        self._targets: Dict[str, Tuple[object, int]] = {}
+        self._assigned_ids: Dict[str, set] = {}  # Nama anggota -> id diamond milik anggota lain
+        self._fallback: Dict[str, int] = {}  # Target greedy anggota tanpa assignment (sejak assignment terakhir)
+
+    # Board terbaru yang di-decode lewat store bersama, dari response anggota mana pun
+    @property
+    def board(self) -> Optional[Board]:
+        return self.store.board
+
+    # Langkah berikutnya untuk satu anggota tim
+    def next_move(self, board: Board, bot: Bot) -> Optional[Tuple[str, int]]:
+        self.stats.decisions += 1
+        key = self._assignment_key(board)
+        if key != self._key:
+            self._key = key
+            self._assign(board)
+        target = self._targets.get(bot.name)
+        if target is not None:
+            me = board.get_bot(bot)
+            fields = distance_fields(board, self.portals)
+            direction = direction_towards(me.position, target[0], fields.blocked, fields)
+            if direction:
+                self.stats.assigned += 1
+                return direction, target[1]
+        # Strategi greedy biasa, tanpa diamond yang sudah dibagikan ke anggota lain atau sedang
+        # dikejar anggota lain yang juga memakai strategi greedy
+        exclude = self._assigned_ids.get(bot.name)
+        if exclude is None:
+            exclude = {diamond_id for _, diamond_id in self._targets.values()}
+        exclude = exclude | {diamond_id for name, diamond_id in self._fallback.items() if name != bot.name}
+        result = get_next_move(board, bot, self.portals, params=self.params, exclude=exclude)
+        if result and result[1] >= 0:
+            self._fallback[bot.name] = result[1]
+        else:
+            self._fallback.pop(bot.name, None)
+        return result
+
+    # Key assignment: hash diamond + teleport dan inventori setiap anggota. Posisi anggota
+    # sengaja tidak ikut agar langkah anggota (setiap response = board baru) tidak memicu
+    # assignment ulang; diamond yang diambil siapa pun mengubah hash diamond.
+    def _assignment_key(self, board: Board) -> tuple:
+        inventories = tuple(sorted(
+            (obj.properties.name, obj.properties.diamonds or 0) for obj in board.index.bots
+            if obj.properties and obj.properties.name in self.names
+        ))
+        return board.index.state_hash[0], inventories
+
+    # Assignment semua anggota yang masih perlu diamond ke diamond terbaik
+    def _assign(self, board: Board):
+        self._targets = {}
+        self._assigned_ids = {}
+        self._fallback = {}
+        fields = distance_fields(board, self.portals)
+        params = self.params
+
+        members, rivals = [], []
+        for obj in board.index.bots:
+            if not obj.position or not obj.properties:
+                continue
+            if obj.properties.name in self.names:
+                inventory = obj.properties.diamonds or 0
+                capacity = obj.properties.inventory_size or 5
+                # Anggota yang sudah waktunya pulang memakai strategi biasa (kembali ke base)
+                if inventory < max(1, math.ceil(params.return_ratio * capacity)):
+                    members.append((obj, capacity - inventory))
+            else:
+                rivals.append(fields.cell(obj.position))
+        if not members:
+            return
+
+        diamonds = [
+            obj for obj in board.index.diamonds
+            if obj.position and obj.properties and obj.properties.points and obj.properties.points > 0
+        ]
+        if not diamonds:
+            return
+
+        # Skor setiap anggota ke setiap diamond; kandidat = K diamond terbaik per anggota
+        scores: Dict[Tuple[int, int], float] = {}
+        chosen = set()
+        for row, (obj, room) in enumerate(members):
+            my_cell = fields.cell(obj.position)
+            from_me = fields.field_from(obj.position)
+            ranked = []
+            for col, diamond in enumerate(diamonds):
+                cell = fields.cell(diamond.position)
+                dist = from_me[cell]
+                if cell == my_cell or dist == UNREACHABLE or diamond.properties.points > room:
+                    continue
+                ranked.append((params.score(diamond.properties.points, dist), col, dist))
+            ranked.sort(key=lambda item: (-item[0], item[1]))
+            for score, col, dist in ranked[:self.candidates_per_bot]:
+                # Diamond yang jelas lebih dekat ke bot lawan tidak diberikan (sama seperti greedy)
+                to_diamond = fields.field_to(diamonds[col].position)
+                if any(to_diamond[c] != UNREACHABLE and to_diamond[c] < dist - params.contest_margin
+                       for c in rivals):
+                    continue
+                scores[row, col] = score
+                chosen.add(col)
+        if not chosen:
+            return
+
+        # Matriks biaya (skor negatif); satu kolom kosong per anggota agar anggota boleh tidak
+        # mendapat diamond (lalu memakai strategi greedy biasa)
+        columns = sorted(chosen)
+        cost = [
+            [-scores[row, col] if (row, col) in scores else INFEASIBLE for col in columns]
+            + [0.0] * len(members)
+            for row in range(len(members))
+        ]
+        self.stats.assignments += 1
+        for row, col in enumerate(solve_assignment(cost)):
+            if col < len(columns) and cost[row][col] < INFEASIBLE:
+                obj = members[row][0]
+                diamond = diamonds[columns[col]]
+                self._targets[obj.properties.name] = (diamond.position, diamond.id)
+        for name in self.names:
+            self._assigned_ids[name] = {
+                diamond_id for member, (_, diamond_id) in self._targets.items() if member != name
+            }
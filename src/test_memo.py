@@ -0,0 +1,129 @@
+import random
+import unittest
+
+from main import DEFAULT_PARAMS, Bot, _next_move, decode_board, get_next_move
+from memo import DecisionMemo
+from simulator import SimConfig, play
+from synthetic import make_scenario_json
+
+# Tes DecisionMemo: keputusan lewat memo (hit cache dan target yang dipakai ulang) harus sama
+# dengan keputusan penuh (_next_move) untuk state yang sama, termasuk saat syarat reuse batal.
+
+ME = Bot(name="me", email="me@test.local", id="me")
+
+# Board 10x10 skenario tetap (lihat synthetic.make_scenario_json)
+def make_board(**kwargs) -> object:
+    return decode_board(make_scenario_json(**kwargs))
+
+DIAMONDS = ((5, 0, 1), (0, 8, 1))
+
+class DecisionMemoTest(unittest.TestCase):
+    def setUp(self):
+        self.memo = DecisionMemo()
+
+    # Keputusan lewat memo, dibandingkan dengan keputusan penuh untuk board yang sama
+    def decide(self, board):
+        expected = _next_move(board, ME, False, None, DEFAULT_PARAMS)
+        result = get_next_move(board, ME, memo=self.memo)
+        self.assertEqual(result, expected)
+        return result
+
+    # Keputusan pertama memilih diamond (5, 0) dan dicatat untuk dipakai ulang
+    def start(self, **kwargs):
+        result = self.decide(make_board(diamonds=DIAMONDS, **kwargs))
+        self.assertEqual(result, ("EAST", 100))
+        self.assertEqual(self.memo.stats.misses, 1)
+
+    def test_same_state_hits_cache(self):
+        self.start()
+        self.decide(make_board(diamonds=DIAMONDS))
+        self.assertEqual(self.memo.stats.hits, 1)
+
+    def test_step_towards_target_reuses(self):
+        self.start()
+        for x in range(1, 4):
+            self.assertEqual(self.decide(make_board(me=(x, 0), diamonds=DIAMONDS)), ("EAST", 100))
+        self.assertEqual(self.memo.stats.reused, 3)
+        self.assertEqual(self.memo.stats.misses, 1)
+
+    def test_diamond_change_invalidates(self):
+        self.start()
+        self.decide(make_board(me=(1, 0), diamonds=DIAMONDS + ((1, 1, 1),)))
+        self.assertEqual(self.memo.stats.reused, 0)
+
+    def test_removed_target_invalidates(self):
+        self.start()
+        self.decide(make_board(me=(1, 0), diamonds=DIAMONDS[1:]))
+        self.assertEqual(self.memo.stats.reused, 0)
+
+    def test_inventory_change_invalidates(self):
+        self.start()
+        self.decide(make_board(me=(1, 0), inventory=1, diamonds=DIAMONDS))
+        self.assertEqual(self.memo.stats.reused, 0)
+
+    # Pindah ke sel yang bukan tetangga (tackle/teleport) meski jaraknya tepat berkurang satu
+    def test_jump_invalidates(self):
+        self.start()
+        self.decide(make_board(me=(4, 3), diamonds=DIAMONDS))
+        self.assertEqual(self.memo.stats.reused, 0)
+
+    def test_step_away_invalidates(self):
+        self.start()
+        self.decide(make_board(me=(0, 1), diamonds=DIAMONDS))
+        self.assertEqual(self.memo.stats.reused, 0)
+
+    def test_closer_rival_invalidates(self):
+        self.start(rivals=((9, 9),))
+        result = self.decide(make_board(me=(1, 0), diamonds=DIAMONDS, rivals=((5, 2),)))
+        self.assertEqual(self.memo.stats.reused, 0)
+        self.assertNotEqual(result[1], 100)
+
+    # Batas skor: diamond lain yang skornya seri saat scan bisa saja menyamai target setelah
+    # satu langkah (jaraknya dianggap ikut berkurang), jadi reuse dibatalkan
+    def test_score_bound_invalidates(self):
+        diamonds = ((3, 0, 1), (0, 3, 1))
+        self.assertEqual(self.decide(make_board(diamonds=diamonds)), ("EAST", 100))
+        self.decide(make_board(me=(1, 0), diamonds=diamonds))
+        self.assertEqual(self.memo.stats.reused, 0)
+
+    def test_teleport_change_invalidates(self):
+        self.start(teleports=((8, 8, "0"), (9, 8, "0")))
+        self.decide(make_board(me=(1, 0), diamonds=DIAMONDS, teleports=((3, 0, "0"), (9, 8, "0"))))
+        self.assertEqual(self.memo.stats.reused, 0)
+
+# Permainan penuh di simulator: setiap keputusan lewat memo dibandingkan dengan keputusan penuh
+class DecisionMemoSimulationTest(unittest.TestCase):
+    def play(self, portals: bool):
+        decisions = mismatches = 0
+        memos = []
+        strategies = {}
+        for i in range(4):
+            memo = DecisionMemo()
+            memos.append(memo)
+
+            def decide(board, bot, memo=memo):
+                nonlocal decisions, mismatches
+                state = random.getstate()
+                expected = _next_move(board, bot, portals, None, DEFAULT_PARAMS)
+                random.setstate(state)
+                result = get_next_move(board, bot, portals, memo=memo)
+                # Langkah acak (-2) tidak dibandingkan
+                if expected and expected[1] != -2:
+                    decisions += 1
+                    mismatches += result != expected
+                return result
+            strategies["CBot{}".format(i + 1)] = decide
+        for seed in range(2):
+            play(SimConfig(seconds=20), dict(strategies), seed)
+        self.assertGreater(decisions, 0)
+        self.assertEqual(mismatches, 0)
+        self.assertGreater(sum(memo.stats.reused for memo in memos), 0)
+
+    def test_equivalent_without_portals(self):
+        self.play(False)
+
+    def test_equivalent_with_portals(self):
+        self.play(True)
+
+if __name__ == "__main__":
+    unittest.main()
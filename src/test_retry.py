@@ -0,0 +1,100 @@
+import random
+import time
+import unittest
+
+from retry import CircuitBreaker, RetryPolicy
+
+# Tes unit RetryPolicy.backoff dan transisi state CircuitBreaker
+# (jalankan dari folder src: python -m pytest atau python -m unittest)
+
+class BackoffTest(unittest.TestCase):
+    def test_exponential_without_jitter(self):
+        policy = RetryPolicy(base_delay=0.05, max_delay=1.0, jitter=0.0)
+        rng = random.Random(0)
+        self.assertEqual([policy.backoff(i, rng) for i in range(4)], [0.05, 0.1, 0.2, 0.4])
+
+    def test_capped_at_max_delay(self):
+        policy = RetryPolicy(base_delay=0.05, max_delay=1.0, jitter=0.0)
+        self.assertEqual(policy.backoff(10, random.Random(0)), 1.0)
+
+    def test_jitter_stays_within_bounds(self):
+        policy = RetryPolicy(base_delay=0.1, max_delay=1.0, jitter=0.5)
+        rng = random.Random(0)
+        for attempt in range(5):
+            delay = min(1.0, 0.1 * 2 ** attempt)
+            for _ in range(100):
+                self.assertTrue(delay * 0.5 <= policy.backoff(attempt, rng) <= delay)
+
+class CircuitBreakerTest(unittest.TestCase):
+    def open_breaker(self, now: float = 0.0) -> CircuitBreaker:
+        breaker = CircuitBreaker(threshold=3, reset_timeout=2.0)
+        opened = [breaker.failure(now) for _ in range(3)]
+        self.assertEqual(opened, [False, False, True])
+        return breaker
+
+    def test_closed_allows(self):
+        breaker = CircuitBreaker(threshold=3)
+        self.assertEqual(breaker.allow(0.0), 0.0)
+        self.assertFalse(breaker.is_open)
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(threshold=3)
+        breaker.failure(0.0)
+        breaker.failure(0.0)
+        breaker.success()
+        self.assertFalse(breaker.failure(0.0))
+        self.assertFalse(breaker.is_open)
+
+    def test_open_rejects_until_timeout(self):
+        breaker = self.open_breaker(10.0)
+        self.assertTrue(breaker.is_open)
+        self.assertAlmostEqual(breaker.allow(11.5), 0.5)
+
+    def test_half_open_allows_single_trial(self):
+        breaker = self.open_breaker()
+        self.assertEqual(breaker.allow(2.0), 0.0)
+        # Request lain ditolak selama percobaan berjalan
+        self.assertEqual(breaker.allow(2.1), 0.5)
+
+    def test_trial_success_closes(self):
+        breaker = self.open_breaker()
+        breaker.allow(2.0)
+        breaker.success()
+        self.assertFalse(breaker.is_open)
+        self.assertEqual(breaker.allow(2.1), 0.0)
+
+    def test_trial_failure_reopens(self):
+        breaker = self.open_breaker()
+        breaker.allow(2.0)
+        self.assertFalse(breaker.failure(2.0))  # Sudah terbuka, bukan pembukaan baru
+        self.assertTrue(breaker.is_open)
+        self.assertAlmostEqual(breaker.allow(3.0), 1.0)
+        self.assertEqual(breaker.allow(4.0), 0.0)
+
+    def test_release_frees_trial_slot(self):
+        breaker = self.open_breaker()
+        breaker.allow(2.0)
+        breaker.release()
+        self.assertTrue(breaker.is_open)
+        self.assertEqual(breaker.allow(2.1), 0.0)
+
+class ApiBreakerTest(unittest.TestCase):
+    # Exception selain gangguan transport saat request percobaan tidak boleh mengunci breaker
+    def test_unexpected_exception_releases_trial(self):
+        from main import Api
+
+        class FailingSession:
+            def request(self, *args, **kwargs):
+                raise KeyboardInterrupt
+
+        breaker = CircuitBreaker(threshold=1, reset_timeout=2.0)
+        breaker.failure(time.monotonic() - 10)  # Terbuka dan sudah boleh mencoba lagi
+        api = Api("http://localhost:1/api", breaker=breaker)
+        api.session = FailingSession()
+        with self.assertRaises(KeyboardInterrupt):
+            api._req("/boards", "get", {})
+        self.assertTrue(breaker.is_open)
+        self.assertEqual(breaker.allow(time.monotonic()), 0.0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+
+from main import Bot, Position, decode_board, distance_fields, get_next_move
+from synthetic import make_scenario_json
+from tracker import OpponentTracker
+
+# Tes OpponentTracker: riwayat posisi (push, restart saat tackle/teleport), perkiraan target
+# lawan (claims, elsewhere), sel berisiko, dan pengaruhnya pada pilihan diamond.
+
+ME = Bot(name="me", email="me@test.local", id="me")
+
+# Board 10x10 skenario tetap (lihat synthetic.make_scenario_json)
+def make_board(**kwargs) -> object:
+    return decode_board(make_scenario_json(**kwargs))
+
+def _pos(x: int, y: int) -> Position:
+    return Position(y=y, x=x)
+
+class OpponentTrackerTest(unittest.TestCase):
+    def setUp(self):
+        self.tracker = OpponentTracker(history=4)
+
+    # Masukkan urutan board ke pelacak, mengembalikan perkiraan untuk board terakhir
+    def feed(self, *boards):
+        for board in boards:
+            fields = distance_fields(board)
+            self.tracker.update(board, ME.name, fields)
+            view = self.tracker.estimate(board, fields)
+        return view
+
+    def track(self, name: str = "rival0"):
+        return self.tracker._tracks[name]
+
+    def test_pushes_only_on_cell_change(self):
+        self.feed(make_board(rivals=[(5, 5)]), make_board(rivals=[(5, 5)]), make_board(rivals=[(5, 6)]))
+        self.assertEqual(self.track().count, 2)
+
+    def test_same_board_is_ignored(self):
+        board = make_board(rivals=[(5, 5)])
+        self.feed(board, board)
+        self.assertEqual(self.tracker.stats.updates, 1)
+
+    def test_history_is_bounded(self):
+        self.feed(*(make_board(rivals=[(5, y)]) for y in range(8)))
+        track = self.track()
+        self.assertEqual(track.count, 4)
+        self.assertEqual([(track.back(k).x, track.back(k).y) for k in range(4)], [(5, 7), (5, 6), (5, 5), (5, 4)])
+
+    # Tackle (dikirim ke base) atau teleport: posisi baru bukan tetangga, riwayat dimulai ulang
+    def test_restart_on_tackle(self):
+        self.feed(*(make_board(rivals=[(5, y)]) for y in range(3)), make_board(rivals=[(9, 9)]))
+        track = self.track()
+        self.assertEqual(track.count, 1)
+        self.assertEqual((track.back(0).x, track.back(0).y), (9, 9))
+
+    def test_restart_on_teleport(self):
+        teleports = ((5, 3, "0"), (1, 8, "0"))
+        self.feed(make_board(rivals=[(5, 1)], teleports=teleports), make_board(rivals=[(5, 2)], teleports=teleports),
+                  make_board(rivals=[(1, 8)], teleports=teleports))
+        self.assertEqual(self.track().count, 1)
+
+    def test_claims_diamond_approached_every_step(self):
+        diamonds = ((5, 8, 1), (2, 3, 1))
+        view = self.feed(*(make_board(rivals=[pos], diamonds=diamonds) for pos in ((4, 0), (5, 0), (5, 1), (5, 2))))
+        # (2, 3) lebih dekat dan makin dekat di dua langkah terakhir, tapi tidak di setiap langkah
+        self.assertEqual(view.claims, {100: 6})
+        self.assertEqual(view.elsewhere, {"rival0"})
+        self.assertEqual(self.track().predicted, {distance_fields(make_board()).cell(_pos(5, 3))})
+
+    def test_no_target_without_history(self):
+        view = self.feed(make_board(rivals=[(5, 1)], diamonds=((5, 6, 1),)))
+        self.assertEqual(view.claims, {})
+        self.assertEqual(view.elsewhere, set())
+        self.assertEqual(len(self.track().predicted), 4)
+
+    def test_full_inventory_heads_home(self):
+        view = self.feed(make_board(rivals=[(5, 5, 5)], diamonds=((5, 6, 1),)))
+        self.assertEqual(view.claims, {})
+        self.assertEqual(view.elsewhere, {"rival0"})
+        fields = distance_fields(make_board())
+        self.assertEqual(self.track().predicted, {fields.cell(_pos(6, 5)), fields.cell(_pos(5, 6))})
+
+    def test_risky_only_for_tacklers(self):
+        view = self.feed(make_board(rivals=[(5, 5, 0, True), (2, 2, 0, False)]))
+        fields = distance_fields(make_board())
+        self.assertEqual(view.risky, {fields.cell(_pos(x, y)) for x, y in ((4, 5), (6, 5), (5, 4), (5, 6))})
+
+    def test_prediction_accuracy(self):
+        diamonds = ((5, 6, 1),)
+        self.feed(*(make_board(rivals=[(5, y)], diamonds=diamonds) for y in range(1, 5)))
+        self.assertEqual(self.tracker.stats.predictions, 3)
+        self.assertEqual(self.tracker.stats.correct, 3)
+
+    def test_departed_bot_is_dropped(self):
+        self.feed(make_board(rivals=[(5, 5)]), make_board())
+        self.assertNotIn("rival0", self.tracker._tracks)
+
+class TrackerDecisionTest(unittest.TestCase):
+    # Lawan yang tiba bersamaan di diamond yang sedang ditujunya: diamond dilepas
+    def test_gives_up_claimed_tie(self):
+        diamonds = ((4, 0, 1), (0, 6, 1))
+        boards = [make_board(rivals=[(x, 0)], diamonds=diamonds) for x in (9, 8)]
+        self.assertEqual(get_next_move(boards[-1], ME)[1], 100)
+        tracker = OpponentTracker()
+        for board in boards:
+            result = get_next_move(board, ME, tracker=tracker)
+        self.assertEqual(result[1], 101)
+
+    # Lawan yang lebih dekat tapi jelas menuju diamond lain tidak lagi dianggap bersaing
+    def test_ignores_rival_heading_elsewhere(self):
+        diamonds = ((4, 0, 1), (0, 6, 1), (5, 6, 1))
+        boards = [make_board(rivals=[(5, y)], diamonds=diamonds) for y in (1, 2)]
+        self.assertEqual(get_next_move(boards[-1], ME)[1], 101)
+        tracker = OpponentTracker()
+        for board in boards:
+            result = get_next_move(board, ME, tracker=tracker)
+        self.assertEqual(result[1], 100)
+
+    # Membawa diamond: dari dua langkah yang sama pendek ke base, sel yang bisa dimasuki lawan dihindari
+    def test_avoids_risky_step_home(self):
+        board = make_board(me=(2, 7), inventory=5, rivals=[(0, 7)])
+        self.assertEqual(get_next_move(board, ME), ("WEST", -1))
+        self.assertEqual(get_next_move(board, ME, tracker=OpponentTracker()), ("SOUTH", -1))
+
+if __name__ == "__main__":
+    unittest.main()
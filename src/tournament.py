@@ -0,0 +1,215 @@
+import argparse
+import itertools
+import json
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, fields, replace
+from functools import partial
+from typing import Dict, List, Tuple
+
+from main import DEFAULT_PARAMS, StrategyParams, get_next_move
+from planner import RoutePlanner
+from simulator import SimConfig, play
+
+# Turnamen untuk tuning parameter strategi: banyak permainan ber-seed antara varian bot
+# (StrategyParams berbeda) di simulator lokal, dijalankan paralel dengan ProcessPoolExecutor.
+# Setiap permainan adalah job independen yang hanya mengirim parameter dan mengembalikan skor,
+# sehingga throughput naik hampir linear dengan jumlah core.
+#
+# Perencana rute dibatasi jumlah node (--plan-nodes), bukan waktu: dengan budget waktu, hasil
+# pencarian bergantung pada beban CPU sehingga skor bisa berbeda antar jumlah worker. Dengan
+# budget node, permainan yang sama memberi skor yang sama untuk jumlah worker berapa pun.
+#
+# Skor dinilai relatif terhadap rata-rata skor permainan yang sama (skor - rata-rata),
+# agar perbedaan antar seed (jumlah diamond, posisi base) tidak mendominasi hasil.
+
+# Satu varian bot
+@dataclass(frozen=True)
+class Variant:
+    name: str
+    params: StrategyParams = DEFAULT_PARAMS
+    planner: bool = False
+
+    # Parameter yang berbeda dari default, untuk ditampilkan
+    def describe(self) -> str:
+        changed = [
+            "{}={}".format(f.name, getattr(self.params, f.name)) for f in fields(StrategyParams)
+            if getattr(self.params, f.name) != getattr(DEFAULT_PARAMS, f.name)
+        ]
+        if self.planner:
+            changed.append("planner")
+        return ",".join(changed) or "default"
+
+# Satu permainan: varian per kursi; kursi pengisi (counted=False) tidak ikut dihitung
+@dataclass(frozen=True)
+class Match:
+    seed: int
+    variants: Tuple[Variant, ...]
+    counted: Tuple[bool, ...]
+
+# Ringkasan hasil satu varian
+@dataclass
+class VariantResult:
+    variant: Variant
+    scores: List[int] = field(default_factory=list)
+    relative: List[float] = field(default_factory=list)
+    wins: float = 0.0
+
+    @property
+    def games(self) -> int:
+        return len(self.scores)
+
+    def summary(self) -> dict:
+        scores = sorted(self.scores)
+        pick = lambda q: scores[min(len(scores) - 1, int(len(scores) * q))] if scores else 0
+        return {
+            "games": self.games,
+            "mean": statistics.fmean(scores) if scores else 0.0,
+            "stdev": statistics.pstdev(scores) if len(scores) > 1 else 0.0,
+            "p10": pick(0.1),
+            "p50": pick(0.5),
+            "p90": pick(0.9),
+            "mean_relative": statistics.fmean(self.relative) if self.relative else 0.0,
+            "win_rate": self.wins / self.games if self.games else 0.0,
+        }
+
+# Dijalankan di worker: mainkan satu permainan, kembalikan skor per kursi
+def play_match(match: Match, config: SimConfig, plan_nodes: int = 5000) -> Tuple[Match, List[int]]:
+    strategies = {}
+    for seat, variant in enumerate(match.variants):
+        planner = RoutePlanner(max_nodes=plan_nodes) if variant.planner else None
+        strategies["S{}".format(seat)] = partial(_decide, params=variant.params, planner=planner)
+    result = play(config, strategies, match.seed)
+    return match, [result.scores["S{}".format(seat)] for seat in range(len(match.variants))]
+
+def _decide(board, bot, params: StrategyParams, planner):
+    return get_next_move(board, bot, planner=planner, params=params)
+
+# Jadwal permainan: setiap ronde varian diacak lalu dibagi ke grup sebesar jumlah kursi.
+# Grup terakhir diisi varian acak sebagai pengisi agar semua permainan punya jumlah bot sama.
+def schedule(variants: List[Variant], rounds: int, seats: int, seed: int = 0) -> List[Match]:
+    rng = random.Random(seed)
+    matches = []
+    for _ in range(rounds):
+        order = list(variants)
+        rng.shuffle(order)
+        for start in range(0, len(order), seats):
+            group = order[start:start + seats]
+            counted = [True] * len(group)
+            while len(group) < seats:
+                group.append(rng.choice(variants))
+                counted.append(False)
+            matches.append(Match(seed * 1_000_000 + len(matches), tuple(group), tuple(counted)))
+    return matches
+
+# Gabungkan skor semua permainan per varian
+def aggregate(results: List[Tuple[Match, List[int]]]) -> Dict[str, VariantResult]:
+    summary: Dict[str, VariantResult] = {}
+    for match, scores in results:
+        mean = statistics.fmean(scores)
+        top = max(scores)
+        winners = scores.count(top)
+        for variant, counted, score in zip(match.variants, match.counted, scores):
+            if not counted:
+                continue
+            result = summary.setdefault(variant.name, VariantResult(variant))
+            result.scores.append(score)
+            result.relative.append(score - mean)
+            if score == top:
+                result.wins += 1 / winners
+    return summary
+
+# Jalankan semua permainan di process pool (workers=1: di proses ini, tanpa pool)
+def run_tournament(matches: List[Match], config: SimConfig, workers: int,
+                   plan_nodes: int = 5000) -> List[Tuple[Match, List[int]]]:
+    job = partial(play_match, config=config, plan_nodes=plan_nodes)
+    if workers <= 1:
+        return [job(match) for match in matches]
+    chunksize = max(1, len(matches) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(job, matches, chunksize=chunksize))
+
+# Parsing grid "distance_offset=0.5,1,2;contest_margin=-1,0,1;planner=0,1" menjadi daftar varian
+def parse_grid(text: str) -> List[Variant]:
+    types = {f.name: f.type for f in fields(StrategyParams)}
+    axes = []
+    for part in filter(None, (p.strip() for p in text.split(";"))):
+        key, values = part.split("=", 1)
+        key = key.strip()
+        if key == "planner":
+            axes.append([(key, v.strip() not in ("0", "false", "False")) for v in values.split(",")])
+            continue
+        if key not in types:
+            raise ValueError("Parameter tidak dikenal: {}".format(key))
+        convert = int if types[key] in (int, "int") else float
+        axes.append([(key, convert(v)) for v in values.split(",")])
+
+    variants = []
+    for combo in itertools.product(*axes):
+        values = dict(combo)
+        planner = values.pop("planner", False)
+        variant = Variant("v{}".format(len(variants)), replace(DEFAULT_PARAMS, **values), planner)
+        variants.append(variant)
+    return variants
+
+DEFAULT_GRID = "distance_offset=0.5,1,2;distance_power=1,1.5;contest_margin=-1,0,2;return_ratio=0.8,1"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Turnamen tuning parameter strategi")
+    parser.add_argument("--grid", default=DEFAULT_GRID)               # Nilai parameter yang dicoba
+    parser.add_argument("--rounds", type=int, default=10)             # Permainan per varian
+    parser.add_argument("--bots", type=int, default=4)                # Bot per permainan
+    parser.add_argument("--seconds", type=int, default=60)
+    parser.add_argument("--width", type=int, default=15)
+    parser.add_argument("--height", type=int, default=15)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--plan-nodes", type=int, default=5000)       # Budget perencana per pencarian (node)
+    parser.add_argument("--top", type=int, default=10)                # Jumlah varian yang ditampilkan
+    parser.add_argument("--output", default="best_params.json")       # File konfigurasi terbaik
+    parser.add_argument("--scaling", action="store_true")             # Ukur throughput untuk 1..workers
+    args = parser.parse_args()
+
+    config = SimConfig(width=args.width, height=args.height, seconds=args.seconds)
+    variants = parse_grid(args.grid)
+    matches = schedule(variants, args.rounds, args.bots, args.seed)
+
+    if args.scaling:
+        # Throughput (permainan/detik) untuk jumlah worker yang berbeda pada jadwal yang sama
+        base_rate = None
+        counts = sorted({1, *[w for w in (2, 4, 8, 16, 32) if w < args.workers], args.workers})
+        for workers in counts:
+            start = time.perf_counter()
+            run_tournament(matches, config, workers, args.plan_nodes)
+            rate = len(matches) / (time.perf_counter() - start)
+            base_rate = base_rate or rate
+            print("[SCALING] workers={:<3} {:.1f} permainan/detik, speedup {:.2f}x".format(
+                workers, rate, rate / base_rate))
+        raise SystemExit(0)
+
+    print("[INFO] {} varian, {} permainan, {} worker".format(len(variants), len(matches), args.workers))
+    start = time.perf_counter()
+    results = run_tournament(matches, config, args.workers, args.plan_nodes)
+    elapsed = time.perf_counter() - start
+    print("[INFO] selesai dalam {:.1f} detik ({:.1f} permainan/detik)".format(elapsed, len(matches) / elapsed))
+
+    ranking = sorted(aggregate(results).values(), key=lambda r: r.summary()["mean_relative"], reverse=True)
+    print("{:<5} {:>6} {:>8} {:>7} {:>5} {:>5} {:>5} {:>8} {:>6}  {}".format(
+        "var", "game", "rerata", "stdev", "p10", "p50", "p90", "relatif", "menang", "parameter"))
+    for result in ranking[:args.top]:
+        s = result.summary()
+        print("{:<5} {games:>6} {mean:>8.1f} {stdev:>7.1f} {p10:>5} {p50:>5} {p90:>5} {mean_relative:>+8.2f} "
+              "{win_rate:>6.0%}  {}".format(result.variant.name, result.variant.describe(), **s))
+
+    best = ranking[0]
+    with open(args.output, "w") as f:
+        json.dump({
+            "params": asdict(best.variant.params),
+            "planner": best.variant.planner,
+            "summary": best.summary(),
+        }, f, indent=2)
+        f.write("\n")
+    print("[INFO] Konfigurasi terbaik ({}) disimpan ke {}".format(best.variant.describe(), args.output))
@@ -0,0 +1,216 @@
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+# Pelacak lintasan bot lawan antar tick. Setiap lawan punya riwayat posisi berukuran tetap
+# (ring buffer), sehingga update per tick hanya O(jumlah bot). Dari riwayat itu diperkirakan:
+#   - target lawan: diamond yang didekati lawan di setiap langkah dalam riwayatnya (atau base
+#     jika inventorinya penuh)
+#   - langkah berikutnya lawan: langkah terpendek menuju target tersebut
+#   - risiko tackle: sel yang mungkin dimasuki lawan yang bisa tackle pada tick berikutnya
+# Perkiraan ini dipakai get_next_move: diamond yang sedang dituju lawan yang tiba lebih dulu
+# (atau bersamaan) dilepas, lawan yang jelas menuju diamond lain tidak lagi dianggap bersaing,
+# dan saat membawa diamond bot memilih langkah yang tidak masuk ke sel berisiko.
+#
+# Modul ini tidak mengimpor main: board, bot, dan distance field dipakai secara duck-typed.
+
+UNREACHABLE = -1
+
+# Batas kandidat diamond per lawan yang dicek dengan field (lihat OpponentTracker._target)
+MAX_CHECKS = 4
+
+# Riwayat posisi satu lawan (hanya langkah yang benar-benar berpindah sel)
+class _Track:
+    __slots__ = ("positions", "head", "count", "predicted")
+
+    def __init__(self, size: int):
+        self.positions: List[object] = [None] * size
+        self.head = 0  # Slot posisi terbaru
+        self.count = 0
+        self.predicted: Optional[Set[int]] = None  # Sel yang diperkirakan dimasuki pada update berikutnya
+
+    def push(self, position):
+        self.head = (self.head + 1) % len(self.positions)
+        self.positions[self.head] = position
+        self.count = min(self.count + 1, len(self.positions))
+
+    def restart(self, position):
+        self.count = 0
+        self.push(position)
+
+    # Posisi 'back' langkah sebelum posisi terbaru
+    def back(self, back: int):
+        return self.positions[(self.head - back) % len(self.positions)]
+
+# Perkiraan posisi dan niat lawan untuk satu board
+@dataclass
+class OpponentView:
+    claims: Dict[int, int] = field(default_factory=dict)  # id diamond -> jarak lawan terdekat yang menujunya
+    elsewhere: Set[str] = field(default_factory=set)  # Lawan yang jelas menuju target lain
+    risky: Set[int] = field(default_factory=set)  # Sel yang mungkin dimasuki lawan yang bisa tackle
+
+# Statistik pelacak: ketepatan perkiraan langkah berikutnya
+@dataclass
+class TrackerStats:
+    updates: int = 0
+    predictions: int = 0
+    correct: int = 0  # Lawan benar-benar masuk ke salah satu sel yang diperkirakan
+
+    @property
+    def accuracy(self) -> float:
+        return self.correct / self.predictions if self.predictions else 0.0
+
+    def summary(self) -> dict:
+        return {
+            "updates": self.updates,
+            "predictions": self.predictions,
+            "accuracy": round(self.accuracy, 3),
+        }
+
+# Pelacak semua lawan untuk satu bot
+class OpponentTracker:
+    def __init__(self, history: int = 8):
+        self.history = history
+        self.stats = TrackerStats()
+        self._tracks: Dict[str, _Track] = {}
+        self._board = None  # Board terakhir yang sudah dimasukkan ke riwayat
+        self._view: Optional[OpponentView] = None
+
+    # Masukkan posisi lawan dari board baru ke riwayat: O(jumlah bot)
+    def update(self, board, my_name: str, fields):
+        if board is self._board:
+            return
+        self._board = board
+        self._view = None
+        self.stats.updates += 1
+        present = set()
+        for bot in board.index.bots:
+            name = bot.properties.name if bot.properties else None
+            if not bot.position or name is None or name == my_name:
+                continue
+            present.add(name)
+            track = self._tracks.get(name)
+            if track is None:
+                track = self._tracks[name] = _Track(self.history)
+                track.push(bot.position)
+                continue
+            cell = fields.cell(bot.position)
+            if track.predicted is not None:
+                self.stats.predictions += 1
+                self.stats.correct += cell in track.predicted
+                track.predicted = None
+            last = track.back(0)
+            if bot.position == last:
+                continue
+            if cell in fields.moves[fields.cell(last)].values():
+                track.push(bot.position)
+            else:
+                # Tackle atau board baru: riwayat lama tidak lagi menggambarkan arah lawan
+                track.restart(bot.position)
+        for name in [name for name in self._tracks if name not in present]:
+            del self._tracks[name]
+
+    # Perkiraan target, langkah berikutnya, dan sel berisiko semua lawan untuk board terakhir.
+    # Dihitung sekali per board: diamond diurutkan menurut kolom (O(D log D)), lalu untuk setiap
+    # lawan hanya kolom di sekitarnya yang discan sampai MAX_CHECKS kandidat terdekat ditemukan,
+    # ditambah paling banyak MAX_CHECKS lookup field. Field yang dipakai adalah field per
+    # diamond/base (field_to) yang juga dipakai find_best_diamond, jadi tidak ada BFS baru dari
+    # posisi lawan.
+    def estimate(self, board, fields) -> OpponentView:
+        if self._view is not None:
+            return self._view
+        view = self._view = OpponentView()
+        columns = None
+        for bot in board.index.bots:
+            props = bot.properties
+            track = self._tracks.get(props.name) if props and bot.position else None
+            if track is None or track.back(0) != bot.position:
+                continue
+            if columns is None:
+                columns = _columns(board)
+            target = self._target(fields, bot, track, view, columns)
+            landings = fields.moves[fields.cell(bot.position)].values()
+            if target is not None:
+                to_target = fields.field_to(target)
+                reachable = [v for v in landings if to_target[v] != UNREACHABLE]
+                best = min((to_target[v] for v in reachable), default=UNREACHABLE)
+                predicted = {v for v in reachable if to_target[v] == best}
+            else:
+                predicted = set(landings)
+            track.predicted = predicted
+            if props.can_tackle is not False:
+                view.risky |= predicted
+        return view
+
+    # Posisi target lawan (base jika inventori penuh, diamond yang didekati di setiap langkah
+    # riwayatnya), atau None jika belum bisa diperkirakan
+    def _target(self, fields, bot, track: _Track, view: OpponentView, columns):
+        props = bot.properties
+        inventory = props.diamonds or 0
+        capacity = props.inventory_size or 5
+        if inventory >= capacity:
+            view.elsewhere.add(props.name)
+            return props.base
+        steps = track.count - 1
+        if steps < 1:
+            return None
+        old, now = track.back(steps), bot.position
+
+        # Jarak Manhattan ke diamond berkurang tepat satu di setiap langkah hanya jika lintasan
+        # lawan monoton (|dx| + |dy| == langkah) dan diamond ada di kuadran depan arah geraknya
+        dx, dy = now.x - old.x, now.y - old.y
+        if abs(dx) + abs(dy) != steps:
+            return None
+        xs, diamonds = columns
+        right = bisect_left(xs, now.x) if dx >= 0 else len(xs)
+        left = (right if dx == 0 else bisect_right(xs, now.x)) - 1 if dx <= 0 else -1
+        # Scan kolom dari yang terdekat ke now.x, berhenti begitu jarak kolom saja sudah tidak
+        # lebih dekat dari kandidat terjauh yang disimpan
+        candidates = []
+        while right < len(xs) or left >= 0:
+            if left < 0 or (right < len(xs) and xs[right] - now.x <= now.x - xs[left]):
+                k, right = right, right + 1
+            else:
+                k, left = left, left - 1
+            gap = abs(xs[k] - now.x)
+            if len(candidates) == MAX_CHECKS and gap >= candidates[-1][0]:
+                break
+            diamond = diamonds[k]
+            pos = diamond.position
+            if inventory + diamond.properties.points > capacity:
+                continue
+            if (dy > 0 and pos.y < now.y) or (dy < 0 and pos.y > now.y):
+                continue
+            insort(candidates, (gap + abs(pos.y - now.y), k, diamond))
+            del candidates[MAX_CHECKS:]
+
+        # Pastikan dengan jarak jalur dari field per diamond: field_to(d)[lama] - field_to(d)[kini]
+        # harus sama dengan jumlah langkah. Jarak Manhattan adalah batas bawah jarak jalur, jadi
+        # pencarian berhenti begitu kandidat berikutnya tidak mungkin lebih dekat.
+        old_cell, now_cell = fields.cell(old), fields.cell(now)
+        best = None
+        best_dist = UNREACHABLE
+        for near, _, diamond in candidates:
+            if best is not None and near >= best_dist:
+                break
+            to_diamond = fields.field_to(diamond.position)
+            dist = to_diamond[now_cell]
+            before = to_diamond[old_cell]
+            if dist == UNREACHABLE or before == UNREACHABLE or before - dist != steps:
+                continue
+            if best is None or dist < best_dist:
+                best, best_dist = diamond, dist
+        if best is None:
+            return None
+        view.elsewhere.add(props.name)
+        if best_dist < view.claims.get(best.id, best_dist + 1):
+            view.claims[best.id] = best_dist
+        return best.position
+
+# Diamond board (yang punya posisi dan poin) diurutkan menurut x, beserta daftar x-nya
+def _columns(board):
+    diamonds = sorted(
+        (d for d in board.index.diamonds if d.position and d.properties and d.properties.points),
+        key=lambda d: d.position.x,
+    )
+    return [d.position.x for d in diamonds], diamonds